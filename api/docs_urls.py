@@ -0,0 +1,13 @@
+"""
+Schema and documentation URLs, mounted only when ENABLE_API_DOCS is set
+"""
+from django.urls import path
+from rest_framework.documentation import include_docs_urls
+from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
+
+urlpatterns = [
+    path('schema/', SpectacularAPIView.as_view(), name='schema'),
+    path('schema/swagger/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-schema'),
+    path('schema/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc-schema'),
+    path('docs/', include_docs_urls(title='Physiological G-Code API')),
+]
@@ -2,7 +2,9 @@
 Django management command to load all 64 I Ching hexagrams
 """
 from django.core.management.base import BaseCommand
+from django.db import connection, transaction
 from api.models import Hexagram
+from api.models.hexagram import reset_hexagram_by_number
 
 
 class Command(BaseCommand):
@@ -33,43 +35,77 @@ class Command(BaseCommand):
         # ... (would include all 64 hexagrams)
     ]
 
-    def handle(self, *args, **options):
-        created = 0
-        updated = 0
+    UPDATE_FIELDS = [
+        'binary', 'binary_int', 'name_chinese', 'name_pinyin', 'name_english',
+        'line1', 'line2', 'line3', 'line4', 'line5', 'line6',
+        'lower_trigram', 'upper_trigram',
+        'lower_trigram_name', 'upper_trigram_name',
+        'keywords', 'description',
+    ]
 
-        for hex_data in self.HEXAGRAMS:
-            (
+    def handle(self, *args, **options):
+        hexagrams = [
+            Hexagram(
+                number=number,
+                binary=binary,
+                binary_int=int(binary, 2),
+                name_chinese=chinese,
+                name_pinyin=pinyin,
+                name_english=english,
+                line1=binary[0],
+                line2=binary[1],
+                line3=binary[2],
+                line4=binary[3],
+                line5=binary[4],
+                line6=binary[5],
+                lower_trigram=lower_tri,
+                upper_trigram=upper_tri,
+                lower_trigram_name=lower_name,
+                upper_trigram_name=upper_name,
+                keywords=keywords,
+                description=description,
+            )
+            for (
                 number, binary, chinese, pinyin, english,
                 lower_tri, upper_tri, lower_name, upper_name,
                 keywords, description
-            ) = hex_data
+            ) in self.HEXAGRAMS
+        ]
 
-            hexagram, created_flag = Hexagram.objects.update_or_create(
-                number=number,
-                defaults={
-                    'binary': binary,
-                    'name_chinese': chinese,
-                    'name_pinyin': pinyin,
-                    'name_english': english,
-                    'line1': binary[0],
-                    'line2': binary[1],
-                    'line3': binary[2],
-                    'line4': binary[3],
-                    'line5': binary[4],
-                    'line6': binary[5],
-                    'lower_trigram': lower_tri,
-                    'upper_trigram': upper_tri,
-                    'lower_trigram_name': lower_name,
-                    'upper_trigram_name': upper_name,
-                    'keywords': keywords,
-                    'description': description,
-                }
+        with transaction.atomic():
+            existing = Hexagram.objects.in_bulk(
+                [hexagram.number for hexagram in hexagrams], field_name='number'
             )
 
-            if created_flag:
-                created += 1
+            if connection.features.supports_update_conflicts_with_target:
+                # Single INSERT ... ON CONFLICT DO UPDATE for all hexagrams
+                Hexagram.objects.bulk_create(
+                    hexagrams,
+                    update_conflicts=True,
+                    unique_fields=['number'],
+                    update_fields=self.UPDATE_FIELDS + ['updated_at'],
+                )
             else:
-                updated += 1
+                Hexagram.objects.bulk_create(
+                    [h for h in hexagrams if h.number not in existing],
+                    ignore_conflicts=True,
+                )
+                changed = []
+                for hexagram in hexagrams:
+                    current = existing.get(hexagram.number)
+                    if current is not None:
+                        for field in self.UPDATE_FIELDS:
+                            setattr(current, field, getattr(hexagram, field))
+                        changed.append(current)
+                Hexagram.objects.bulk_update(changed, fields=self.UPDATE_FIELDS)
+
+            Hexagram.link_related_hexagrams()
+
+            # Bulk writes send no model signals, so drop the cached lookup here
+            transaction.on_commit(reset_hexagram_by_number)
+
+        updated = len(existing)
+        created = len(hexagrams) - updated
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -0,0 +1,111 @@
+"""
+Django management command to purge old API key usage logs
+"""
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, connection, transaction
+from django.utils import timezone
+from api.models import APIKeyUsageLog
+from api.utils.partitioning import (
+    add_months,
+    create_monthly_partition,
+    is_partitioned,
+    month_start,
+    monthly_partitions,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Delete API key usage logs older than the retention period. On '
+        'PostgreSQL, also create upcoming monthly partitions and drop expired ones.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=90,
+            help='Retention period in days (default: 90)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Rows deleted per statement (default: 5000)',
+        )
+        parser.add_argument(
+            '--months-ahead',
+            type=int,
+            default=2,
+            help='Monthly partitions to create ahead of the current one (default: 2)',
+        )
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        cutoff = now - timedelta(days=options['days'])
+        created = dropped = 0
+
+        if connection.vendor == 'postgresql':
+            with transaction.atomic(), connection.cursor() as cursor:
+                if is_partitioned(cursor):
+                    created, dropped = self.maintain_partitions(
+                        cursor, now, cutoff, options['months_ahead']
+                    )
+
+        deleted = self.delete_expired(cutoff, options['batch_size'])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Successfully pruned API key usage logs: {dropped} partitions dropped, '
+                f'{deleted} rows deleted, {created} partitions created '
+                f'(older than {options["days"]} days)'
+            )
+        )
+
+    def maintain_partitions(self, cursor, now, cutoff, months_ahead):
+        """Create upcoming partitions and drop those entirely before the cutoff."""
+        existing = monthly_partitions(cursor)
+        current = month_start(now)
+        created = 0
+        for offset in range(months_ahead + 1):
+            month = add_months(current, offset)
+            if month in existing:
+                continue
+            try:
+                with transaction.atomic():
+                    create_monthly_partition(cursor, month)
+            except DatabaseError as e:
+                # The DEFAULT partition already holds rows for this month
+                self.stderr.write(f'Could not create partition for {month:%Y-%m}: {e}')
+            else:
+                created += 1
+
+        dropped = 0
+        for month, name in sorted(existing.items()):
+            # Dropping a partition is O(1), unlike deleting its rows
+            if add_months(month, 1) <= cutoff.date():
+                cursor.execute(f'DROP TABLE {name}')
+                dropped += 1
+        return created, dropped
+
+    def delete_expired(self, cutoff, batch_size):
+        """
+        Delete the remaining expired rows in bounded batches.
+
+        Covers the partially expired month, the DEFAULT partition and
+        databases without partitioning.
+        """
+        deleted = 0
+        while True:
+            batch = list(
+                APIKeyUsageLog.objects.filter(timestamp__lt=cutoff)
+                .order_by('timestamp')
+                .values_list('pk', flat=True)[:batch_size]
+            )
+            if not batch:
+                break
+            count, _ = APIKeyUsageLog.objects.filter(pk__in=batch).delete()
+            deleted += count
+        return deleted
@@ -0,0 +1,47 @@
+"""
+Middleware for the API app
+"""
+from api.models import APIKey
+from api.utils import usage_logger
+
+
+class APIKeyUsageMiddleware:
+    """
+    Record usage of API keys presented in the X-API-Key header.
+
+    The key's counters go through APIKey.record_usage() and the per-request
+    log entry through usage_logger, so neither writes to the database
+    inside the request.
+    """
+
+    header = 'HTTP_X_API_KEY'
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        plaintext = request.META.get(self.header)
+        if plaintext:
+            self.record(request, response, plaintext)
+        return response
+
+    def record(self, request, response, plaintext):
+        """Record one request made with an API key."""
+        try:
+            api_key = APIKey.objects.get_by_key(plaintext)
+        except APIKey.DoesNotExist:
+            return
+        if not api_key.is_valid():
+            return
+
+        ip_address = request.META.get('REMOTE_ADDR')
+        api_key.record_usage(ip_address)
+        usage_logger.log_usage(
+            api_key_id=api_key.pk,
+            endpoint=request.path[:255],
+            method=request.method,
+            status_code=response.status_code,
+            ip_address=ip_address,
+            user_agent=request.META.get('HTTP_USER_AGENT', ''),
+        )
@@ -0,0 +1,738 @@
+# Generated by Django 5.0.1 on 2026-10-15 23:45
+
+import api.models.api_key
+import api.models.webhook
+import django.core.validators
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnalysisPattern',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('pattern_type', models.CharField(choices=[('position', 'Position-Specific'), ('sliding_window', 'Sliding Window'), ('motif', 'Motif'), ('conservation', 'Conservation'), ('run', 'Hexagram Run'), ('correlation', 'Correlation'), ('transition', 'Transition Pattern'), ('custom', 'Custom Pattern')], help_text='Type of pattern detected', max_length=50)),
+                ('sequence', models.TextField(help_text='Original genetic sequence in which pattern was found')),
+                ('hexagram_sequence', models.JSONField(help_text='Hexagram sequence as JSON array')),
+                ('pattern_data', models.JSONField(help_text='Detailed pattern data (structure varies by pattern_type)')),
+                ('frequency', models.IntegerField(default=1, help_text='Number of times this pattern occurs in the sequence', validators=[django.core.validators.MinValueValidator(1)])),
+                ('significance_score', models.FloatField(default=0.0, help_text='Statistical significance (0-1, higher is more significant)', validators=[django.core.validators.MinValueValidator(0.0), django.core.validators.MaxValueValidator(1.0)])),
+                ('pattern_name', models.CharField(blank=True, help_text='Optional name for this pattern', max_length=255)),
+                ('pattern_description', models.TextField(blank=True, help_text='Description of what this pattern represents')),
+                ('window_size', models.IntegerField(blank=True, help_text='Window size used for sliding window analysis (if applicable)', null=True, validators=[django.core.validators.MinValueValidator(1)])),
+                ('min_occurrences', models.IntegerField(blank=True, help_text='Minimum occurrences threshold (if applicable)', null=True, validators=[django.core.validators.MinValueValidator(1)])),
+                ('start_position', models.IntegerField(blank=True, help_text='Starting position of pattern in sequence (1-indexed)', null=True, validators=[django.core.validators.MinValueValidator(1)])),
+                ('end_position', models.IntegerField(blank=True, help_text='Ending position of pattern in sequence (1-indexed)', null=True, validators=[django.core.validators.MinValueValidator(1)])),
+                ('related_sequences', models.JSONField(blank=True, help_text='Related sequences used for conservation analysis (if applicable)', null=True)),
+                ('mapping_scheme', models.CharField(blank=True, help_text='Binary mapping scheme used (e.g., "scheme_1")', max_length=50)),
+                ('is_public', models.BooleanField(default=False, help_text='Whether this pattern is visible to other users')),
+                ('is_verified', models.BooleanField(default=False, help_text='Whether this pattern has been verified')),
+                ('tags', models.JSONField(blank=True, help_text='Tags for categorizing this pattern', null=True)),
+                ('notes', models.TextField(blank=True, help_text='Additional notes about this pattern')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(help_text='User who discovered this pattern', on_delete=django.db.models.deletion.CASCADE, related_name='analysis_patterns', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Analysis Pattern',
+                'verbose_name_plural': 'Analysis Patterns',
+                'ordering': ['-significance_score', '-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='APIKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Name for this API key (e.g., "Mobile App", "Integration X")', max_length=100)),
+                ('key', models.CharField(default=api.models.api_key.generate_api_key, help_text='The API key', max_length=255, unique=True)),
+                ('prefix', models.CharField(default=api.models.api_key.generate_api_key_prefix, help_text='Key prefix for identification', max_length=20, unique=True)),
+                ('scopes', models.JSONField(default=list, help_text='Permissions granted to this key')),
+                ('rate_limit', models.IntegerField(default=1000, help_text='Requests per hour')),
+                ('rate_limit_period', models.CharField(choices=[('minute', 'Per minute'), ('hour', 'Per hour'), ('day', 'Per day')], default='hour', help_text='Rate limit period', max_length=20)),
+                ('is_active', models.BooleanField(default=True, help_text='Whether this key is active')),
+                ('expires_at', models.DateTimeField(blank=True, help_text='When this key expires (null = never)', null=True)),
+                ('total_requests', models.IntegerField(default=0, help_text='Total requests made with this key')),
+                ('last_used_at', models.DateTimeField(blank=True, help_text='Last time this key was used', null=True)),
+                ('last_used_ip', models.GenericIPAddressField(blank=True, help_text='Last IP address that used this key', null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(help_text='User who owns this API key', on_delete=django.db.models.deletion.CASCADE, related_name='api_keys', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'API Key',
+                'verbose_name_plural': 'API Keys',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='APIKeyUsageLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('endpoint', models.CharField(help_text='API endpoint that was accessed', max_length=255)),
+                ('method', models.CharField(help_text='HTTP method (GET, POST, etc.)', max_length=10)),
+                ('status_code', models.IntegerField(help_text='HTTP response status code')),
+                ('ip_address', models.GenericIPAddressField(blank=True, help_text='IP address of the request', null=True)),
+                ('user_agent', models.TextField(blank=True, help_text='User agent string')),
+                ('timestamp', models.DateTimeField(auto_now_add=True, help_text='When the request was made')),
+                ('api_key', models.ForeignKey(help_text='The API key that was used', on_delete=django.db.models.deletion.CASCADE, related_name='usage_logs', to='api.apikey')),
+            ],
+            options={
+                'verbose_name': 'API Key Usage Log',
+                'verbose_name_plural': 'API Key Usage Logs',
+                'ordering': ['-timestamp'],
+            },
+        ),
+        migrations.CreateModel(
+            name='CodonHexagramMapping',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Name of this mapping scheme', max_length=200)),
+                ('description', models.TextField(help_text='Description of how this mapping was derived')),
+                ('mapping_type', models.CharField(choices=[('BINARY', 'Binary'), ('AI_INDUCED', 'AI Induced'), ('TRADITIONAL', 'Traditional'), ('CUSTOM', 'Custom'), ('EXPERIMENTAL', 'Experimental')], default='BINARY', help_text='Type of mapping scheme', max_length=20)),
+                ('is_active', models.BooleanField(default=False, help_text='Whether this mapping is currently active')),
+                ('version', models.CharField(blank=True, help_text='Version of this mapping', max_length=20)),
+                ('mapping_rules', models.JSONField(default=list, help_text='Array of codon-to-hexagram mappings')),
+                ('binary_scheme', models.JSONField(blank=True, help_text='Binary mapping scheme parameters', null=True)),
+                ('ai_model', models.CharField(blank=True, help_text='AI model used for induction', max_length=100)),
+                ('ai_confidence_scores', models.JSONField(blank=True, help_text='Confidence scores for each mapping', null=True)),
+                ('total_mappings', models.IntegerField(default=0, help_text='Total number of codon-hexagram mappings')),
+                ('coverage', models.FloatField(default=0.0, help_text='Percentage of possible codons mapped')),
+                ('validation_score', models.FloatField(blank=True, help_text='Validation score (if applicable)', null=True)),
+                ('is_public', models.BooleanField(default=False, help_text='Whether this mapping is public')),
+                ('vote_score', models.IntegerField(default=0, help_text='Net vote score (upvotes - downvotes)')),
+                ('fork_count', models.IntegerField(default=0, help_text='Number of times this mapping has been forked')),
+                ('usage_count', models.IntegerField(default=0, help_text='Number of times this mapping has been used')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('created_by', models.ForeignKey(blank=True, help_text='User who created this mapping', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='created_mappings', to=settings.AUTH_USER_MODEL)),
+                ('parent_mapping', models.ForeignKey(blank=True, help_text='Parent mapping this was derived from', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='variants', to='api.codonhexagrammapping')),
+            ],
+            options={
+                'verbose_name': 'Codon-Hexagram Mapping',
+                'verbose_name_plural': 'Codon-Hexagram Mappings',
+                'ordering': ['-is_active', '-vote_score', '-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Comment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveIntegerField(help_text='ID of object being commented on')),
+                ('content', models.TextField(help_text='Comment content (supports Markdown)')),
+                ('upvotes', models.IntegerField(default=0, help_text='Number of upvotes')),
+                ('downvotes', models.IntegerField(default=0, help_text='Number of downvotes')),
+                ('vote_score', models.IntegerField(default=0, help_text='Net vote score (upvotes - downvotes)')),
+                ('is_flagged', models.BooleanField(default=False, help_text='Comment has been flagged for review')),
+                ('is_removed', models.BooleanField(default=False, help_text='Comment has been removed by moderator')),
+                ('removal_reason', models.TextField(blank=True, help_text='Reason for removal')),
+                ('mentioned_users', models.JSONField(blank=True, help_text='List of mentioned user IDs', null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('edited_at', models.DateTimeField(blank=True, help_text='Last time comment was edited', null=True)),
+                ('author', models.ForeignKey(help_text='User who wrote the comment', on_delete=django.db.models.deletion.CASCADE, related_name='comments', to=settings.AUTH_USER_MODEL)),
+                ('content_type', models.ForeignKey(help_text='Type of object being commented on', on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+                ('parent', models.ForeignKey(blank=True, help_text='Parent comment (for threaded replies)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='replies', to='api.comment')),
+            ],
+            options={
+                'verbose_name': 'Comment',
+                'verbose_name_plural': 'Comments',
+                'ordering': ['created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ComparativeAnalysis',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('analysis_type', models.CharField(choices=[('sequence_comparison', 'Sequence Comparison'), ('mapping_comparison', 'Mapping Scheme Comparison'), ('statistical_test', 'Statistical Test'), ('multiple_sequence', 'Multiple Sequence Alignment'), ('conserved_regions', 'Conserved Regions'), ('custom', 'Custom Comparison')], help_text='Type of comparative analysis', max_length=50)),
+                ('sequence1', models.TextField(help_text='First genetic sequence')),
+                ('sequence2', models.TextField(blank=True, help_text='Second genetic sequence (if applicable)')),
+                ('additional_sequences', models.JSONField(blank=True, help_text='Additional sequences for multi-sequence analysis', null=True)),
+                ('sequence1_name', models.CharField(blank=True, help_text='Name for sequence 1', max_length=255)),
+                ('sequence2_name', models.CharField(blank=True, help_text='Name for sequence 2', max_length=255)),
+                ('mapping_schemes', models.JSONField(help_text='Mapping schemes used in comparison')),
+                ('results', models.JSONField(help_text='Detailed comparison results')),
+                ('similarity_score', models.FloatField(blank=True, help_text='Overall similarity score (0-1)', null=True, validators=[django.core.validators.MinValueValidator(0.0), django.core.validators.MaxValueValidator(1.0)])),
+                ('match_percentage', models.FloatField(blank=True, help_text='Percentage of matching hexagrams', null=True, validators=[django.core.validators.MinValueValidator(0.0), django.core.validators.MaxValueValidator(100.0)])),
+                ('test_type', models.CharField(blank=True, help_text='Type of statistical test performed', max_length=50)),
+                ('p_value', models.FloatField(blank=True, help_text='P-value from statistical test', null=True)),
+                ('is_significant', models.BooleanField(blank=True, help_text='Whether result is statistically significant', null=True)),
+                ('analysis_name', models.CharField(blank=True, help_text='Optional name for this analysis', max_length=255)),
+                ('analysis_description', models.TextField(blank=True, help_text='Description of what was compared')),
+                ('window_size', models.IntegerField(blank=True, help_text='Window size used (if applicable)', null=True, validators=[django.core.validators.MinValueValidator(1)])),
+                ('min_conservation', models.FloatField(blank=True, help_text='Minimum conservation threshold (if applicable)', null=True, validators=[django.core.validators.MinValueValidator(0.0), django.core.validators.MaxValueValidator(1.0)])),
+                ('is_public', models.BooleanField(default=False, help_text='Whether this analysis is visible to other users')),
+                ('tags', models.JSONField(blank=True, help_text='Tags for categorizing this analysis', null=True)),
+                ('notes', models.TextField(blank=True, help_text='Additional notes about this analysis')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(help_text='User who created this analysis', on_delete=django.db.models.deletion.CASCADE, related_name='comparative_analyses', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Comparative Analysis',
+                'verbose_name_plural': 'Comparative Analyses',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ComparisonCache',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cache_key', models.CharField(help_text='Unique key for this cached comparison', max_length=255, unique=True)),
+                ('input_data', models.JSONField(help_text='Input parameters for comparison')),
+                ('results', models.JSONField(help_text='Cached comparison results')),
+                ('hit_count', models.IntegerField(default=0, help_text='Number of times this cache was accessed')),
+                ('last_accessed', models.DateTimeField(auto_now=True, help_text='Last time this cache was accessed')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(blank=True, help_text='User who created this cache (null for global cache)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='comparison_caches', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Comparison Cache',
+                'verbose_name_plural': 'Comparison Caches',
+                'ordering': ['-hit_count', '-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Hexagram',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('number', models.IntegerField(help_text='Hexagram number (1-64) in the King Wen sequence', unique=True)),
+                ('binary', models.CharField(help_text='Binary representation (bottom line to top line)', max_length=6, unique=True)),
+                ('name_chinese', models.CharField(help_text='Hexagram name in Chinese', max_length=10)),
+                ('name_pinyin', models.CharField(help_text='Hexagram name in pinyin', max_length=50)),
+                ('name_english', models.CharField(help_text='English translation of hexagram name', max_length=100)),
+                ('line1', models.CharField(help_text='Bottom line (0=yin, 1=yang)', max_length=1)),
+                ('line2', models.CharField(help_text='Second line (0=yin, 1=yang)', max_length=1)),
+                ('line3', models.CharField(help_text='Third line (0=yin, 1=yang)', max_length=1)),
+                ('line4', models.CharField(help_text='Fourth line (0=yin, 1=yang)', max_length=1)),
+                ('line5', models.CharField(help_text='Fifth line (0=yin, 1=yang)', max_length=1)),
+                ('line6', models.CharField(help_text='Top line (0=yin, 1=yang)', max_length=1)),
+                ('lower_trigram', models.CharField(help_text='Lower trigram (lines 1-3)', max_length=3)),
+                ('upper_trigram', models.CharField(help_text='Upper trigram (lines 4-6)', max_length=3)),
+                ('lower_trigram_name', models.CharField(help_text='Name of lower trigram', max_length=50)),
+                ('upper_trigram_name', models.CharField(help_text='Name of upper trigram', max_length=50)),
+                ('keywords', models.JSONField(default=list, help_text='Keywords and concepts associated with this hexagram')),
+                ('description', models.TextField(help_text='Traditional interpretation and meaning')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('nuclear_hexagram', models.ForeignKey(blank=True, help_text='Nuclear hexagram (lines 2-5)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='nuclear_of', to='api.hexagram')),
+                ('opposite_hexagram', models.ForeignKey(blank=True, help_text='Opposite hexagram (all lines inverted)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='opposite_of', to='api.hexagram')),
+            ],
+            options={
+                'verbose_name': 'Hexagram',
+                'verbose_name_plural': 'Hexagrams',
+                'ordering': ['number'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Discussion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(help_text='Discussion title', max_length=255)),
+                ('slug', models.SlugField(help_text='URL-friendly version of title', max_length=255, unique=True)),
+                ('content', models.TextField(help_text='Discussion content (supports Markdown)')),
+                ('discussion_type', models.CharField(choices=[('general', 'General Discussion'), ('research', 'Research'), ('question', 'Question'), ('announcement', 'Announcement')], default='general', help_text='Type of discussion', max_length=20)),
+                ('tags', models.JSONField(blank=True, help_text='Discussion tags', null=True)),
+                ('is_pinned', models.BooleanField(default=False, help_text='Discussion is pinned to top')),
+                ('is_locked', models.BooleanField(default=False, help_text='Discussion is locked (no new comments)')),
+                ('is_solved', models.BooleanField(default=False, help_text='Question is solved (for question-type discussions)')),
+                ('view_count', models.IntegerField(default=0, help_text='Number of views')),
+                ('comment_count', models.IntegerField(default=0, help_text='Number of comments')),
+                ('participant_count', models.IntegerField(default=0, help_text='Number of unique participants')),
+                ('last_comment_at', models.DateTimeField(blank=True, help_text='Timestamp of last comment', null=True)),
+                ('vote_score', models.IntegerField(default=0, help_text='Net vote score (upvotes - downvotes)')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('author', models.ForeignKey(help_text='User who created the discussion', on_delete=django.db.models.deletion.CASCADE, related_name='discussions', to=settings.AUTH_USER_MODEL)),
+                ('last_comment_by', models.ForeignKey(blank=True, help_text='User who made the last comment', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='last_comments_in_discussions', to=settings.AUTH_USER_MODEL)),
+                ('linked_mapping', models.ForeignKey(blank=True, help_text='Mapping scheme linked to this discussion', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='discussions', to='api.codonhexagrammapping')),
+                ('linked_hexagram', models.ForeignKey(blank=True, help_text='Hexagram linked to this discussion', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='discussions', to='api.hexagram')),
+            ],
+            options={
+                'verbose_name': 'Discussion',
+                'verbose_name_plural': 'Discussions',
+                'ordering': ['-is_pinned', '-last_comment_at', '-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='CodonSequence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Name or identifier for this sequence', max_length=200)),
+                ('description', models.TextField(blank=True, help_text='Description of the sequence')),
+                ('sequence_type', models.CharField(choices=[('DNA', 'DNA'), ('RNA', 'RNA')], default='DNA', help_text='Type of sequence (DNA or RNA)', max_length=3)),
+                ('raw_sequence', models.TextField(help_text='Raw DNA/RNA sequence string')),
+                ('organism', models.CharField(blank=True, help_text='Source organism', max_length=200)),
+                ('gene_name', models.CharField(blank=True, help_text='Associated gene name', max_length=100)),
+                ('location', models.CharField(blank=True, help_text='Chromosomal location', max_length=200)),
+                ('amino_acid_sequence', models.TextField(blank=True, help_text='Translated amino acid sequence')),
+                ('hexagram_sequence', models.JSONField(blank=True, default=list, help_text='Sequence of hexagram numbers corresponding to codons')),
+                ('gc_content', models.FloatField(blank=True, help_text='GC content percentage', null=True)),
+                ('codon_count', models.IntegerField(default=0, help_text='Number of codons in sequence')),
+                ('hexagram_diversity', models.FloatField(blank=True, help_text='Shannon diversity index of hexagrams', null=True)),
+                ('is_reference', models.BooleanField(default=False, help_text='Whether this is a reference sequence')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(help_text='User who owns this sequence', on_delete=django.db.models.deletion.CASCADE, related_name='codon_sequences', to=settings.AUTH_USER_MODEL)),
+                ('dominant_hexagram', models.ForeignKey(blank=True, help_text='Most frequently appearing hexagram', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='dominant_in', to='api.hexagram')),
+            ],
+            options={
+                'verbose_name': 'Codon Sequence',
+                'verbose_name_plural': 'Codon Sequences',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Codon',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sequence', models.CharField(help_text='Three-nucleotide sequence', max_length=3, unique=True, validators=[django.core.validators.RegexValidator(message='Codon must be 3 nucleotides (ATGC for DNA, AUGC for RNA)', regex='^[ATGC]{3}$|^[AUGC]{3}$')])),
+                ('codon_type', models.CharField(choices=[('DNA', 'DNA'), ('RNA', 'RNA')], default='DNA', help_text='Type of codon (DNA or RNA)', max_length=3)),
+                ('amino_acid', models.CharField(help_text='Amino acid coded by this codon (or "Stop" for termination codons)', max_length=50)),
+                ('amino_acid_code', models.CharField(help_text='Single letter amino acid code', max_length=1)),
+                ('amino_acid_full_name', models.CharField(help_text='Full name of amino acid', max_length=100)),
+                ('is_start', models.BooleanField(default=False, help_text='Whether this is a start codon (ATG)')),
+                ('is_stop', models.BooleanField(default=False, help_text='Whether this is a stop codon')),
+                ('binary_representation', models.CharField(help_text='Binary representation for hexagram mapping (e.g., "000111")', max_length=6)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('mapped_hexagram', models.ForeignKey(blank=True, help_text='The hexagram this codon maps to', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='codons', to='api.hexagram')),
+            ],
+            options={
+                'verbose_name': 'Codon',
+                'verbose_name_plural': 'Codons',
+                'ordering': ['sequence'],
+            },
+        ),
+        migrations.CreateModel(
+            name='HexagramInterpretation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('context', models.CharField(blank=True, help_text='Context of interpretation (e.g., codon, gene name)', max_length=200)),
+                ('interpretation', models.TextField(help_text='AI-generated interpretation')),
+                ('biological_significance', models.TextField(blank=True, help_text='Biological significance in modern science')),
+                ('traditional_meaning', models.TextField(blank=True, help_text='Traditional I Ching meaning')),
+                ('synthesis', models.TextField(blank=True, help_text='Synthesis of biological and traditional meanings')),
+                ('concepts', models.JSONField(blank=True, default=list, help_text='Key concepts and themes')),
+                ('confidence', models.FloatField(blank=True, help_text='AI confidence score (0-1)', null=True)),
+                ('model_version', models.CharField(blank=True, help_text='AI model version used', max_length=50)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('codon', models.ForeignKey(blank=True, help_text='Associated codon', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='interpretations', to='api.codon')),
+                ('hexagram', models.ForeignKey(help_text='The hexagram being interpreted', on_delete=django.db.models.deletion.CASCADE, related_name='interpretations', to='api.hexagram')),
+                ('user', models.ForeignKey(blank=True, help_text='User who requested this interpretation', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='hexagram_interpretations', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Hexagram Interpretation',
+                'verbose_name_plural': 'Hexagram Interpretations',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Notification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('notification_type', models.CharField(choices=[('comment_reply', 'Comment Reply'), ('comment_mention', 'Comment Mention'), ('discussion_reply', 'Discussion Reply'), ('vote_received', 'Vote Received'), ('badge_earned', 'Badge Earned'), ('mapping_approved', 'Mapping Approved'), ('mapping_forked', 'Mapping Forked'), ('custom', 'Custom Notification')], help_text='Type of notification', max_length=30)),
+                ('object_id', models.PositiveIntegerField(blank=True, help_text='ID of related object', null=True)),
+                ('title', models.CharField(help_text='Notification title', max_length=255)),
+                ('message', models.TextField(help_text='Notification message')),
+                ('url', models.URLField(blank=True, help_text='URL to link to')),
+                ('is_read', models.BooleanField(default=False, help_text='Notification has been read')),
+                ('read_at', models.DateTimeField(blank=True, help_text='When notification was read', null=True)),
+                ('email_sent', models.BooleanField(default=False, help_text='Email notification has been sent')),
+                ('email_sent_at', models.DateTimeField(blank=True, help_text='When email was sent', null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('actor', models.ForeignKey(blank=True, help_text='User who triggered the notification', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='triggered_notifications', to=settings.AUTH_USER_MODEL)),
+                ('content_type', models.ForeignKey(blank=True, help_text='Type of related object', null=True, on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+                ('recipient', models.ForeignKey(help_text='User receiving the notification', on_delete=django.db.models.deletion.CASCADE, related_name='notifications', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Notification',
+                'verbose_name_plural': 'Notifications',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='PatternMatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sequence_id', models.IntegerField(help_text='ID of the sequence where pattern was found')),
+                ('sequence_name', models.CharField(blank=True, help_text='Name of the sequence where pattern was found', max_length=255)),
+                ('match_positions', models.JSONField(help_text='List of positions where pattern matches (1-indexed)')),
+                ('match_score', models.FloatField(default=1.0, help_text='Quality of this match (0-1)', validators=[django.core.validators.MinValueValidator(0.0), django.core.validators.MaxValueValidator(1.0)])),
+                ('is_reverse_complement', models.BooleanField(default=False, help_text='Whether this is a match on the reverse complement strand')),
+                ('discovered_at', models.DateTimeField(auto_now_add=True)),
+                ('pattern', models.ForeignKey(help_text='The pattern that was matched', on_delete=django.db.models.deletion.CASCADE, related_name='matches', to='api.analysispattern')),
+            ],
+            options={
+                'verbose_name': 'Pattern Match',
+                'verbose_name_plural': 'Pattern Matches',
+                'ordering': ['-match_score', '-discovered_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='UserProfile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bio', models.TextField(blank=True, help_text='User biography', max_length=1000)),
+                ('avatar', models.URLField(blank=True, help_text='URL to user avatar image')),
+                ('institution', models.CharField(blank=True, help_text='Academic institution or organization', max_length=255)),
+                ('website', models.URLField(blank=True, help_text='Personal or professional website')),
+                ('orcid_id', models.CharField(blank=True, help_text='ORCID identifier for researchers', max_length=100)),
+                ('research_interests', models.JSONField(blank=True, help_text='Research interest tags', null=True)),
+                ('reputation_score', models.IntegerField(default=0, help_text='User reputation score')),
+                ('badges', models.JSONField(blank=True, help_text='Earned badges', null=True)),
+                ('sequences_shared', models.IntegerField(default=0, help_text='Number of sequences shared')),
+                ('mappings_created', models.IntegerField(default=0, help_text='Number of mapping schemes created')),
+                ('discussions_started', models.IntegerField(default=0, help_text='Number of discussion threads started')),
+                ('comments_posted', models.IntegerField(default=0, help_text='Number of comments posted')),
+                ('email_notifications', models.BooleanField(default=True, help_text='Receive email notifications')),
+                ('notification_frequency', models.CharField(choices=[('immediate', 'Immediate'), ('daily', 'Daily digest'), ('weekly', 'Weekly digest'), ('never', 'Never')], default='immediate', help_text='How often to receive notifications', max_length=20)),
+                ('show_activity', models.BooleanField(default=True, help_text='Show activity on profile')),
+                ('show_email', models.BooleanField(default=False, help_text='Show email address on profile')),
+                ('allow_messages', models.BooleanField(default=True, help_text='Allow other users to send messages')),
+                ('is_moderator', models.BooleanField(default=False, help_text='User has moderator privileges')),
+                ('is_banned', models.BooleanField(default=False, help_text='User is banned from community features')),
+                ('ban_reason', models.TextField(blank=True, help_text='Reason for ban')),
+                ('ban_expires_at', models.DateTimeField(blank=True, help_text='When the ban expires (null = permanent)', null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.OneToOneField(help_text='Link to Django User model', on_delete=django.db.models.deletion.CASCADE, related_name='profile', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'User Profile',
+                'verbose_name_plural': 'User Profiles',
+            },
+        ),
+        migrations.CreateModel(
+            name='Vote',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveIntegerField(help_text='ID of object being voted on')),
+                ('vote_type', models.CharField(choices=[('upvote', 'Upvote'), ('downvote', 'Downvote')], help_text='Type of vote', max_length=10)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('content_type', models.ForeignKey(help_text='Type of object being voted on', on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+                ('user', models.ForeignKey(help_text='User who cast the vote', on_delete=django.db.models.deletion.CASCADE, related_name='votes', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Vote',
+                'verbose_name_plural': 'Votes',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Webhook',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Name for this webhook', max_length=100)),
+                ('url', models.URLField(help_text='URL to send webhook events to', max_length=500)),
+                ('secret', models.CharField(default=api.models.webhook.generate_webhook_secret, help_text='Secret used to sign webhook payloads', max_length=255)),
+                ('events', models.JSONField(default=list, help_text='Events to subscribe to')),
+                ('is_active', models.BooleanField(default=True, help_text='Whether this webhook is active')),
+                ('total_sent', models.IntegerField(default=0, help_text='Total number of events sent')),
+                ('total_failed', models.IntegerField(default=0, help_text='Total number of failed deliveries')),
+                ('last_success_at', models.DateTimeField(blank=True, help_text='Last successful delivery', null=True)),
+                ('last_failure_at', models.DateTimeField(blank=True, help_text='Last failed delivery', null=True)),
+                ('last_failure_reason', models.TextField(blank=True, help_text='Reason for last failure')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(help_text='User who owns this webhook', on_delete=django.db.models.deletion.CASCADE, related_name='webhooks', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Webhook',
+                'verbose_name_plural': 'Webhooks',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='WebhookDeliveryLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event_type', models.CharField(help_text='Type of event that triggered this webhook', max_length=50)),
+                ('payload', models.JSONField(help_text='Data sent in the webhook')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('success', 'Success'), ('failed', 'Failed'), ('retrying', 'Retrying')], default='pending', help_text='Delivery status', max_length=20)),
+                ('status_code', models.IntegerField(blank=True, help_text='HTTP status code from webhook endpoint', null=True)),
+                ('response_body', models.TextField(blank=True, help_text='Response body from webhook endpoint')),
+                ('retry_count', models.IntegerField(default=0, help_text='Number of retry attempts')),
+                ('next_retry_at', models.DateTimeField(blank=True, help_text='When to retry next', null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('delivered_at', models.DateTimeField(blank=True, help_text='When delivery was completed', null=True)),
+                ('webhook', models.ForeignKey(help_text='The webhook that was triggered', on_delete=django.db.models.deletion.CASCADE, related_name='delivery_logs', to='api.webhook')),
+            ],
+            options={
+                'verbose_name': 'Webhook Delivery Log',
+                'verbose_name_plural': 'Webhook Delivery Logs',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='analysispattern',
+            index=models.Index(fields=['user', 'pattern_type'], name='api_analysi_user_id_f33ad8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='analysispattern',
+            index=models.Index(fields=['pattern_type', 'significance_score'], name='api_analysi_pattern_d63a9d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='analysispattern',
+            index=models.Index(fields=['is_public'], name='api_analysi_is_publ_db244e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='analysispattern',
+            index=models.Index(fields=['created_at'], name='api_analysi_created_abed30_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='apikey',
+            index=models.Index(fields=['user'], name='api_apikey_user_id_f5d68d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='apikey',
+            index=models.Index(fields=['prefix'], name='api_apikey_prefix_3179cd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='apikey',
+            index=models.Index(fields=['is_active'], name='api_apikey_is_acti_ee92d2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='apikey',
+            index=models.Index(fields=['key'], name='api_apikey_key_5dc959_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='apikeyusagelog',
+            index=models.Index(fields=['api_key', '-timestamp'], name='api_apikeyu_api_key_c08594_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='apikeyusagelog',
+            index=models.Index(fields=['-timestamp'], name='api_apikeyu_timesta_67d6f4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='apikeyusagelog',
+            index=models.Index(fields=['status_code'], name='api_apikeyu_status__beee54_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='codonhexagrammapping',
+            index=models.Index(fields=['is_active'], name='api_codonhe_is_acti_329b6e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='codonhexagrammapping',
+            index=models.Index(fields=['mapping_type'], name='api_codonhe_mapping_91620c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='codonhexagrammapping',
+            index=models.Index(fields=['created_by'], name='api_codonhe_created_0d03fa_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='codonhexagrammapping',
+            index=models.Index(fields=['-vote_score'], name='api_codonhe_vote_sc_9044de_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='codonhexagrammapping',
+            index=models.Index(fields=['is_public', '-vote_score'], name='api_codonhe_is_publ_c4fc85_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['content_type', 'object_id'], name='api_comment_content_e00820_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['author'], name='api_comment_author__b4741e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['parent'], name='api_comment_parent__be9ea0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['-created_at'], name='api_comment_created_d7a6d8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['-vote_score'], name='api_comment_vote_sc_302df2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comparativeanalysis',
+            index=models.Index(fields=['user', 'analysis_type'], name='api_compara_user_id_c36771_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comparativeanalysis',
+            index=models.Index(fields=['analysis_type', 'is_public'], name='api_compara_analysi_a813d0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comparativeanalysis',
+            index=models.Index(fields=['created_at'], name='api_compara_created_b61abc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comparativeanalysis',
+            index=models.Index(fields=['similarity_score'], name='api_compara_similar_a3b4de_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comparisoncache',
+            index=models.Index(fields=['cache_key'], name='api_compari_cache_k_aa58a6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comparisoncache',
+            index=models.Index(fields=['user'], name='api_compari_user_id_d8fea8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comparisoncache',
+            index=models.Index(fields=['last_accessed'], name='api_compari_last_ac_2b5b02_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hexagram',
+            index=models.Index(fields=['number'], name='api_hexagra_number_4d6893_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hexagram',
+            index=models.Index(fields=['binary'], name='api_hexagra_binary_59f2ba_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='discussion',
+            index=models.Index(fields=['slug'], name='api_discuss_slug_d15546_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='discussion',
+            index=models.Index(fields=['author'], name='api_discuss_author__09c231_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='discussion',
+            index=models.Index(fields=['discussion_type'], name='api_discuss_discuss_9be379_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='discussion',
+            index=models.Index(fields=['-created_at'], name='api_discuss_created_54bfd3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='discussion',
+            index=models.Index(fields=['-last_comment_at'], name='api_discuss_last_co_59bada_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='discussion',
+            index=models.Index(fields=['is_pinned', '-last_comment_at'], name='api_discuss_is_pinn_6cca51_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='codonsequence',
+            index=models.Index(fields=['user'], name='api_codonse_user_id_d394a2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='codonsequence',
+            index=models.Index(fields=['sequence_type'], name='api_codonse_sequenc_8675b4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='codonsequence',
+            index=models.Index(fields=['gene_name'], name='api_codonse_gene_na_46fc1a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='codonsequence',
+            index=models.Index(fields=['organism'], name='api_codonse_organis_94d916_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='codon',
+            index=models.Index(fields=['sequence'], name='api_codon_sequenc_a8c7ae_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='codon',
+            index=models.Index(fields=['amino_acid_code'], name='api_codon_amino_a_417b2d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='codon',
+            index=models.Index(fields=['is_start'], name='api_codon_is_star_7c784e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='codon',
+            index=models.Index(fields=['is_stop'], name='api_codon_is_stop_edc157_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hexagraminterpretation',
+            index=models.Index(fields=['hexagram'], name='api_hexagra_hexagra_1cc7c3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hexagraminterpretation',
+            index=models.Index(fields=['user'], name='api_hexagra_user_id_c69228_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hexagraminterpretation',
+            index=models.Index(fields=['codon'], name='api_hexagra_codon_i_21e22e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['recipient', '-created_at'], name='api_notific_recipie_5c719b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['recipient', 'is_read'], name='api_notific_recipie_28b188_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['-created_at'], name='api_notific_created_ae9e55_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='patternmatch',
+            index=models.Index(fields=['pattern', 'sequence_id'], name='api_pattern_pattern_47721f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='patternmatch',
+            index=models.Index(fields=['sequence_id'], name='api_pattern_sequenc_2e77a5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userprofile',
+            index=models.Index(fields=['user'], name='api_userpro_user_id_ea9cd5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userprofile',
+            index=models.Index(fields=['reputation_score'], name='api_userpro_reputat_3cc7bd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userprofile',
+            index=models.Index(fields=['-created_at'], name='api_userpro_created_bf35ee_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vote',
+            index=models.Index(fields=['user'], name='api_vote_user_id_43f53e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vote',
+            index=models.Index(fields=['content_type', 'object_id'], name='api_vote_content_e5590e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vote',
+            index=models.Index(fields=['-created_at'], name='api_vote_created_6bc533_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='vote',
+            unique_together={('user', 'content_type', 'object_id')},
+        ),
+        migrations.AddIndex(
+            model_name='webhook',
+            index=models.Index(fields=['user'], name='api_webhook_user_id_0a4464_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='webhook',
+            index=models.Index(fields=['is_active'], name='api_webhook_is_acti_89860c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='webhook',
+            index=models.Index(fields=['events'], name='api_webhook_events_482b3c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='webhookdeliverylog',
+            index=models.Index(fields=['webhook', '-created_at'], name='api_webhook_webhook_2bfcdc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='webhookdeliverylog',
+            index=models.Index(fields=['status'], name='api_webhook_status_89fc78_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='webhookdeliverylog',
+            index=models.Index(fields=['event_type'], name='api_webhook_event_t_b1f18c_idx'),
+        ),
+    ]
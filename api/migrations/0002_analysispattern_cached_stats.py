@@ -0,0 +1,23 @@
+# Generated by Django 5.0.1 on 2026-10-15 23:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='analysispattern',
+            name='dominant_hexagram',
+            field=models.IntegerField(blank=True, db_index=True, editable=False, help_text='Most frequent hexagram in the sequence (cached)', null=True),
+        ),
+        migrations.AddField(
+            model_name='analysispattern',
+            name='shannon_entropy',
+            field=models.FloatField(blank=True, editable=False, help_text='Shannon diversity of the hexagram sequence (cached)', null=True),
+        ),
+    ]
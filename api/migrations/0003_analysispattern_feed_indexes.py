@@ -0,0 +1,27 @@
+# Generated by Django 5.0.1 on 2026-10-15 23:48
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_analysispattern_cached_stats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='analysispattern',
+            name='api_analysi_is_publ_db244e_idx',
+        ),
+        migrations.AddIndex(
+            model_name='analysispattern',
+            index=models.Index(fields=['is_public', '-significance_score', '-created_at'], name='api_analysi_is_publ_04afc6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='analysispattern',
+            index=models.Index(fields=['user', 'is_public', '-significance_score'], name='api_analysi_user_id_d2ab08_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.0.1 on 2026-10-15 23:49
+
+import hashlib
+
+from django.db import migrations, models
+
+
+def hash_existing_keys(apps, schema_editor):
+    APIKey = apps.get_model('api', 'APIKey')
+    for api_key in APIKey.objects.only('pk', 'key'):
+        api_key.key_hash = hashlib.sha256(api_key.key.encode()).hexdigest()
+        api_key.save(update_fields=['key_hash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_analysispattern_feed_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='apikey',
+            name='api_apikey_key_5dc959_idx',
+        ),
+        migrations.AddField(
+            model_name='apikey',
+            name='key_hash',
+            field=models.CharField(help_text='SHA-256 hash of the API key', max_length=64, null=True),
+        ),
+        migrations.RunPython(hash_existing_keys, elidable=True),
+        migrations.RemoveField(
+            model_name='apikey',
+            name='key',
+        ),
+        migrations.AlterField(
+            model_name='apikey',
+            name='key_hash',
+            field=models.CharField(help_text='SHA-256 hash of the API key', max_length=64, unique=True),
+        ),
+    ]
@@ -0,0 +1,98 @@
+"""
+Partition api_apikeyusagelog by month on PostgreSQL.
+
+Inserts then only maintain the current partition's indexes, and
+prune_api_key_usage drops whole expired partitions instead of deleting
+rows. Other databases keep the plain table.
+"""
+from django.db import migrations
+from django.utils import timezone
+
+from api.utils.partitioning import (
+    DEFAULT_PARTITION,
+    USAGE_LOG_TABLE,
+    add_months,
+    create_monthly_partition,
+    month_start,
+)
+
+OLD_TABLE = f'{USAGE_LOG_TABLE}_old'
+
+
+def _rebuild(schema_editor, partitioned):
+    """Copy the table into a partitioned (or plain) table of the same shape."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        # Indexes and foreign keys are recreated verbatim on the new table
+        cursor.execute(
+            'SELECT pg_get_indexdef(indexrelid) FROM pg_index '
+            'WHERE indrelid = %s::regclass AND NOT indisprimary',
+            [USAGE_LOG_TABLE],
+        )
+        index_sql = [row[0] for row in cursor.fetchall()]
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = %s::regclass AND contype = 'f'",
+            [USAGE_LOG_TABLE],
+        )
+        foreign_keys = cursor.fetchall()
+
+        cursor.execute(f'ALTER TABLE {USAGE_LOG_TABLE} RENAME TO {OLD_TABLE}')
+        cursor.execute(
+            f'CREATE TABLE {USAGE_LOG_TABLE} '
+            f'(LIKE {OLD_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING IDENTITY)'
+            + (' PARTITION BY RANGE ("timestamp")' if partitioned else '')
+        )
+
+        if partitioned:
+            cursor.execute(
+                f'CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {USAGE_LOG_TABLE} DEFAULT'
+            )
+            cursor.execute(f'SELECT MIN("timestamp") FROM {OLD_TABLE}')
+            oldest = cursor.fetchone()[0]
+            month = month_start(oldest or timezone.now())
+            last = add_months(month_start(timezone.now()), 1)
+            while month <= last:
+                create_monthly_partition(cursor, month)
+                month = add_months(month, 1)
+
+        cursor.execute(f'INSERT INTO {USAGE_LOG_TABLE} SELECT * FROM {OLD_TABLE}')
+        cursor.execute(
+            f"SELECT setval(pg_get_serial_sequence('{USAGE_LOG_TABLE}', 'id'), "
+            f'COALESCE(MAX(id), 0) + 1, false) FROM {USAGE_LOG_TABLE}'
+        )
+        cursor.execute(f'DROP TABLE {OLD_TABLE}')
+
+        # A partitioned table's primary key has to include the partition key
+        primary_key = '(id, "timestamp")' if partitioned else '(id)'
+        cursor.execute(
+            f'ALTER TABLE {USAGE_LOG_TABLE} '
+            f'ADD CONSTRAINT {USAGE_LOG_TABLE}_pkey PRIMARY KEY {primary_key}'
+        )
+        for sql in index_sql:
+            cursor.execute(sql)
+        for name, definition in foreign_keys:
+            cursor.execute(
+                f'ALTER TABLE {USAGE_LOG_TABLE} ADD CONSTRAINT {name} {definition}'
+            )
+
+
+def partition_usage_log(apps, schema_editor):
+    _rebuild(schema_editor, partitioned=True)
+
+
+def unpartition_usage_log(apps, schema_editor):
+    _rebuild(schema_editor, partitioned=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_apikey_key_hash'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_usage_log, unpartition_usage_log),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.1 on 2026-10-15 23:51
+
+import api.models.codon
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_partition_apikeyusagelog'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='codon',
+            name='sequence',
+            field=models.CharField(help_text='Three-nucleotide sequence', max_length=3, unique=True, validators=[api.models.codon.validate_codon_sequence]),
+        ),
+    ]
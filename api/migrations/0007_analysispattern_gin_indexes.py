@@ -0,0 +1,28 @@
+# Generated by Django 5.0.1 on 2026-10-15 23:52
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_codon_sequence_validator'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='analysispattern',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['tags'], name='ap_tags_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='analysispattern',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['hexagram_sequence'], name='ap_hexseq_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='analysispattern',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['pattern_data'], name='ap_data_gin', opclasses=['jsonb_path_ops']),
+        ),
+    ]
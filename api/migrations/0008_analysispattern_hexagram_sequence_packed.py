@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-15 23:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_analysispattern_gin_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='analysispattern',
+            name='hexagram_sequence_packed',
+            field=models.BinaryField(blank=True, help_text='Hexagram sequence packed as int16 (cached)', null=True),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.1 on 2026-10-15 23:53
+
+import api.models.api_key
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_analysispattern_hexagram_sequence_packed'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='apikey',
+            name='api_apikey_prefix_3179cd_idx',
+        ),
+        migrations.AlterField(
+            model_name='apikey',
+            name='prefix',
+            field=models.CharField(default=api.models.api_key.generate_api_key_prefix, help_text='Key prefix for identification', max_length=16, unique=True),
+        ),
+    ]
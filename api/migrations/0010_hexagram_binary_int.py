@@ -0,0 +1,35 @@
+# Generated by Django 5.0.1 on 2026-10-15 23:56
+
+from django.db import migrations, models
+
+
+def fill_binary_int(apps, schema_editor):
+    Hexagram = apps.get_model('api', 'Hexagram')
+    hexagrams = list(Hexagram.objects.only('pk', 'binary'))
+    for hexagram in hexagrams:
+        hexagram.binary_int = int(hexagram.binary, 2)
+    Hexagram.objects.bulk_update(hexagrams, ['binary_int'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_apikey_narrow_prefix'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='hexagram',
+            name='api_hexagra_number_4d6893_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='hexagram',
+            name='api_hexagra_binary_59f2ba_idx',
+        ),
+        migrations.AddField(
+            model_name='hexagram',
+            name='binary_int',
+            field=models.PositiveSmallIntegerField(editable=False, help_text='Integer value of the binary representation (0-63)', null=True, unique=True),
+        ),
+        migrations.RunPython(fill_binary_int, migrations.RunPython.noop, elidable=True),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.0.1 on 2026-10-15 23:57
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_replies(apps, schema_editor):
+    Comment = apps.get_model('api', 'Comment')
+    replies = (
+        Comment.objects.filter(parent=OuterRef('pk'))
+        .order_by()
+        .values('parent')
+        .annotate(count=Count('pk'))
+        .values('count')
+    )
+    Comment.objects.update(reply_count=Coalesce(Subquery(replies), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_hexagram_binary_int'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='reply_count',
+            field=models.IntegerField(default=0, help_text='Number of direct replies'),
+        ),
+        migrations.RunPython(count_replies, migrations.RunPython.noop, elidable=True),
+    ]
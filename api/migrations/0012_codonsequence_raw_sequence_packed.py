@@ -0,0 +1,68 @@
+import numpy as np
+from django.db import migrations, models
+
+from api.utils import codon_kernels
+
+
+def pack_sequences(apps, schema_editor):
+    """Keep uppercase ACGT sequences only in packed form."""
+    CodonSequence = apps.get_model('api', 'CodonSequence')
+    rows = CodonSequence.objects.filter(raw_sequence_text__isnull=False).only(
+        'pk', 'raw_sequence_text'
+    )
+    packed_rows = []
+    for row in rows.iterator(chunk_size=500):
+        sequence = row.raw_sequence_text
+        packed = codon_kernels.pack_codes(codon_kernels.encode_bases(
+            np.frombuffer(sequence.encode('ascii', 'replace'), dtype=np.uint8)
+        ))
+        if packed is not None and sequence.isupper():
+            row.raw_sequence_packed = packed
+            row.raw_sequence_text = None
+            packed_rows.append(row)
+    CodonSequence.objects.bulk_update(
+        packed_rows, ['raw_sequence_packed', 'raw_sequence_text'], batch_size=500
+    )
+
+
+def unpack_sequences(apps, schema_editor):
+    """Write packed sequences back out as text."""
+    CodonSequence = apps.get_model('api', 'CodonSequence')
+    rows = CodonSequence.objects.filter(raw_sequence_text__isnull=True).only(
+        'pk', 'raw_sequence_packed'
+    )
+    unpacked_rows = []
+    for row in rows.iterator(chunk_size=500):
+        row.raw_sequence_text = (
+            codon_kernels.decode_bases(codon_kernels.unpack_codes(row.raw_sequence_packed))
+            if row.raw_sequence_packed is not None else ''
+        )
+        unpacked_rows.append(row)
+    CodonSequence.objects.bulk_update(unpacked_rows, ['raw_sequence_text'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_comment_reply_count'),
+    ]
+
+    operations = [
+        # db_column keeps the existing column; only NOT NULL is dropped
+        migrations.AlterField(
+            model_name='codonsequence',
+            name='raw_sequence',
+            field=models.TextField(blank=True, db_column='raw_sequence', help_text='Raw DNA/RNA sequence string, when it is not packed', null=True),
+        ),
+        migrations.RenameField(
+            model_name='codonsequence',
+            old_name='raw_sequence',
+            new_name='raw_sequence_text',
+        ),
+        migrations.AddField(
+            model_name='codonsequence',
+            name='raw_sequence_packed',
+            field=models.BinaryField(blank=True, editable=False, help_text='Raw sequence packed 4 bases per byte', null=True),
+        ),
+        migrations.RunPython(pack_sequences, unpack_sequences),
+    ]
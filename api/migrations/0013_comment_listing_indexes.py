@@ -0,0 +1,32 @@
+# Generated by Django 5.0.1 on 2026-10-16 00:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_codonsequence_raw_sequence_packed'),
+        ('contenttypes', '0002_remove_content_type_name'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='comment',
+            name='api_comment_content_e00820_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='comment',
+            name='api_comment_parent__be9ea0_idx',
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['content_type', 'object_id', '-created_at'], name='api_comment_content_98ad19_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['parent', 'created_at'], name='api_comment_parent__d9e835_idx'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.0.1 on 2026-10-16 00:01
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations, models
+
+
+def fill_differences_count(apps, schema_editor):
+    ComparativeAnalysis = apps.get_model('api', 'ComparativeAnalysis')
+    analyses = []
+    for analysis in ComparativeAnalysis.objects.only('pk', 'results').iterator(chunk_size=500):
+        if isinstance(analysis.results, dict) and 'differences_count' in analysis.results:
+            analysis.differences_count = analysis.results['differences_count']
+            analyses.append(analysis)
+    ComparativeAnalysis.objects.bulk_update(analyses, ['differences_count'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_comment_listing_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comparativeanalysis',
+            name='differences_count',
+            field=models.IntegerField(blank=True, db_index=True, editable=False, help_text='Number of differing hexagrams (from results)', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='comparativeanalysis',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['tags'], name='ca_tags_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='comparativeanalysis',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['mapping_schemes'], name='ca_schemes_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='hexagram',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['keywords'], name='hexagram_keywords_gin'),
+        ),
+        migrations.RunPython(fill_differences_count, migrations.RunPython.noop, elidable=True),
+    ]
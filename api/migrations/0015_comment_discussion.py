@@ -0,0 +1,42 @@
+# Generated by Django 5.0.1 on 2026-10-16 00:04
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F
+
+
+def link_discussions(apps, schema_editor):
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    Comment = apps.get_model('api', 'Comment')
+    Discussion = apps.get_model('api', 'Discussion')
+    try:
+        content_type = ContentType.objects.get(app_label='api', model='discussion')
+    except ContentType.DoesNotExist:
+        return
+    Comment.objects.filter(
+        content_type=content_type,
+        object_id__in=Discussion.objects.values('pk'),
+    ).update(discussion_id=F('object_id'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_comparativeanalysis_differences_count'),
+        ('contenttypes', '0002_remove_content_type_name'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='discussion',
+            field=models.ForeignKey(blank=True, help_text='Discussion being commented on (set automatically)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='comments_direct', to='api.discussion'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['discussion', '-created_at'], name='api_comment_discuss_0d0e7b_idx'),
+        ),
+        migrations.RunPython(link_discussions, migrations.RunPython.noop, elidable=True),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.0.1 on 2026-10-16 00:09
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0016_notification_content_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='webhook',
+            name='api_webhook_events_482b3c_idx',
+        ),
+        migrations.AddIndex(
+            model_name='webhook',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['events'], name='webhook_events_gin'),
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.0.1 on 2026-10-16 00:10
+
+from django.db import migrations, models
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_votes(apps, schema_editor):
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    Vote = apps.get_model('api', 'Vote')
+    for model_name in ('discussion', 'codonhexagrammapping'):
+        try:
+            content_type = ContentType.objects.get(app_label='api', model=model_name)
+        except ContentType.DoesNotExist:
+            continue
+        model = apps.get_model('api', model_name)
+
+        def tally(vote_type):
+            votes = (
+                Vote.objects.filter(
+                    content_type=content_type, object_id=OuterRef('pk'), vote_type=vote_type
+                )
+                .order_by()
+                .values('object_id')
+                .annotate(count=Count('pk'))
+                .values('count')
+            )
+            return Coalesce(Subquery(votes), 0)
+
+        model.objects.update(upvotes=tally('upvote'), downvotes=tally('downvote'))
+        model.objects.update(vote_score=F('upvotes') - F('downvotes'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0017_webhook_events_gin'),
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='codonhexagrammapping',
+            name='downvotes',
+            field=models.IntegerField(default=0, help_text='Number of downvotes'),
+        ),
+        migrations.AddField(
+            model_name='codonhexagrammapping',
+            name='upvotes',
+            field=models.IntegerField(default=0, help_text='Number of upvotes'),
+        ),
+        migrations.AddField(
+            model_name='discussion',
+            name='downvotes',
+            field=models.IntegerField(default=0, help_text='Number of downvotes'),
+        ),
+        migrations.AddField(
+            model_name='discussion',
+            name='upvotes',
+            field=models.IntegerField(default=0, help_text='Number of upvotes'),
+        ),
+        migrations.RunPython(count_votes, migrations.RunPython.noop, elidable=True),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-16 00:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0020_profile_badges_gin'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='reputation_level',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(reputation_score__lt=10, then=models.Value('Newcomer')), models.When(reputation_score__lt=50, then=models.Value('Contributor')), models.When(reputation_score__lt=150, then=models.Value('Researcher')), models.When(reputation_score__lt=500, then=models.Value('Expert')), models.When(reputation_score__lt=1000, then=models.Value('Master')), default=models.Value('Grandmaster')), output_field=models.CharField(max_length=20)),
+        ),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 5.0.1 on 2026-10-16 00:17
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F
+
+
+def link_targets(apps, schema_editor):
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    targets = {
+        'comment': 'comment',
+        'discussion': 'discussion',
+        'codonhexagrammapping': 'mapping',
+    }
+    for model_name, field in targets.items():
+        try:
+            content_type = ContentType.objects.get(app_label='api', model=model_name)
+        except ContentType.DoesNotExist:
+            continue
+        target_pks = apps.get_model('api', model_name).objects.values('pk')
+        for source in ('Vote', 'Notification'):
+            apps.get_model('api', source).objects.filter(
+                content_type=content_type,
+                object_id__in=target_pks,
+            ).update(**{f'{field}_id': F('object_id')})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0021_userprofile_reputation_level'),
+        ('contenttypes', '0002_remove_content_type_name'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='comment',
+            field=models.ForeignKey(blank=True, help_text='Related comment (set automatically)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='api.comment'),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='discussion',
+            field=models.ForeignKey(blank=True, help_text='Related discussion (set automatically)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='api.discussion'),
+        ),
+        migrations.AddField(
+            model_name='notification',
+            name='mapping',
+            field=models.ForeignKey(blank=True, help_text='Related mapping (set automatically)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='api.codonhexagrammapping'),
+        ),
+        migrations.AddField(
+            model_name='vote',
+            name='comment',
+            field=models.ForeignKey(blank=True, help_text='Comment being voted on (set automatically)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='api.comment'),
+        ),
+        migrations.AddField(
+            model_name='vote',
+            name='discussion',
+            field=models.ForeignKey(blank=True, help_text='Discussion being voted on (set automatically)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='api.discussion'),
+        ),
+        migrations.AddField(
+            model_name='vote',
+            name='mapping',
+            field=models.ForeignKey(blank=True, help_text='Mapping being voted on (set automatically)', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='api.codonhexagrammapping'),
+        ),
+        migrations.RunPython(link_targets, migrations.RunPython.noop, elidable=True),
+        migrations.AddConstraint(
+            model_name='notification',
+            constraint=models.CheckConstraint(check=models.Q(models.Q(('comment__isnull', True), ('discussion__isnull', True)), models.Q(('comment__isnull', True), ('mapping__isnull', True)), models.Q(('discussion__isnull', True), ('mapping__isnull', True)), _connector='OR'), name='notification_single_target'),
+        ),
+        migrations.AddConstraint(
+            model_name='vote',
+            constraint=models.CheckConstraint(check=models.Q(models.Q(('comment__isnull', True), ('discussion__isnull', True)), models.Q(('comment__isnull', True), ('mapping__isnull', True)), models.Q(('discussion__isnull', True), ('mapping__isnull', True)), _connector='OR'), name='vote_single_target'),
+        ),
+    ]
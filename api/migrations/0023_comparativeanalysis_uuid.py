@@ -0,0 +1,46 @@
+import uuid
+
+from django.db import migrations, models
+
+
+def assign_uuids(apps, schema_editor):
+    """Give every existing analysis its own identifier."""
+    ComparativeAnalysis = apps.get_model('api', 'ComparativeAnalysis')
+    rows = []
+    for row in ComparativeAnalysis.objects.only('pk').iterator(chunk_size=500):
+        row.uuid = uuid.uuid4()
+        rows.append(row)
+    ComparativeAnalysis.objects.bulk_update(rows, ['uuid'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0022_explicit_vote_notification_targets'),
+    ]
+
+    operations = [
+        # Added without the unique constraint first, so existing rows do not
+        # all share the single default evaluated for the column
+        migrations.AddField(
+            model_name='comparativeanalysis',
+            name='uuid',
+            field=models.UUIDField(
+                default=uuid.uuid4,
+                editable=False,
+                null=True,
+                help_text='Stable identifier returned when the analysis is saved',
+            ),
+        ),
+        migrations.RunPython(assign_uuids, migrations.RunPython.noop, elidable=True),
+        migrations.AlterField(
+            model_name='comparativeanalysis',
+            name='uuid',
+            field=models.UUIDField(
+                default=uuid.uuid4,
+                editable=False,
+                unique=True,
+                help_text='Stable identifier returned when the analysis is saved',
+            ),
+        ),
+    ]
@@ -0,0 +1,99 @@
+# Generated by Django 5.0.1 on 2026-10-16 00:36
+
+import hashlib
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def move_sequences_to_blobs(apps, schema_editor):
+    """Intern existing sequence text and clear the inline columns."""
+    ComparativeAnalysis = apps.get_model('api', 'ComparativeAnalysis')
+    SequenceBlob = apps.get_model('api', 'SequenceBlob')
+    blob_ids = {}
+
+    def intern(content):
+        digest = hashlib.blake2b(content.encode(), digest_size=16).digest()
+        if digest not in blob_ids:
+            blob, _ = SequenceBlob.objects.get_or_create(
+                hash=digest,
+                defaults={'content': content, 'length': len(content)},
+            )
+            blob_ids[digest] = blob.pk
+        return blob_ids[digest]
+
+    rows = ComparativeAnalysis.objects.exclude(sequence1='', sequence2='').only(
+        'pk', 'sequence1', 'sequence2'
+    )
+    moved = []
+    for row in rows.iterator(chunk_size=500):
+        for field in ('sequence1', 'sequence2'):
+            text = getattr(row, field)
+            if text:
+                setattr(row, f'{field}_blob_id', intern(text))
+                setattr(row, field, '')
+        moved.append(row)
+    ComparativeAnalysis.objects.bulk_update(
+        moved,
+        ['sequence1', 'sequence2', 'sequence1_blob', 'sequence2_blob'],
+        batch_size=500,
+    )
+
+
+def restore_inline_sequences(apps, schema_editor):
+    """Copy blob text back into the inline columns."""
+    ComparativeAnalysis = apps.get_model('api', 'ComparativeAnalysis')
+    rows = ComparativeAnalysis.objects.select_related('sequence1_blob', 'sequence2_blob')
+    restored = []
+    for row in rows.iterator(chunk_size=500):
+        for field in ('sequence1', 'sequence2'):
+            blob = getattr(row, f'{field}_blob')
+            if blob is not None and not getattr(row, field):
+                setattr(row, field, blob.content)
+        restored.append(row)
+    ComparativeAnalysis.objects.bulk_update(restored, ['sequence1', 'sequence2'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0023_comparativeanalysis_uuid'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SequenceBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hash', models.BinaryField(help_text='BLAKE2b digest of the sequence', max_length=16, unique=True)),
+                ('content', models.TextField(help_text='Sequence text')),
+                ('length', models.PositiveIntegerField(help_text='Sequence length')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Sequence Blob',
+                'verbose_name_plural': 'Sequence Blobs',
+            },
+        ),
+        migrations.AlterField(
+            model_name='comparativeanalysis',
+            name='sequence1',
+            field=models.TextField(blank=True, help_text='First genetic sequence (legacy rows)'),
+        ),
+        migrations.AlterField(
+            model_name='comparativeanalysis',
+            name='sequence2',
+            field=models.TextField(blank=True, help_text='Second genetic sequence (legacy rows)'),
+        ),
+        migrations.AddField(
+            model_name='comparativeanalysis',
+            name='sequence1_blob',
+            field=models.ForeignKey(blank=True, help_text='Stored first sequence', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='api.sequenceblob'),
+        ),
+        migrations.AddField(
+            model_name='comparativeanalysis',
+            name='sequence2_blob',
+            field=models.ForeignKey(blank=True, help_text='Stored second sequence', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='api.sequenceblob'),
+        ),
+        migrations.RunPython(move_sequences_to_blobs, restore_inline_sequences, elidable=True),
+    ]
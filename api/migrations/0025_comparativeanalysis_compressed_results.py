@@ -0,0 +1,59 @@
+from django.db import migrations, models
+
+import api.models.fields
+
+
+def compress_results(apps, schema_editor):
+    ComparativeAnalysis = apps.get_model('api', 'ComparativeAnalysis')
+    rows = []
+    for row in ComparativeAnalysis.objects.only('pk', 'results').iterator(chunk_size=500):
+        row.results_compressed = row.results
+        rows.append(row)
+    ComparativeAnalysis.objects.bulk_update(rows, ['results_compressed'], batch_size=500)
+
+
+def decompress_results(apps, schema_editor):
+    ComparativeAnalysis = apps.get_model('api', 'ComparativeAnalysis')
+    rows = []
+    for row in ComparativeAnalysis.objects.only('pk', 'results_compressed').iterator(chunk_size=500):
+        row.results = row.results_compressed
+        rows.append(row)
+    ComparativeAnalysis.objects.bulk_update(rows, ['results'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0024_sequenceblob'),
+    ]
+
+    # jsonb cannot be cast to bytea, so the results move through a new column
+    operations = [
+        migrations.AlterField(
+            model_name='comparativeanalysis',
+            name='results',
+            field=models.JSONField(null=True, help_text='Detailed comparison results'),
+        ),
+        migrations.AddField(
+            model_name='comparativeanalysis',
+            name='results_compressed',
+            field=api.models.fields.CompressedJSONField(null=True),
+        ),
+        migrations.RunPython(compress_results, decompress_results),
+        migrations.RemoveField(
+            model_name='comparativeanalysis',
+            name='results',
+        ),
+        migrations.RenameField(
+            model_name='comparativeanalysis',
+            old_name='results_compressed',
+            new_name='results',
+        ),
+        migrations.AlterField(
+            model_name='comparativeanalysis',
+            name='results',
+            field=api.models.fields.CompressedJSONField(
+                help_text='Detailed comparison results (zlib-compressed JSON)'
+            ),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.0.1 on 2026-10-16 00:41
+
+import hashlib
+
+from django.conf import settings
+from django.db import migrations, models
+
+from api.utils import codon_kernels
+
+
+def hash_sequences(apps, schema_editor):
+    CodonSequence = apps.get_model('api', 'CodonSequence')
+    rows = CodonSequence.objects.only('pk', 'raw_sequence_text', 'raw_sequence_packed')
+    hashed = []
+    for row in rows.iterator(chunk_size=500):
+        if row.raw_sequence_text is not None:
+            sequence = row.raw_sequence_text
+        elif row.raw_sequence_packed is not None:
+            sequence = codon_kernels.decode_bases(
+                codon_kernels.unpack_codes(row.raw_sequence_packed)
+            )
+        else:
+            sequence = ''
+        row.sequence_hash = hashlib.blake2b(sequence.encode(), digest_size=16).hexdigest()
+        hashed.append(row)
+    CodonSequence.objects.bulk_update(hashed, ['sequence_hash'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0025_comparativeanalysis_compressed_results'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='codonsequence',
+            name='mapping_scheme',
+            field=models.CharField(default='scheme_1', help_text='Binary mapping scheme used for the analysis', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='codonsequence',
+            name='sequence_hash',
+            field=models.CharField(blank=True, editable=False, help_text='BLAKE2b-128 hex digest of raw_sequence', max_length=32),
+        ),
+        migrations.AddIndex(
+            model_name='codonsequence',
+            index=models.Index(fields=['user', 'sequence_hash', 'mapping_scheme'], name='api_codonse_user_id_479cf1_idx'),
+        ),
+        migrations.RunPython(hash_sequences, migrations.RunPython.noop, elidable=True),
+    ]
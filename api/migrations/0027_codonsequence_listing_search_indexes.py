@@ -0,0 +1,39 @@
+# Generated by Django 5.0.1 on 2026-10-16 00:42
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0026_codonsequence_sequence_hash'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # gin_trgm_ops below needs pg_trgm
+        TrigramExtension(),
+        migrations.RemoveIndex(
+            model_name='codonsequence',
+            name='api_codonse_user_id_d394a2_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='codonsequence',
+            name='api_codonse_sequenc_8675b4_idx',
+        ),
+        migrations.AddIndex(
+            model_name='codonsequence',
+            index=models.Index(fields=['user', '-created_at'], name='api_codonse_user_id_223207_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='codonsequence',
+            index=models.Index(condition=models.Q(('is_reference', True)), fields=['name'], name='codonseq_reference_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='codonsequence',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name', 'description', 'gene_name', 'organism'], name='codonseq_search_gin', opclasses=['gin_trgm_ops', 'gin_trgm_ops', 'gin_trgm_ops', 'gin_trgm_ops']),
+        ),
+    ]
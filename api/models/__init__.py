@@ -4,7 +4,7 @@ from .codon_sequence import CodonSequence
 from .hexagram_interpretation import HexagramInterpretation
 from .mapping import CodonHexagramMapping
 from .analysis_pattern import AnalysisPattern, PatternMatch
-from .comparative_analysis import ComparativeAnalysis, ComparisonCache
+from .comparative_analysis import ComparativeAnalysis, ComparisonCache, SequenceBlob
 from .user_profile import UserProfile
 from .discussion import Discussion
 from .comment import Comment
@@ -23,6 +23,7 @@ __all__ = [
     'PatternMatch',
     'ComparativeAnalysis',
     'ComparisonCache',
+    'SequenceBlob',
     'UserProfile',
     'Discussion',
     'Comment',
@@ -1,12 +1,47 @@
 """
 Analysis Pattern Model - Stores discovered patterns from genetic-hexagram analysis
 """
+import copy
+import math
+from collections import Counter
+
+import numpy as np
+from scipy import stats
 from django.db import models
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex
 from django.core.validators import MinValueValidator, MaxValueValidator
 
 User = get_user_model()
 
+# Below this length the NumPy/SciPy setup cost outweighs the vectorized work
+VECTORIZE_MIN_LENGTH = 16
+
+
+def _py_shannon(sequence) -> float:
+    """Shannon diversity of a short sequence using plain Python."""
+    total = len(sequence)
+    shannon = 0.0
+    for count in Counter(sequence).values():
+        proportion = count / total
+        shannon -= proportion * math.log(proportion)
+    return shannon
+
+
+class AnalysisPatternManager(models.Manager):
+    """Manager with query helpers for analysis patterns."""
+
+    def for_list(self):
+        """Patterns without the large sequence/JSON columns, for list views."""
+        return self.get_queryset().defer(
+            'sequence',
+            'hexagram_sequence',
+            'hexagram_sequence_packed',
+            'pattern_data',
+            'related_sequences',
+            'notes',
+        )
+
 
 class AnalysisPattern(models.Model):
     """
@@ -54,6 +89,30 @@ class AnalysisPattern(models.Model):
         help_text='Hexagram sequence as JSON array',
     )
 
+    # hexagram_sequence as packed int16 bytes, read back with np.frombuffer
+    hexagram_sequence_packed = models.BinaryField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text='Hexagram sequence packed as int16 (cached)',
+    )
+
+    # Denormalized statistics of hexagram_sequence, recomputed on save
+    shannon_entropy = models.FloatField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text='Shannon diversity of the hexagram sequence (cached)',
+    )
+
+    dominant_hexagram = models.IntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text='Most frequent hexagram in the sequence (cached)',
+    )
+
     # Pattern data (flexible JSON structure based on pattern type)
     pattern_data = models.JSONField(
         help_text='Detailed pattern data (structure varies by pattern_type)',
@@ -158,6 +217,8 @@ class AnalysisPattern(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = AnalysisPatternManager()
+
     class Meta:
         ordering = ['-significance_score', '-created_at']
         verbose_name = 'Analysis Pattern'
@@ -165,7 +226,17 @@ class AnalysisPattern(models.Model):
         indexes = [
             models.Index(fields=['user', 'pattern_type']),
             models.Index(fields=['pattern_type', 'significance_score']),
-            models.Index(fields=['is_public']),
+            # Public/user feeds ordered by significance (covers is_public alone)
+            models.Index(fields=['is_public', '-significance_score', '-created_at']),
+            models.Index(fields=['user', 'is_public', '-significance_score']),
+            # JSON containment lookups (e.g. tags__contains=[...])
+            GinIndex(fields=['tags'], name='ap_tags_gin'),
+            GinIndex(fields=['hexagram_sequence'], name='ap_hexseq_gin'),
+            GinIndex(
+                fields=['pattern_data'],
+                opclasses=['jsonb_path_ops'],
+                name='ap_data_gin',
+            ),
             models.Index(fields=['created_at']),
         ]
 
@@ -181,38 +252,77 @@ class AnalysisPattern(models.Model):
             return len(self.hexagram_sequence)
         return 0
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Snapshot a copy so save() also notices in-place edits of the list
+        instance._loaded_hexagram_sequence = copy.copy(instance.__dict__.get('hexagram_sequence'))
+        return instance
+
+    def _hexagram_sequence_changed(self) -> bool:
+        """Whether hexagram_sequence differs from the value last loaded/saved."""
+        if self._state.adding or not hasattr(self, '_loaded_hexagram_sequence'):
+            return True
+        if 'hexagram_sequence' in self.get_deferred_fields():
+            return False
+        return self.hexagram_sequence != self._loaded_hexagram_sequence
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'hexagram_sequence' in update_fields:
+            if self._hexagram_sequence_changed() or self.shannon_entropy is None:
+                arr = np.asarray(self.hexagram_sequence or [], dtype=np.int16)
+                self.hexagram_sequence_packed = arr.tobytes()
+                self.shannon_entropy = self._compute_hexagram_diversity(arr)
+                self.dominant_hexagram = self._compute_dominant_hexagram(arr)
+                if update_fields is not None:
+                    kwargs['update_fields'] = set(update_fields) | {
+                        'hexagram_sequence_packed',
+                        'shannon_entropy', 'dominant_hexagram',
+                    }
+
+        super().save(*args, **kwargs)
+        self._loaded_hexagram_sequence = copy.copy(self.hexagram_sequence)
+
     def get_hexagram_diversity(self) -> float:
         """Calculate diversity of hexagrams in this pattern."""
-        if not self.hexagram_sequence:
-            return 0.0
-
-        from collections import Counter
-        import math
+        if self.shannon_entropy is None or self._hexagram_sequence_changed():
+            return self._compute_hexagram_diversity()
+        return self.shannon_entropy
 
-        counts = Counter(self.hexagram_sequence)
-        total = len(self.hexagram_sequence)
-
-        if total == 0:
+    def get_dominant_hexagram(self) -> int:
+        """Get the most frequent hexagram in this pattern."""
+        if self.dominant_hexagram is None or self._hexagram_sequence_changed():
+            return self._compute_dominant_hexagram()
+        return self.dominant_hexagram
+
+    def _hexagram_array(self) -> np.ndarray:
+        """hexagram_sequence as an int16 array, from the packed column if current."""
+        packed = self.hexagram_sequence_packed
+        if packed is not None and not self._hexagram_sequence_changed():
+            return np.frombuffer(packed, dtype=np.int16)
+        return np.asarray(self.hexagram_sequence or [], dtype=np.int16)
+
+    def _compute_hexagram_diversity(self, arr=None) -> float:
+        if arr is None:
+            arr = self._hexagram_array()
+        if arr.size == 0:
             return 0.0
 
-        shannon = 0.0
-        for count in counts.values():
-            proportion = count / total
-            shannon -= proportion * math.log(proportion)
-
-        return shannon
+        if arr.size < VECTORIZE_MIN_LENGTH:
+            return _py_shannon(arr.tolist())
 
-    def get_dominant_hexagram(self) -> int:
-        """Get the most frequent hexagram in this pattern."""
-        if not self.hexagram_sequence:
-            return 0
+        _, counts = np.unique(arr, return_counts=True)
+        return float(stats.entropy(counts))
 
-        from collections import Counter
-        counts = Counter(self.hexagram_sequence)
-        if not counts:
+    def _compute_dominant_hexagram(self, arr=None) -> int:
+        if arr is None:
+            arr = self._hexagram_array()
+        if arr.size == 0:
             return 0
 
-        return counts.most_common(1)[0][0]
+        # Hexagram numbers are bounded (0 marks an invalid codon, 1-64 valid)
+        return int(np.bincount(arr, minlength=65).argmax())
 
 
 class PatternMatch(models.Model):
@@ -1,22 +1,56 @@
 """
 API Key Model - API keys for third-party integrations
 """
-import secrets
+import base64
+import hashlib
+import os
+from datetime import datetime, timezone as dt_timezone
+
 from django.db import models
+from django.db.models import F
 from django.contrib.auth import get_user_model
 from django.utils import timezone
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
 
 User = get_user_model()
 
+# Redis hash per key holding usage not yet flushed to the database
+USAGE_BUFFER_PREFIX = 'apikey_usage:'
+
+
+def _token_urlsafe(nbytes: int) -> str:
+    """Equivalent of secrets.token_urlsafe without the extra call layers."""
+    return base64.urlsafe_b64encode(os.urandom(nbytes)).rstrip(b'=').decode('ascii')
+
 
 def generate_api_key():
-    """Generate a secure random API key."""
-    return secrets.token_urlsafe(32)
+    """Generate a secure random API key (43 characters)."""
+    return _token_urlsafe(32)
 
 
 def generate_api_key_prefix():
     """Generate a prefix for the API key (for identification)."""
-    return 'pgc_' + secrets.token_urlsafe(8)
+    return 'pgc_' + _token_urlsafe(8)
+
+
+class APIKeyManager(models.Manager):
+    """Manager that issues keys and looks them up by their hash."""
+
+    def create_key(self, **kwargs):
+        """
+        Create an API key.
+
+        Returns (api_key, plaintext); the plaintext is only available here
+        since just its hash is stored.
+        """
+        plaintext = generate_api_key()
+        api_key = self.create(key_hash=APIKey.hash_key(plaintext), **kwargs)
+        return api_key, plaintext
+
+    def get_by_key(self, plaintext: str):
+        """Look up an API key from the plaintext presented by a client."""
+        return self.get(key_hash=APIKey.hash_key(plaintext))
 
 
 class APIKey(models.Model):
@@ -40,17 +74,17 @@ class APIKey(models.Model):
         help_text='Name for this API key (e.g., "Mobile App", "Integration X")',
     )
 
-    # The actual key (stored hashed)
-    key = models.CharField(
-        max_length=255,
+    # SHA-256 hex digest of the key; the plaintext is never stored
+    key_hash = models.CharField(
+        max_length=64,
         unique=True,
-        default=generate_api_key,
-        help_text='The API key',
+        help_text='SHA-256 hash of the API key',
     )
 
     # Prefix for display (first few chars only)
+    # 'pgc_' + token_urlsafe(8) is 15 characters
     prefix = models.CharField(
-        max_length=20,
+        max_length=16,
         unique=True,
         default=generate_api_key_prefix,
         help_text='Key prefix for identification',
@@ -115,15 +149,15 @@ class APIKey(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = APIKeyManager()
+
     class Meta:
         verbose_name = 'API Key'
         verbose_name_plural = 'API Keys'
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['user']),
-            models.Index(fields=['prefix']),
             models.Index(fields=['is_active']),
-            models.Index(fields=['key']),
         ]
 
     def __str__(self):
@@ -138,12 +172,67 @@ class APIKey(models.Model):
         return True
 
     def record_usage(self, ip_address=None):
-        """Record that this key was used."""
-        self.total_requests += 1
-        self.last_used_at = timezone.now()
+        """
+        Record that this key was used.
+
+        Usage is buffered in Redis and written to the database in batches
+        by flush_buffered_usage(). If Redis is unavailable the row is
+        updated directly.
+        """
+        now = timezone.now()
+        usage = {'last_ts': now.timestamp()}
+        if ip_address:
+            usage['last_ip'] = ip_address
+
+        buffer_key = f'{USAGE_BUFFER_PREFIX}{self.pk}'
+        try:
+            pipe = get_redis_connection('default').pipeline()
+            pipe.hincrby(buffer_key, 'n', 1)
+            pipe.hset(buffer_key, mapping=usage)
+            pipe.execute()
+        except RedisError:
+            self._record_usage_direct(now, ip_address)
+
+    def _record_usage_direct(self, now, ip_address=None):
+        """Increment usage with a single atomic UPDATE (no read-modify-write)."""
+        updates = {
+            'total_requests': F('total_requests') + 1,
+            'last_used_at': now,
+        }
         if ip_address:
-            self.last_used_ip = ip_address
-        self.save(update_fields=['total_requests', 'last_used_at', 'last_used_ip'])
+            updates['last_used_ip'] = ip_address
+        APIKey.objects.filter(pk=self.pk).update(**updates)
+
+    @classmethod
+    def flush_buffered_usage(cls) -> int:
+        """Write buffered usage counters to the database; returns keys flushed."""
+        conn = get_redis_connection('default')
+        api_keys = []
+
+        for buffer_key in conn.scan_iter(match=f'{USAGE_BUFFER_PREFIX}*'):
+            # Read and clear atomically so concurrent increments are not lost
+            pipe = conn.pipeline()
+            pipe.hgetall(buffer_key)
+            pipe.delete(buffer_key)
+            usage, _ = pipe.execute()
+            if not usage:
+                continue
+
+            usage = {k.decode(): v.decode() for k, v in usage.items()}
+            pk = int(buffer_key.decode()[len(USAGE_BUFFER_PREFIX):])
+            api_keys.append(cls(
+                pk=pk,
+                total_requests=F('total_requests') + int(usage.get('n', 0)),
+                last_used_at=datetime.fromtimestamp(
+                    float(usage['last_ts']), tz=dt_timezone.utc
+                ),
+                last_used_ip=usage.get('last_ip') or F('last_used_ip'),
+            ))
+
+        cls.objects.bulk_update(
+            api_keys, ['total_requests', 'last_used_at', 'last_used_ip']
+        )
+        return len(api_keys)
 
     def has_scope(self, scope: str) -> bool:
         """Check if this key has a specific scope."""
@@ -157,7 +246,6 @@ class APIKey(models.Model):
     @staticmethod
     def hash_key(key: str) -> str:
         """Hash an API key for storage."""
-        import hashlib
         return hashlib.sha256(key.encode()).hexdigest()
 
     def revoke(self):
@@ -1,8 +1,37 @@
 """
 Codon Model - Represents DNA/RNA codons (triplets of nucleotides)
 """
-from django.db import models
-from django.core.validators import RegexValidator
+from itertools import product
+
+from django.db import models, transaction
+from django.core.exceptions import ValidationError
+
+# Translation tables built once at import
+_COMPLEMENT_DNA = str.maketrans('ATGC', 'TACG')
+_COMPLEMENT_RNA = str.maketrans('AUGC', 'UACG')
+_DNA_TO_RNA = str.maketrans('T', 'U')
+_RNA_TO_DNA = str.maketrans('U', 'T')
+
+# All 64 DNA and 64 RNA codons
+_VALID_DNA = frozenset(''.join(p) for p in product('ATGC', repeat=3))
+_VALID_RNA = frozenset(''.join(p) for p in product('AUGC', repeat=3))
+
+
+def validate_codon_sequence(value):
+    """Validate a codon is 3 nucleotides (ATGC for DNA, AUGC for RNA)."""
+    if value not in _VALID_DNA and value not in _VALID_RNA:
+        raise ValidationError(
+            'Codon must be 3 nucleotides (ATGC for DNA, AUGC for RNA)',
+            code='invalid',
+        )
+
+
+class CodonManager(models.Manager):
+    """Manager with query helpers for codons."""
+
+    def with_hexagram(self):
+        """Codons with their mapped hexagram fetched in the same query."""
+        return self.get_queryset().select_related('mapped_hexagram')
 
 
 class Codon(models.Model):
@@ -11,6 +40,9 @@ class Codon(models.Model):
 
     DNA nucleotides: A (Adenine), T (Thymine), G (Guanine), C (Cytosine)
     RNA nucleotides: A (Adenine), U (Uracil), G (Guanine), C (Cytosine)
+
+    Use Codon.objects.with_hexagram() when iterating codons and reading
+    mapped_hexagram, to avoid one query per codon.
     """
 
     class CodonType(models.TextChoices):
@@ -20,12 +52,7 @@ class Codon(models.Model):
     # The codon sequence (e.g., "ATG", "UAG")
     sequence = models.CharField(
         max_length=3,
-        validators=[
-            RegexValidator(
-                regex=r'^[ATGC]{3}$|^[AUGC]{3}$',
-                message='Codon must be 3 nucleotides (ATGC for DNA, AUGC for RNA)',
-            ),
-        ],
+        validators=[validate_codon_sequence],
         unique=True,
         help_text='Three-nucleotide sequence',
     )
@@ -88,6 +115,8 @@ class Codon(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = CodonManager()
+
     class Meta:
         ordering = ['sequence']
         verbose_name = 'Codon'
@@ -102,19 +131,55 @@ class Codon(models.Model):
     def __str__(self):
         return f"{self.sequence} ({self.codon_type}) -> {self.amino_acid}"
 
+    @classmethod
+    def seed_all(cls, rows):
+        """Insert codons from a list of field dicts, skipping existing ones."""
+        from .codon_sequence import reset_codon_table
+        cls.objects.bulk_create(
+            [cls(**row) for row in rows], batch_size=64, ignore_conflicts=True
+        )
+        transaction.on_commit(reset_codon_table)
+
     def to_rna(self):
         """Convert DNA codon to RNA (T -> U)"""
         if self.codon_type == self.CodonType.DNA:
-            return self.sequence.replace('T', 'U')
+            return self.sequence.translate(_DNA_TO_RNA)
         return self.sequence
 
     def to_dna(self):
         """Convert RNA codon to DNA (U -> T)"""
         if self.codon_type == self.CodonType.RNA:
-            return self.sequence.replace('U', 'T')
+            return self.sequence.translate(_RNA_TO_DNA)
         return self.sequence
 
     def get_complement(self):
-        """Get complementary DNA strand (A<->T, G<->C)"""
-        complement_map = {'A': 'T', 'T': 'A', 'G': 'C', 'C': 'G'}
-        return ''.join(complement_map.get(base, base) for base in self.sequence)
+        """Get complementary strand (A<->T or A<->U, G<->C)"""
+        if self.codon_type == self.CodonType.RNA:
+            return self.sequence.translate(_COMPLEMENT_RNA)
+        return self.sequence.translate(_COMPLEMENT_DNA)
+
+    @classmethod
+    def rna_and_complements(cls, codons):
+        """
+        to_rna() and get_complement() for many codons at once.
+
+        Returns:
+            Dict mapping codon pk to (rna_equivalent, complement); each
+            codon type is translated as one joined string
+        """
+        by_type = {}
+        for codon in codons:
+            by_type.setdefault(codon.codon_type, []).append(codon)
+
+        results = {}
+        for codon_type, group in by_type.items():
+            joined = ' '.join(codon.sequence for codon in group)
+            complement_table = (
+                _COMPLEMENT_RNA if codon_type == cls.CodonType.RNA else _COMPLEMENT_DNA
+            )
+            # RNA codons contain no T, so T -> U leaves them unchanged
+            rna = joined.translate(_DNA_TO_RNA).split(' ')
+            complements = joined.translate(complement_table).split(' ')
+            for codon, rna_seq, complement in zip(group, rna, complements):
+                results[codon.pk] = (rna_seq, complement)
+        return results
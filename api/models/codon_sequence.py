@@ -1,12 +1,38 @@
 """
 Codon Sequence Model - Represents DNA/RNA sequences
 """
+import hashlib
+
+import numpy as np
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.contrib.postgres.indexes import GinIndex
 from django.contrib.auth import get_user_model
 
+from api.utils import codon_kernels
+from .mapping import CodonHexagramMapping
+
 
 User = get_user_model()
 
+# Codon sequence -> amino acid code, loaded once (64 fixed rows)
+_CODON_TABLE = None
+_AMINO_ACID_LUT = None
+
+
+class CodonSequenceQuerySet(models.QuerySet):
+    """QuerySet with helpers for listing sequences."""
+
+    def list_lite(self):
+        """Sequences without the large sequence columns, for list views."""
+        return self.defer(
+            'raw_sequence_text',
+            'raw_sequence_packed',
+            'amino_acid_sequence',
+            'hexagram_sequence',
+        )
+
 
 class CodonSequence(models.Model):
     """
@@ -46,9 +72,36 @@ class CodonSequence(models.Model):
         help_text='Type of sequence (DNA or RNA)',
     )
 
-    # The raw sequence (must be multiple of 3 for complete codons)
-    raw_sequence = models.TextField(
-        help_text='Raw DNA/RNA sequence string',
+    # The raw sequence as text, only kept when it can't be packed (symbols
+    # other than A/C/G/T, or lowercase); read it through raw_sequence
+    raw_sequence_text = models.TextField(
+        null=True,
+        blank=True,
+        db_column='raw_sequence',
+        help_text='Raw DNA/RNA sequence string, when it is not packed',
+    )
+
+    # Uppercase ACGT sequences are stored only here, at 2 bits per base
+    raw_sequence_packed = models.BinaryField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text='Raw sequence packed 4 bases per byte',
+    )
+
+    # BLAKE2b digest of raw_sequence, for finding repeat analyses
+    sequence_hash = models.CharField(
+        max_length=32,
+        blank=True,
+        editable=False,
+        help_text='BLAKE2b-128 hex digest of raw_sequence',
+    )
+
+    # Binary mapping scheme used for hexagram_sequence
+    mapping_scheme = models.CharField(
+        max_length=20,
+        default='scheme_1',
+        help_text='Binary mapping scheme used for the analysis',
     )
 
     # Organism/source (e.g., "Homo sapiens", "E. coli")
@@ -122,50 +175,185 @@ class CodonSequence(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = CodonSequenceQuerySet.as_manager()
+
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'Codon Sequence'
         verbose_name_plural = 'Codon Sequences'
         indexes = [
-            models.Index(fields=['user']),
-            models.Index(fields=['sequence_type']),
+            # Per-user listings in default ordering (covers user alone)
+            models.Index(fields=['user', '-created_at']),
+            models.Index(
+                fields=['name'],
+                condition=models.Q(is_reference=True),
+                name='codonseq_reference_idx',
+            ),
             models.Index(fields=['gene_name']),
             models.Index(fields=['organism']),
+            models.Index(fields=['user', 'sequence_hash', 'mapping_scheme']),
+            # icontains search over the SearchFilter fields (requires pg_trgm)
+            GinIndex(
+                fields=['name', 'description', 'gene_name', 'organism'],
+                opclasses=['gin_trgm_ops'] * 4,
+                name='codonseq_search_gin',
+            ),
         ]
 
     def __str__(self):
         return f"{self.name} ({self.codon_count} codons)"
 
+    @property
+    def raw_sequence(self):
+        """Raw DNA/RNA sequence string (multiple of 3 for complete codons)"""
+        if self.raw_sequence_packed is None:
+            return self.raw_sequence_text or ''
+        cached = getattr(self, '_unpacked', None)
+        if cached is None or cached[0] is not self.raw_sequence_packed:
+            cached = (
+                self.raw_sequence_packed,
+                codon_kernels.decode_bases(
+                    codon_kernels.unpack_codes(self.raw_sequence_packed)
+                ),
+            )
+            self._unpacked = cached
+        return cached[1]
+
+    @raw_sequence.setter
+    def raw_sequence(self, value):
+        # Held as text until save() decides whether it can be packed
+        self.raw_sequence_text = value
+        self.raw_sequence_packed = None
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'raw_sequence' in update_fields:
+            sequence = self.raw_sequence
+            packed = codon_kernels.pack_codes(
+                codon_kernels.encode_bases(self._sequence_bytes())
+            )
+            # Only uppercase ACGT decodes back to the same string
+            if packed is not None and not sequence.isupper():
+                packed = None
+            self.raw_sequence_packed = packed
+            self.raw_sequence_text = None if packed is not None else sequence
+            self.sequence_hash = self.hash_sequence(sequence)
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) - {'raw_sequence'} | {
+                    'raw_sequence_text', 'raw_sequence_packed', 'sequence_hash',
+                }
+        super().save(*args, **kwargs)
+
+    @staticmethod
+    def hash_sequence(sequence):
+        """Hex digest used for sequence_hash"""
+        return hashlib.blake2b(sequence.encode(), digest_size=16).hexdigest()
+
     def calculate_gc_content(self):
         """Calculate GC content percentage"""
-        seq = self.raw_sequence.upper()
-        if len(seq) == 0:
+        buf = self._sequence_bytes()
+        if buf.size == 0:
             return 0.0
-        gc_count = seq.count('G') + seq.count('C')
-        return (gc_count / len(seq)) * 100
+        # OR-ing 0x20 folds ASCII case so one comparison covers 'G' and 'g'
+        folded = buf | np.uint8(0x20)
+        gc_count = np.count_nonzero((folded == ord('g')) | (folded == ord('c')))
+        return (gc_count / buf.size) * 100
+
+    def _sequence_bytes(self):
+        """raw_sequence as a uint8 array, memoized per sequence string."""
+        cached = getattr(self, '_seq_bytes', None)
+        if cached is None or cached[0] is not self.raw_sequence:
+            cached = (
+                self.raw_sequence,
+                np.frombuffer(
+                    self.raw_sequence.encode('ascii', 'replace'), dtype=np.uint8
+                ),
+            )
+            self._seq_bytes = cached
+        return cached[1]
+
+    def codon_array(self):
+        """Complete codons as an (n, 3) uint8 array of lowercase ASCII bytes"""
+        buf = self._sequence_bytes() | np.uint8(0x20)
+        return buf[:buf.size - buf.size % 3].reshape(-1, 3)
 
     def get_codons(self):
-        """Split sequence into codons"""
+        """Split sequence into codon strings (use codon_array() for NumPy code)"""
         seq = self.raw_sequence.upper()
         return [seq[i:i+3] for i in range(0, len(seq), 3)]
 
+    @classmethod
+    def _codon_table(cls):
+        """Return the codon -> amino acid code table, querying it only once."""
+        global _CODON_TABLE
+        if not _CODON_TABLE:
+            from .codon import Codon
+            _CODON_TABLE = dict(
+                Codon.objects.values_list('sequence', 'amino_acid_code')
+            )
+        return _CODON_TABLE
+
+    @classmethod
+    def _amino_acid_lut(cls):
+        """Return the codon index -> amino acid code lookup table."""
+        global _AMINO_ACID_LUT
+        if _AMINO_ACID_LUT is None or not _CODON_TABLE:
+            _AMINO_ACID_LUT = codon_kernels.build_amino_acid_lut(cls._codon_table())
+        return _AMINO_ACID_LUT
+
     def translate_to_amino_acids(self, codons):
         """Translate codons to amino acid sequence"""
-        from .codon import Codon
+        table = self._codon_table()
+        # 'X' marks an unknown amino acid
+        return ''.join([table.get(codon_seq, 'X') for codon_seq in codons])
+
+    # Fields written by compute_analysis()
+    ANALYSIS_FIELDS = [
+        'codon_count', 'gc_content', 'amino_acid_sequence', 'hexagram_sequence',
+    ]
 
-        amino_acids = []
-        for codon_seq in codons:
-            try:
-                codon = Codon.objects.get(sequence=codon_seq)
-                amino_acids.append(codon.amino_acid_code)
-            except Codon.DoesNotExist:
-                amino_acids.append('X')  # Unknown amino acid
-        return ''.join(amino_acids)
+    def _base_codes(self):
+        """2-bit base codes, unpacked straight from the packed column when there is one"""
+        if self.raw_sequence_packed is not None:
+            return codon_kernels.unpack_codes(self.raw_sequence_packed)
+        return codon_kernels.encode_bases(self._sequence_bytes())
+
+    def compute_analysis(self):
+        """Compute analysis results in memory without saving"""
+        codes = self._base_codes()
+        gc_count, codon_count, amino_acids = codon_kernels.scan(
+            codes, self._amino_acid_lut()
+        )
+        self.codon_count = codon_count
+        self.gc_content = (gc_count / codes.size) * 100 if codes.size else 0.0
+        self.amino_acid_sequence = amino_acids
+        hexagram_lut = CodonHexagramMapping.hexagram_lut()
+        # Invalid codons map to 0, the translator's invalid marker
+        self.hexagram_sequence = hexagram_lut[codon_kernels.codon_indices(codes)].tolist()
 
     def analyze(self):
         """Perform full analysis of the sequence"""
-        codons = self.get_codons()
-        self.codon_count = len(codons)
-        self.gc_content = self.calculate_gc_content()
-        self.amino_acid_sequence = self.translate_to_amino_acids(codons)
-        self.save()
+        self.compute_analysis()
+        if self._state.adding:
+            self.save()
+        else:
+            # Avoid rewriting raw_sequence and the other unchanged columns
+            self.save(update_fields=self.ANALYSIS_FIELDS + ['updated_at'])
+
+    @classmethod
+    def analyze_many(cls, sequences, batch_size=1000):
+        """Analyze saved sequences and persist results with batched UPDATEs"""
+        for sequence in sequences:
+            sequence.compute_analysis()
+        cls.objects.bulk_update(
+            sequences, fields=cls.ANALYSIS_FIELDS, batch_size=batch_size
+        )
+
+
+@receiver(post_save, sender='api.Codon')
+@receiver(post_delete, sender='api.Codon')
+def reset_codon_table(sender=None, **kwargs):
+    """Rebuild the cached codon and amino acid tables after codons change"""
+    global _CODON_TABLE, _AMINO_ACID_LUT
+    _CODON_TABLE = None
+    _AMINO_ACID_LUT = None
@@ -2,11 +2,26 @@
 Comment Model - Threaded comments on discussions
 """
 from django.db import models
+from django.db.models import F
+from django.db.models.expressions import RawSQL
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
 from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+
+from .discussion import Discussion
 
 User = get_user_model()
 
 
+class CommentQuerySet(models.QuerySet):
+    """QuerySet with helpers for listing comments."""
+
+    def with_related(self):
+        """Fetch the foreign keys shown in comment lists in the same query."""
+        return self.select_related('author', 'content_type', 'discussion', 'parent')
+
+
 class Comment(models.Model):
     """
     Threaded comments on discussions and other content.
@@ -25,6 +40,16 @@ class Comment(models.Model):
         help_text='ID of object being commented on',
     )
 
+    # Direct link for the common case of commenting on a discussion
+    discussion = models.ForeignKey(
+        'Discussion',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='comments_direct',
+        help_text='Discussion being commented on (set automatically)',
+    )
+
     # Author
     author = models.ForeignKey(
         User,
@@ -48,6 +73,12 @@ class Comment(models.Model):
         help_text='Parent comment (for threaded replies)',
     )
 
+    # Number of direct replies (denormalized for performance)
+    reply_count = models.IntegerField(
+        default=0,
+        help_text='Number of direct replies',
+    )
+
     # Voting
     upvotes = models.IntegerField(
         default=0,
@@ -96,14 +127,19 @@ class Comment(models.Model):
         help_text='Last time comment was edited',
     )
 
+    objects = CommentQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'Comment'
         verbose_name_plural = 'Comments'
         ordering = ['created_at']
         indexes = [
-            models.Index(fields=['content_type', 'object_id']),
+            # Comments on an object, newest first, served without a sort
+            models.Index(fields=['content_type', 'object_id', '-created_at']),
+            models.Index(fields=['discussion', '-created_at']),
             models.Index(fields=['author']),
-            models.Index(fields=['parent']),
+            # Replies in thread order (get_replies)
+            models.Index(fields=['parent', 'created_at']),
             models.Index(fields=['-created_at']),
             models.Index(fields=['-vote_score']),
         ]
@@ -112,15 +148,55 @@ class Comment(models.Model):
         preview = self.content[:50]
         return f"{self.author.username}: {preview}..."
 
+    def save(self, *args, **kwargs):
+        if self._state.adding and self.discussion_id is None:
+            if self.content_type_id == ContentType.objects.get_for_model(Discussion).pk:
+                self.discussion_id = self.object_id
+        is_new_reply = self._state.adding and self.parent_id is not None
+        super().save(*args, **kwargs)
+        if is_new_reply:
+            Comment.objects.filter(pk=self.parent_id).update(
+                reply_count=F('reply_count') + 1
+            )
+
     def get_replies(self):
         """Get all replies to this comment."""
         return Comment.objects.filter(parent=self, is_removed=False)
 
     def get_thread(self):
         """Get all comments in thread (this comment and all replies)."""
-        thread = [self]
-        for reply in self.get_replies():
-            thread.extend(reply.get_thread())
+        # Fetch the whole subtree with one recursive CTE instead of one
+        # query per comment, then restore depth-first order in Python
+        table = Comment._meta.db_table
+        descendant_ids = RawSQL(
+            f"""
+            WITH RECURSIVE thread(id) AS (
+                SELECT id FROM {table} WHERE parent_id = %s AND is_removed = %s
+                UNION ALL
+                SELECT c.id FROM {table} c
+                JOIN thread t ON c.parent_id = t.id
+                WHERE c.is_removed = %s
+            )
+            SELECT id FROM thread
+            """,
+            (self.pk, False, False),
+        )
+        replies = (
+            Comment.objects.filter(pk__in=descendant_ids)
+            .select_related('author')
+            .order_by('created_at', 'pk')
+        )
+
+        children = {}
+        for reply in replies:
+            children.setdefault(reply.parent_id, []).append(reply)
+
+        thread = []
+        stack = [self]
+        while stack:
+            comment = stack.pop()
+            thread.append(comment)
+            stack.extend(reversed(children.get(comment.pk, [])))
         return thread
 
     def mark_as_edited(self):
@@ -128,3 +204,12 @@ class Comment(models.Model):
         from django.utils import timezone
         self.edited_at = timezone.now()
         self.save(update_fields=['edited_at'])
+
+
+@receiver(post_delete, sender=Comment)
+def decrement_parent_reply_count(sender, instance, **kwargs):
+    """Keep the parent's reply_count in sync when a reply is deleted."""
+    if instance.parent_id is not None:
+        Comment.objects.filter(pk=instance.parent_id).update(
+            reply_count=F('reply_count') - 1
+        )
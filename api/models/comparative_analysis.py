@@ -1,13 +1,72 @@
 """
 Comparative Analysis Model - Stores results of sequence and mapping scheme comparisons
 """
+import hashlib
+import uuid
+
 from django.db import models
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex
 from django.core.validators import MinValueValidator, MaxValueValidator
 
+from .fields import CompressedJSONField
+
 User = get_user_model()
 
 
+class SequenceBlob(models.Model):
+    """
+    Deduplicated sequence text referenced by comparative analyses.
+    """
+
+    # BLAKE2b-128 digest of the content
+    hash = models.BinaryField(
+        max_length=16,
+        unique=True,
+        help_text='BLAKE2b digest of the sequence',
+    )
+
+    content = models.TextField(
+        help_text='Sequence text',
+    )
+
+    length = models.PositiveIntegerField(
+        help_text='Sequence length',
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = 'Sequence Blob'
+        verbose_name_plural = 'Sequence Blobs'
+
+    def __str__(self):
+        return f"Sequence {bytes(self.hash).hex()} ({self.length}bp)"
+
+    @classmethod
+    def intern(cls, content: str) -> 'SequenceBlob':
+        """Get or create the blob holding content."""
+        digest = hashlib.blake2b(content.encode(), digest_size=16).digest()
+        blob, _ = cls.objects.get_or_create(
+            hash=digest,
+            defaults={'content': content, 'length': len(content)},
+        )
+        return blob
+
+
+class ComparativeAnalysisQuerySet(models.QuerySet):
+    """QuerySet with helpers for listing analyses."""
+
+    def list_lite(self):
+        """Analyses without the input sequences and results, for list views."""
+        return self.defer(
+            'results',
+            'sequence1',
+            'sequence2',
+            'additional_sequences',
+        )
+
+
 class ComparativeAnalysis(models.Model):
     """
     Stores results from comparative analyses.
@@ -27,6 +86,14 @@ class ComparativeAnalysis(models.Model):
         CONSERVED_REGIONS = 'conserved_regions', 'Conserved Regions'
         CUSTOM = 'custom', 'Custom Comparison'
 
+    # Public identifier, allocated before the row is written
+    uuid = models.UUIDField(
+        default=uuid.uuid4,
+        unique=True,
+        editable=False,
+        help_text='Stable identifier returned when the analysis is saved',
+    )
+
     # User who created this analysis
     user = models.ForeignKey(
         User,
@@ -42,14 +109,34 @@ class ComparativeAnalysis(models.Model):
         help_text='Type of comparative analysis',
     )
 
-    # Sequences being compared (stored as semicolon-separated)
+    # Sequences being compared. New rows keep the text in SequenceBlob and
+    # leave these columns empty; use get_sequence1()/get_sequence2().
     sequence1 = models.TextField(
-        help_text='First genetic sequence',
+        blank=True,
+        help_text='First genetic sequence (legacy rows)',
     )
 
     sequence2 = models.TextField(
         blank=True,
-        help_text='Second genetic sequence (if applicable)',
+        help_text='Second genetic sequence (legacy rows)',
+    )
+
+    sequence1_blob = models.ForeignKey(
+        SequenceBlob,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name='+',
+        help_text='Stored first sequence',
+    )
+
+    sequence2_blob = models.ForeignKey(
+        SequenceBlob,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name='+',
+        help_text='Stored second sequence',
     )
 
     # Additional sequences for multi-sequence analysis
@@ -78,8 +165,8 @@ class ComparativeAnalysis(models.Model):
     )
 
     # Comparison results (flexible JSON structure)
-    results = models.JSONField(
-        help_text='Detailed comparison results',
+    results = CompressedJSONField(
+        help_text='Detailed comparison results (zlib-compressed JSON)',
     )
 
     # Summary metrics
@@ -97,6 +184,15 @@ class ComparativeAnalysis(models.Model):
         help_text='Percentage of matching hexagrams',
     )
 
+    # results['differences_count'] promoted to a column for DB-side filtering
+    differences_count = models.IntegerField(
+        null=True,
+        blank=True,
+        db_index=True,
+        editable=False,
+        help_text='Number of differing hexagrams (from results)',
+    )
+
     # Statistical test results (if applicable)
     test_type = models.CharField(
         max_length=50,
@@ -166,6 +262,8 @@ class ComparativeAnalysis(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ComparativeAnalysisQuerySet.as_manager()
+
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'Comparative Analysis'
@@ -175,6 +273,9 @@ class ComparativeAnalysis(models.Model):
             models.Index(fields=['analysis_type', 'is_public']),
             models.Index(fields=['created_at']),
             models.Index(fields=['similarity_score']),
+            # JSON containment lookups (e.g. tags__contains=[...])
+            GinIndex(fields=['tags'], name='ca_tags_gin'),
+            GinIndex(fields=['mapping_schemes'], name='ca_schemes_gin'),
         ]
 
     def __str__(self):
@@ -183,15 +284,58 @@ class ComparativeAnalysis(models.Model):
             return f"{name} (similarity: {self.similarity_score:.2f})"
         return name
 
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+
+        # Move sequence text into shared blobs; the row keeps only the FK
+        texts = {}
+        for field in ('sequence1', 'sequence2'):
+            if update_fields is not None and field not in update_fields:
+                continue
+            text = getattr(self, field)
+            if text:
+                setattr(self, f'{field}_blob', SequenceBlob.intern(text))
+                texts[field] = text
+                setattr(self, field, '')
+                if update_fields is not None:
+                    update_fields = kwargs['update_fields'] = set(update_fields) | {f'{field}_blob'}
+
+        if update_fields is None or 'results' in update_fields:
+            self.differences_count = (
+                self.results.get('differences_count')
+                if isinstance(self.results, dict) else None
+            )
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {'differences_count'}
+        try:
+            super().save(*args, **kwargs)
+        finally:
+            for field, text in texts.items():
+                setattr(self, field, text)
+
+    def get_sequence1(self) -> str:
+        """First sequence, from the blob or a legacy row."""
+        if self.sequence1 or self.sequence1_blob_id is None:
+            return self.sequence1
+        return self.sequence1_blob.content
+
+    def get_sequence2(self) -> str:
+        """Second sequence, from the blob or a legacy row."""
+        if self.sequence2 or self.sequence2_blob_id is None:
+            return self.sequence2
+        return self.sequence2_blob.content
+
     def get_sequence_count(self) -> int:
         """Get the number of sequences in this analysis."""
-        count = 1 if self.sequence1 else 0
-        count += 1 if self.sequence2 else 0
+        count = 1 if self.sequence1 or self.sequence1_blob_id else 0
+        count += 1 if self.sequence2 or self.sequence2_blob_id else 0
         count += len(self.additional_sequences) if self.additional_sequences else 0
         return count
 
     def get_hexagram_difference_count(self) -> int:
         """Get the number of differing hexagrams."""
+        if self.differences_count is not None:
+            return self.differences_count
         if self.results and 'differences_count' in self.results:
             return self.results['differences_count']
         return 0
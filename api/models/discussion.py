@@ -1,13 +1,41 @@
 """
 Discussion Model - Community discussion threads
 """
+import re
+
 from django.db import models
+from django.db.models import Count, F, Q
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from django.utils.text import slugify
 
 User = get_user_model()
 
+# ASCII characters slugify() drops: everything except word chars, whitespace and '-'
+_SLUG_DELETE = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128))
+    if not (c.isalnum() or c in '_-' or c.isspace())
+))
+_SLUG_SEPARATOR_RE = re.compile(r'[-\s]+')
+
+
+def _fast_slug(title):
+    """slugify() with a shortcut for ASCII titles, truncated to 50 chars."""
+    if title.isascii():
+        slug = _SLUG_SEPARATOR_RE.sub('-', title.lower().translate(_SLUG_DELETE))
+        return slug.strip('-_')[:50]
+    return slugify(title)[:50]
+
+
+class DiscussionQuerySet(models.QuerySet):
+    """QuerySet with helpers for listing discussions."""
+
+    def with_related(self):
+        """Fetch the foreign keys shown in discussion lists in the same query."""
+        return self.select_related(
+            'author', 'last_comment_by', 'linked_hexagram', 'linked_mapping',
+        )
+
 
 class Discussion(models.Model):
     """
@@ -132,6 +160,16 @@ class Discussion(models.Model):
     )
 
     # Voting
+    upvotes = models.IntegerField(
+        default=0,
+        help_text='Number of upvotes',
+    )
+
+    downvotes = models.IntegerField(
+        default=0,
+        help_text='Number of downvotes',
+    )
+
     vote_score = models.IntegerField(
         default=0,
         help_text='Net vote score (upvotes - downvotes)',
@@ -141,6 +179,8 @@ class Discussion(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = DiscussionQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'Discussion'
         verbose_name_plural = 'Discussions'
@@ -160,29 +200,64 @@ class Discussion(models.Model):
     def save(self, *args, **kwargs):
         # Generate slug from title if not provided
         if not self.slug:
-            base_slug = slugify(self.title)[:50]
-            unique_slug = base_slug
-            counter = 1
-            while Discussion.objects.filter(slug=unique_slug).exists():
-                unique_slug = f"{base_slug}-{counter}"
-                counter += 1
-            self.slug = unique_slug
+            base_slug = self._base_slug()
+            taken = self._taken_slugs([base_slug])
+            self.slug = self._next_free_slug(base_slug, taken)
         super().save(*args, **kwargs)
 
+    @classmethod
+    def bulk_create_with_slugs(cls, discussions, batch_size=10000):
+        """
+        Bulk create discussions, assigning unique slugs where missing.
+
+        Existing slugs are fetched in a single query rather than one
+        existence check per candidate slug.
+        """
+        pending = [d for d in discussions if not d.slug]
+        bases = [d._base_slug() for d in pending]
+        taken = cls._taken_slugs(set(bases))
+        taken.update(d.slug for d in discussions if d.slug)
+        for discussion, base_slug in zip(pending, bases):
+            discussion.slug = cls._next_free_slug(base_slug, taken)
+            taken.add(discussion.slug)
+        return cls.objects.bulk_create(discussions, batch_size=batch_size)
+
+    def _base_slug(self):
+        return _fast_slug(self.title)
+
+    @classmethod
+    def _taken_slugs(cls, base_slugs):
+        """Existing slugs equal to, or suffixed from, any of the base slugs."""
+        query = Q()
+        for base_slug in base_slugs:
+            query |= Q(slug=base_slug) | Q(slug__startswith=f"{base_slug}-")
+        if not query:
+            return set()
+        return set(cls.objects.filter(query).values_list('slug', flat=True))
+
+    @staticmethod
+    def _next_free_slug(base_slug, taken):
+        if base_slug not in taken:
+            return base_slug
+        counter = 1
+        while f"{base_slug}-{counter}" in taken:
+            counter += 1
+        return f"{base_slug}-{counter}"
+
     def get_absolute_url(self):
         """Get URL for this discussion."""
         return reverse('discussion-detail', kwargs={'slug': self.slug})
 
     def increment_view_count(self):
         """Increment view count."""
+        # Atomic UPDATE; also leaves updated_at untouched on every view
+        Discussion.objects.filter(pk=self.pk).update(view_count=F('view_count') + 1)
         self.view_count += 1
-        self.save(update_fields=['view_count'])
 
     def update_participant_count(self):
         """Recalculate participant count."""
-        from api.models import Comment
-        participants = Comment.objects.filter(
-            discussion=self
-        ).values_list('author', flat=True).distinct()
-        self.participant_count = participants.count() + 1  # +1 for author
+        participants = self.comments_direct.filter(
+            is_removed=False,
+        ).aggregate(n=Count('author', distinct=True))['n']
+        self.participant_count = participants + 1  # +1 for author
         self.save(update_fields=['participant_count'])
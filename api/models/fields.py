@@ -0,0 +1,42 @@
+"""
+Custom model fields
+"""
+import json
+import zlib
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+# zlib level 6 is the library default: most of the ratio at a fraction of level 9's cost
+COMPRESSION_LEVEL = 6
+
+
+class CompressedJSONField(models.BinaryField):
+    """
+    JSON value stored as zlib-compressed bytes.
+
+    Reads and writes plain Python objects like JSONField, but the column
+    holds compact JSON compressed with zlib. Not queryable by key; use it
+    for large result blobs that are only ever loaded whole.
+    """
+
+    description = 'Compressed JSON'
+
+    def get_prep_value(self, value):
+        if value is None:
+            return None
+        encoded = json.dumps(value, cls=DjangoJSONEncoder, separators=(',', ':'))
+        return zlib.compress(encoded.encode(), COMPRESSION_LEVEL)
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return None
+        return json.loads(zlib.decompress(value))
+
+    def to_python(self, value):
+        if isinstance(value, (bytes, memoryview)):
+            return json.loads(zlib.decompress(value))
+        return value
+
+    def value_to_string(self, obj):
+        return json.dumps(self.value_from_object(obj), cls=DjangoJSONEncoder)
@@ -1,7 +1,20 @@
 """
 Hexagram Model - Represents I Ching (易經) hexagrams
 """
-from django.db import models
+from functools import cached_property
+
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.contrib.postgres.indexes import GinIndex
+
+# Unicode hexagram characters (U+4DC0 to U+4DFF) in King Wen order
+_UNICHARS = tuple(chr(0x4DC0 + i) for i in range(64))
+
+_INVERT_LINES = str.maketrans('01', '10')
+
+# Hexagram number -> Hexagram, loaded once (64 fixed rows)
+_HEXAGRAM_BY_NUMBER = None
 
 
 class Hexagram(models.Model):
@@ -28,6 +41,14 @@ class Hexagram(models.Model):
         help_text='Binary representation (bottom line to top line)',
     )
 
+    # Integer value of binary, kept in sync on save
+    binary_int = models.PositiveSmallIntegerField(
+        unique=True,
+        null=True,
+        editable=False,
+        help_text='Integer value of the binary representation (0-63)',
+    )
+
     # Chinese name (traditional and simplified)
     name_chinese = models.CharField(
         max_length=10,
@@ -120,22 +141,31 @@ class Hexagram(models.Model):
         verbose_name = 'Hexagram'
         verbose_name_plural = 'Hexagrams'
         indexes = [
-            models.Index(fields=['number']),
-            models.Index(fields=['binary']),
+            # Keyword containment lookups (keywords__contains=[...])
+            GinIndex(fields=['keywords'], name='hexagram_keywords_gin'),
         ]
 
     def __str__(self):
         return f"Hexagram {self.number}: {self.name_chinese} ({self.name_english})"
 
+    def save(self, *args, **kwargs):
+        self.binary_int = int(self.binary, 2)
+        for attr in ('lines_array', 'yang_lines', 'yin_lines'):
+            self.__dict__.pop(attr, None)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'binary' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {'binary_int'}
+        super().save(*args, **kwargs)
+
     def get_lines_array(self):
         """Return lines as array of integers (bottom to top)"""
-        return [int(self.line1), int(self.line2), int(self.line3),
-                int(self.line4), int(self.line5), int(self.line6)]
+        value = self.get_binary_value()
+        # Line 1 is the first (most significant) character of binary
+        return [(value >> shift) & 1 for shift in range(5, -1, -1)]
 
     def get_yang_lines(self):
         """Return count of yang lines"""
-        lines = self.get_lines_array()
-        return sum(lines)
+        return self.get_binary_value().bit_count()
 
     def get_yin_lines(self):
         """Return count of yin lines"""
@@ -147,10 +177,79 @@ class Hexagram(models.Model):
 
     def get_binary_value(self):
         """Return binary representation as integer"""
-        return int(self.binary, 2)
+        if self.binary_int is not None:
+            return self.binary_int
+        cached = getattr(self, '_binary_value', None)
+        if cached is None or cached[0] != self.binary:
+            cached = (self.binary, int(self.binary, 2))
+            self._binary_value = cached
+        return cached[1]
 
     def get_hexagram_unicode(self):
         """Return Unicode character for hexagram (if available)"""
-        # Unicode hexagram range: U+4DC0 to U+4DFF
-        unicode_offset = 0x4DC0
-        return chr(unicode_offset + self.number - 1)
+        return _UNICHARS[self.number - 1]
+
+    @cached_property
+    def lines_array(self):
+        """Lines as integers, computed once per instance"""
+        return self.get_lines_array()
+
+    @cached_property
+    def yang_lines(self):
+        """Yang line count, computed once per instance"""
+        return self.get_yang_lines()
+
+    @cached_property
+    def yin_lines(self):
+        """Yin line count, computed once per instance"""
+        return 6 - self.yang_lines
+
+    @property
+    def unicode_char(self):
+        return _UNICHARS[self.number - 1]
+
+    @classmethod
+    def seed_all(cls, rows):
+        """
+        Insert hexagrams from a list of field dicts, skipping existing ones.
+
+        Nuclear/opposite links are resolved afterwards in one batched update.
+        """
+        hexagrams = [cls(**row) for row in rows]
+        for hexagram in hexagrams:
+            hexagram.binary_int = int(hexagram.binary, 2)
+        cls.objects.bulk_create(hexagrams, batch_size=64, ignore_conflicts=True)
+        cls.link_related_hexagrams()
+        transaction.on_commit(reset_hexagram_by_number)
+
+    @classmethod
+    def link_related_hexagrams(cls):
+        """Set nuclear_hexagram and opposite_hexagram for all hexagrams."""
+        hexagrams = list(cls.objects.all())
+        by_binary = {h.binary: h for h in hexagrams}
+        for hexagram in hexagrams:
+            binary = hexagram.binary
+            # Nuclear: lines 2-4 as lower trigram, lines 3-5 as upper trigram
+            hexagram.nuclear_hexagram = by_binary.get(binary[1:4] + binary[2:5])
+            hexagram.opposite_hexagram = by_binary.get(
+                binary.translate(_INVERT_LINES)
+            )
+        cls.objects.bulk_update(
+            hexagrams, ['nuclear_hexagram', 'opposite_hexagram'], batch_size=64
+        )
+
+    @classmethod
+    def by_number(cls):
+        """Return a {number: Hexagram} dict, querying the table only once."""
+        global _HEXAGRAM_BY_NUMBER
+        if not _HEXAGRAM_BY_NUMBER:
+            _HEXAGRAM_BY_NUMBER = cls.objects.in_bulk(field_name='number')
+        return _HEXAGRAM_BY_NUMBER
+
+
+@receiver(post_save, sender=Hexagram)
+@receiver(post_delete, sender=Hexagram)
+def reset_hexagram_by_number(sender=None, **kwargs):
+    """Reload the cached number lookup after hexagrams change"""
+    global _HEXAGRAM_BY_NUMBER
+    _HEXAGRAM_BY_NUMBER = None
@@ -2,11 +2,35 @@
 Codon-Hexagram Mapping Model - Stores mapping schemes between codons and hexagrams
 """
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.contrib.auth import get_user_model
+from django.utils.functional import cached_property
+
+from api.utils import codon_kernels
 
 
 User = get_user_model()
 
+# Codon index -> hexagram number for the active mapping, built on first use
+_HEXAGRAM_LUT = None
+
+# Number of possible standard codons (4 ** 3)
+POSSIBLE_CODON_COUNT = 64
+
+# 2-bit nucleotide codes used to index BINARY mapping tables
+_NT = {'A': 0, 'C': 1, 'G': 2, 'T': 3}
+
+
+def _rules_to_dict(rules):
+    """codon -> hexagram dict from either mapping_rules shape (first rule wins)"""
+    if isinstance(rules, dict):
+        return dict(rules)
+    index = {}
+    for rule in rules:
+        index.setdefault(rule.get('codon'), rule.get('hexagram'))
+    return index
+
 
 class CodonHexagramMapping(models.Model):
     """
@@ -78,7 +102,7 @@ class CodonHexagramMapping(models.Model):
     )
 
     # Mapping rules (stored as JSON for flexibility)
-    # Format: [{"codon": "ATG", "hexagram": 1}, ...]
+    # Format: [{"codon": "ATG", "hexagram": 1}, ...] or {"ATG": 1, ...}
     mapping_rules = models.JSONField(
         default=list,
         help_text='Array of codon-to-hexagram mappings',
@@ -131,6 +155,16 @@ class CodonHexagramMapping(models.Model):
     # ========== Community Features (Phase 4) ==========
 
     # Voting
+    upvotes = models.IntegerField(
+        default=0,
+        help_text='Number of upvotes',
+    )
+
+    downvotes = models.IntegerField(
+        default=0,
+        help_text='Number of downvotes',
+    )
+
     vote_score = models.IntegerField(
         default=0,
         help_text='Net vote score (upvotes - downvotes)',
@@ -168,19 +202,90 @@ class CodonHexagramMapping(models.Model):
         active_str = " [ACTIVE]" if self.is_active else ""
         return f"{self.name} ({self.mapping_type}){active_str}"
 
+    def save(self, *args, **kwargs):
+        # mapping_rules may have changed since the lookup tables were built
+        for name in ('_rule_index', '_binary_table', '_hexagram_array'):
+            self.__dict__.pop(name, None)
+        super().save(*args, **kwargs)
+
+    @cached_property
+    def _rule_index(self):
+        """codon -> hexagram dict, parsed from mapping_rules once per instance"""
+        return _rules_to_dict(self.mapping_rules)
+
+    @cached_property
+    def _binary_table(self):
+        """64-entry list indexed by the codon's 6-bit code"""
+        table = [None] * POSSIBLE_CODON_COUNT
+        for codon, hexagram in self._rule_index.items():
+            index = codon_kernels.codon_index(str(codon))
+            if index != codon_kernels.INVALID_CODON:
+                table[index] = hexagram
+        return table
+
+    @cached_property
+    def _hexagram_array(self):
+        """uint8 codon index -> hexagram table for NumPy lookups (0 if unmapped)"""
+        return codon_kernels.build_hexagram_lut(self._rule_index)
+
+    def get_rules_map(self):
+        """Copy of the codon -> hexagram dict"""
+        return dict(self._rule_index)
+
     def get_hexagram_for_codon(self, codon_sequence):
         """Get the hexagram number for a given codon sequence"""
-        for rule in self.mapping_rules:
-            if rule.get('codon') == codon_sequence:
-                return rule.get('hexagram')
-        return None
+        if self.mapping_type == self.MappingType.BINARY:
+            try:
+                c1, c2, c3 = codon_sequence
+                return self._binary_table[(_NT[c1] << 4) | (_NT[c2] << 2) | _NT[c3]]
+            except (KeyError, ValueError):
+                return None
+        return self._rule_index.get(codon_sequence)
+
+    def translate_sequence(self, codons):
+        """Map a list of codon sequences to hexagram numbers (None if unmapped)"""
+        lookup = self._rule_index.get
+        return [lookup(codon) for codon in codons]
+
+    def translate_codes(self, codes):
+        """
+        Map a base code array (see codon_kernels) to hexagram numbers.
+
+        Returns:
+            uint8 array with one entry per complete codon, 0 if unmapped
+        """
+        return self._hexagram_array[codon_kernels.codon_indices(codes)]
+
+    @classmethod
+    def hexagram_lut(cls):
+        """
+        Codon index -> hexagram number table of the active mapping.
+
+        Falls back to the default binary scheme when no mapping is active.
+        """
+        global _HEXAGRAM_LUT
+        if _HEXAGRAM_LUT is None:
+            active = cls.objects.filter(is_active=True).values_list(
+                'mapping_rules', flat=True
+            ).first()
+            if active:
+                _HEXAGRAM_LUT = codon_kernels.build_hexagram_lut(_rules_to_dict(active))
+            else:
+                from genetic_engine.codon_translator import CodonTranslator
+                _HEXAGRAM_LUT = codon_kernels.binary_hexagram_lut(
+                    CodonTranslator.BINARY_SCHEMES['scheme_1']
+                )
+        return _HEXAGRAM_LUT
 
     def calculate_coverage(self):
         """Calculate percentage of possible codons mapped"""
-        from .codon import Codon
-        total_codons = Codon.objects.count()
-        if total_codons == 0:
-            self.coverage = 0.0
-        else:
-            self.coverage = (self.total_mappings / total_codons) * 100
-        self.save()
+        self.coverage = (self.total_mappings / POSSIBLE_CODON_COUNT) * 100
+        self.save(update_fields=['coverage', 'updated_at'])
+
+
+@receiver(post_save, sender=CodonHexagramMapping)
+@receiver(post_delete, sender=CodonHexagramMapping)
+def reset_hexagram_lut(sender, **kwargs):
+    """Rebuild the cached hexagram table after mappings change"""
+    global _HEXAGRAM_LUT
+    _HEXAGRAM_LUT = None
@@ -2,11 +2,45 @@
 Notification Model - User notifications for community activity
 """
 from django.db import models
+from django.db.models import Q
 from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.utils import timezone
+
+from .comment import Comment
+from .discussion import Discussion
+from .mapping import CodonHexagramMapping
+from .vote import direct_target_kwargs, single_target_constraint
 
 User = get_user_model()
 
 
+class NotificationQuerySet(models.QuerySet):
+    """QuerySet with helpers for listing notifications."""
+
+    def with_related(self):
+        """Fetch the foreign keys shown in notification lists in the same query."""
+        return self.select_related('recipient', 'actor', 'content_type')
+
+    def with_targets(self):
+        """Also fetch the related objects: joined for explicit targets, else prefetched."""
+        return self.with_related().select_related(
+            'comment__author', 'discussion__author', 'mapping__created_by'
+        ).prefetch_related('content_object')
+
+    def mark_all_read(self, user):
+        """Mark all of a user's unread notifications as read in one UPDATE."""
+        return self.filter(recipient=user, is_read=False).update(
+            is_read=True, read_at=timezone.now()
+        )
+
+    def mark_ids_read(self, user, ids):
+        """Mark the given notifications of a user as read in one UPDATE."""
+        return self.filter(recipient=user, pk__in=ids, is_read=False).update(
+            is_read=True, read_at=timezone.now()
+        )
+
+
 class Notification(models.Model):
     """
     User notifications for community activity.
@@ -35,6 +69,7 @@ class Notification(models.Model):
         User,
         on_delete=models.CASCADE,
         related_name='notifications',
+        db_index=False,  # Leading column of the composite indexes below
         help_text='User receiving the notification',
     )
 
@@ -61,6 +96,7 @@ class Notification(models.Model):
         on_delete=models.CASCADE,
         null=True,
         blank=True,
+        db_index=False,  # Covered by the (content_type, object_id) index
         help_text='Type of related object',
     )
 
@@ -70,6 +106,36 @@ class Notification(models.Model):
         help_text='ID of related object',
     )
 
+    content_object = GenericForeignKey('content_type', 'object_id')
+
+    # Explicit targets for the common related models, so they can be joined
+    comment = models.ForeignKey(
+        Comment,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='+',
+        help_text='Related comment (set automatically)',
+    )
+
+    discussion = models.ForeignKey(
+        Discussion,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='+',
+        help_text='Related discussion (set automatically)',
+    )
+
+    mapping = models.ForeignKey(
+        CodonHexagramMapping,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='+',
+        help_text='Related mapping (set automatically)',
+    )
+
     # Content
     title = models.CharField(
         max_length=255,
@@ -112,26 +178,46 @@ class Notification(models.Model):
     # Metadata
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = NotificationQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'Notification'
         verbose_name_plural = 'Notifications'
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['recipient', '-created_at']),
-            models.Index(fields=['recipient', 'is_read']),
+            models.Index(fields=['recipient', 'is_read', '-created_at']),
+            # Unread badge counts and lists; most notifications end up read
+            models.Index(
+                fields=['recipient', '-created_at'],
+                condition=Q(is_read=False),
+                name='notif_unread_partial',
+            ),
             models.Index(fields=['-created_at']),
+            # Reverse lookups through the generic relation
+            models.Index(fields=['content_type', 'object_id']),
         ]
+        constraints = [single_target_constraint('notification_single_target')]
 
     def __str__(self):
         return f"{self.recipient.username}: {self.title}"
 
+    @property
+    def target(self):
+        """Related object, read from the explicit FK columns when possible."""
+        return self.comment or self.discussion or self.mapping or self.content_object
+
     def mark_as_read(self):
         """Mark notification as read."""
-        from django.utils import timezone
-        if not self.is_read:
+        if self.is_read:
+            return
+        read_at = timezone.now()
+        updated = Notification.objects.filter(pk=self.pk, is_read=False).update(
+            is_read=True, read_at=read_at
+        )
+        if updated:
             self.is_read = True
-            self.read_at = timezone.now()
-            self.save(update_fields=['is_read', 'read_at'])
+            self.read_at = read_at
 
     @classmethod
     def create_notification(cls, recipient, notification_type, title, message, url='', actor=None, content_object=None):
@@ -140,10 +226,12 @@ class Notification(models.Model):
 
         content_type = None
         object_id = None
+        target_kwargs = {}
 
         if content_object:
             content_type = ContentType.objects.get_for_model(content_object)
             object_id = content_object.pk
+            target_kwargs = direct_target_kwargs(content_object)
 
         return Notification.objects.create(
             recipient=recipient,
@@ -153,5 +241,36 @@ class Notification(models.Model):
             url=url,
             actor=actor,
             content_type=content_type,
-            object_id=object_id
+            object_id=object_id,
+            **target_kwargs
         )
+
+    @classmethod
+    def bulk_create_notifications(cls, recipients, notification_type, title, message, url='', actor=None, content_object=None):
+        """Create the same notification for many recipients in batched INSERTs."""
+        from django.contrib.contenttypes.models import ContentType
+
+        content_type = None
+        object_id = None
+        target_kwargs = {}
+
+        if content_object:
+            content_type = ContentType.objects.get_for_model(content_object)
+            object_id = content_object.pk
+            target_kwargs = direct_target_kwargs(content_object)
+
+        notifications = [
+            cls(
+                recipient=recipient,
+                notification_type=notification_type,
+                title=title,
+                message=message,
+                url=url,
+                actor=actor,
+                content_type=content_type,
+                object_id=object_id,
+                **target_kwargs
+            )
+            for recipient in recipients
+        ]
+        return cls.objects.bulk_create(notifications, batch_size=500)
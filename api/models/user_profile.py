@@ -1,12 +1,28 @@
 """
 User Profile Model - Extended user information for community features
 """
-from django.db import models
+from bisect import bisect_right
+
+from django.db import connection, models, transaction
+from django.db.models import Case, F, Value, When
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex
 from django.core.validators import MinValueValidator, MaxValueValidator
 
 User = get_user_model()
 
+# Counters that increment_stat() may touch
+_INCREMENTABLE_STATS = frozenset({
+    'sequences_shared',
+    'mappings_created',
+    'discussions_started',
+    'comments_posted',
+})
+
+# Reputation levels and the scores at which the next level starts
+_REPUTATION_THRESHOLDS = (10, 50, 150, 500, 1000)
+_REPUTATION_LEVELS = ('Newcomer', 'Contributor', 'Researcher', 'Expert', 'Master', 'Grandmaster')
+
 
 class UserProfile(models.Model):
     """
@@ -69,6 +85,19 @@ class UserProfile(models.Model):
         help_text='User reputation score',
     )
 
+    # Level name computed by the database, for list endpoints and filtering
+    reputation_level = models.GeneratedField(
+        expression=Case(
+            *[
+                When(reputation_score__lt=threshold, then=Value(level))
+                for threshold, level in zip(_REPUTATION_THRESHOLDS, _REPUTATION_LEVELS)
+            ],
+            default=Value(_REPUTATION_LEVELS[-1]),
+        ),
+        output_field=models.CharField(max_length=20),
+        db_persist=True,
+    )
+
     # Badges (JSON array of badge names)
     badges = models.JSONField(
         blank=True,
@@ -164,6 +193,8 @@ class UserProfile(models.Model):
             models.Index(fields=['user']),
             models.Index(fields=['reputation_score']),
             models.Index(fields=['-created_at']),
+            # badges__contains lookups (with_badge)
+            GinIndex(fields=['badges'], name='profile_badges_gin'),
         ]
 
     def __str__(self):
@@ -175,25 +206,46 @@ class UserProfile(models.Model):
 
     def add_badge(self, badge_name: str) -> bool:
         """Add a badge to the user."""
-        if self.badges is None:
-            self.badges = []
-        if badge_name not in self.badges:
-            self.badges.append(badge_name)
-            self.save()
-            return True
-        return False
+        with transaction.atomic():
+            # Re-read under a row lock so concurrent awards don't overwrite each other
+            badges = UserProfile.objects.select_for_update().values_list(
+                'badges', flat=True
+            ).get(pk=self.pk) or []
+            if badge_name in badges:
+                self.badges = badges
+                return False
+            self.badges = badges + [badge_name]
+            self.save(update_fields=['badges', 'updated_at'])
+        return True
+
+    @classmethod
+    def with_badge(cls, badge_name: str):
+        """Profiles that have earned a badge."""
+        if connection.features.supports_json_field_contains:
+            return cls.objects.filter(badges__contains=[badge_name])
+        # SQLite and Oracle have no JSON containment lookup; match the badge lists in Python
+        pks = [
+            pk for pk, badges in cls.objects.values_list('pk', 'badges')
+            if badges and badge_name in badges
+        ]
+        return cls.objects.filter(pk__in=pks)
 
     def award_reputation(self, amount: int):
         """Award reputation points."""
+        UserProfile.objects.filter(pk=self.pk).update(
+            reputation_score=F('reputation_score') + amount
+        )
+        # Mirror the delta instead of re-reading the row; reputation_level is
+        # generated from reputation_score, so derive it the same way
         self.reputation_score += amount
-        self.save()
+        self.reputation_level = self.get_reputation_level()
 
     def increment_stat(self, stat_name: str):
         """Increment a stat counter."""
-        if hasattr(self, stat_name):
-            current_value = getattr(self, stat_name)
-            setattr(self, stat_name, current_value + 1)
-            self.save()
+        if stat_name not in _INCREMENTABLE_STATS:
+            raise ValueError(f"Unknown stat: {stat_name}")
+        UserProfile.objects.filter(pk=self.pk).update(**{stat_name: F(stat_name) + 1})
+        setattr(self, stat_name, getattr(self, stat_name) + 1)
 
     def is_banned_active(self) -> bool:
         """Check if user is currently banned."""
@@ -206,16 +258,4 @@ class UserProfile(models.Model):
 
     def get_reputation_level(self) -> str:
         """Get reputation level name."""
-        score = self.reputation_score
-        if score < 10:
-            return 'Newcomer'
-        elif score < 50:
-            return 'Contributor'
-        elif score < 150:
-            return 'Researcher'
-        elif score < 500:
-            return 'Expert'
-        elif score < 1000:
-            return 'Master'
-        else:
-            return 'Grandmaster'
+        return _REPUTATION_LEVELS[bisect_right(_REPUTATION_THRESHOLDS, self.reputation_score)]
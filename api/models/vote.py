@@ -1,11 +1,80 @@
 """
 Vote Model - Votes on comments, discussions, and mappings
 """
-from django.db import models
+from collections import defaultdict
+
+from django.db import models, transaction
+from django.db.models import Count, F, Q
 from django.contrib.auth import get_user_model
 
+from .comment import Comment
+from .discussion import Discussion
+from .mapping import CodonHexagramMapping
+
 User = get_user_model()
 
+# Models with an explicit target column on Vote and Notification
+_TARGET_FIELDS = {
+    Comment: 'comment',
+    Discussion: 'discussion',
+    CodonHexagramMapping: 'mapping',
+}
+
+
+def direct_target_kwargs(obj):
+    """Explicit target FK kwargs for obj, or {} if it has no target column."""
+    field = _TARGET_FIELDS.get(type(obj))
+    return {f'{field}_id': obj.pk} if field else {}
+
+
+def single_target_constraint(name):
+    """Check constraint allowing at most one explicit target FK to be set."""
+    return models.CheckConstraint(
+        check=(
+            Q(comment__isnull=True, discussion__isnull=True)
+            | Q(comment__isnull=True, mapping__isnull=True)
+            | Q(discussion__isnull=True, mapping__isnull=True)
+        ),
+        name=name,
+    )
+
+# Model class -> ContentType pk, resolved once per class
+_CONTENT_TYPE_IDS = {}
+
+
+def _content_type_id(model):
+    """ContentType pk of a model class, without hydrating ContentType objects."""
+    content_type_id = _CONTENT_TYPE_IDS.get(model)
+    if content_type_id is None:
+        from django.contrib.contenttypes.models import ContentType
+        content_type_id = ContentType.objects.get_for_model(model).pk
+        _CONTENT_TYPE_IDS[model] = content_type_id
+    return content_type_id
+
+
+class VoteQuerySet(models.QuerySet):
+    """QuerySet with helpers for reading votes."""
+
+    def bulk_get_votes(self, user, objs):
+        """
+        User's vote type on each of several objects, in one query.
+
+        Returns:
+            Dict mapping (content_type_id, object_id) to vote_type
+        """
+        ids_by_type = defaultdict(list)
+        for obj in objs:
+            ids_by_type[_content_type_id(type(obj))].append(obj.pk)
+        query = Q()
+        for content_type_id, object_ids in ids_by_type.items():
+            query |= Q(content_type_id=content_type_id, object_id__in=object_ids)
+        if not query:
+            return {}
+        rows = self.filter(query, user=user).values_list(
+            'content_type_id', 'object_id', 'vote_type'
+        )
+        return {(ct_id, object_id): vote_type for ct_id, object_id, vote_type in rows}
+
 
 class Vote(models.Model):
     """
@@ -40,6 +109,34 @@ class Vote(models.Model):
         help_text='ID of object being voted on',
     )
 
+    # Explicit targets for the voteable models, so they can be joined
+    comment = models.ForeignKey(
+        Comment,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='+',
+        help_text='Comment being voted on (set automatically)',
+    )
+
+    discussion = models.ForeignKey(
+        Discussion,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='+',
+        help_text='Discussion being voted on (set automatically)',
+    )
+
+    mapping = models.ForeignKey(
+        CodonHexagramMapping,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='+',
+        help_text='Mapping being voted on (set automatically)',
+    )
+
     # Vote type
     vote_type = models.CharField(
         max_length=10,
@@ -50,6 +147,8 @@ class Vote(models.Model):
     # Metadata
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = VoteQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'Vote'
         verbose_name_plural = 'Votes'
@@ -60,6 +159,7 @@ class Vote(models.Model):
             models.Index(fields=['content_type', 'object_id']),
             models.Index(fields=['-created_at']),
         ]
+        constraints = [single_target_constraint('vote_single_target')]
 
     def __str__(self):
         return f"{self.user.username} {self.vote_type} on {self.content_type.model} #{self.object_id}"
@@ -67,12 +167,10 @@ class Vote(models.Model):
     @classmethod
     def get_vote(cls, user, obj):
         """Get user's vote on an object."""
-        from django.contrib.contenttypes.models import ContentType
-        content_type = ContentType.objects.get_for_model(obj)
         try:
             return Vote.objects.get(
                 user=user,
-                content_type=content_type,
+                content_type_id=_content_type_id(type(obj)),
                 object_id=obj.pk
             )
         except Vote.DoesNotExist:
@@ -81,32 +179,93 @@ class Vote(models.Model):
     @classmethod
     def toggle_vote(cls, user, obj, vote_type):
         """Toggle a vote (remove if exists, add if doesn't)."""
-        from django.contrib.contenttypes.models import ContentType
+        content_type_id = _content_type_id(type(obj))
 
-        content_type = ContentType.objects.get_for_model(obj)
+        votes = Vote.objects.filter(
+            user=user,
+            content_type_id=content_type_id,
+            object_id=obj.pk
+        )
+        with transaction.atomic():
+            # Only the current vote type is needed, not a model instance
+            existing_type = votes.select_for_update().values_list(
+                'vote_type', flat=True
+            ).first()
+
+            if existing_type is None:
+                # Create new vote
+                Vote.objects.create(
+                    user=user,
+                    content_type_id=content_type_id,
+                    object_id=obj.pk,
+                    vote_type=vote_type,
+                    **direct_target_kwargs(obj)
+                )
+                cls._apply_vote_delta(obj, **{cls._counter(vote_type): 1})
+                if vote_type == cls.VoteType.UPVOTE:
+                    cls._notify_owner(content_type_id, obj.pk, user.pk)
+                return 'added'
 
-        # Check if vote already exists
-        try:
-            existing_vote = Vote.objects.get(
-                user=user,
-                content_type=content_type,
-                object_id=obj.pk
-            )
             # If same vote type, remove it (toggle off)
-            if existing_vote.vote_type == vote_type:
-                existing_vote.delete()
+            if existing_type == vote_type:
+                votes.delete()
+                cls._apply_vote_delta(obj, **{cls._counter(vote_type): -1})
                 return 'removed'
-            else:
-                # Change vote type
-                existing_vote.vote_type = vote_type
-                existing_vote.save()
-                return 'changed'
-        except Vote.DoesNotExist:
-            # Create new vote
-            Vote.objects.create(
-                user=user,
-                content_type=content_type,
-                object_id=obj.pk,
-                vote_type=vote_type
-            )
-            return 'added'
+
+            # Change vote type
+            votes.update(vote_type=vote_type)
+            cls._apply_vote_delta(obj, **{
+                cls._counter(existing_type): -1,
+                cls._counter(vote_type): 1,
+            })
+            return 'changed'
+
+    @staticmethod
+    def _notify_owner(content_type_id, object_id, voter_id):
+        """Queue the vote-received notification once the vote is committed."""
+        from api.tasks import vote_received_task
+        transaction.on_commit(
+            lambda: vote_received_task.delay(content_type_id, object_id, voter_id)
+        )
+
+    @classmethod
+    def _counter(cls, vote_type):
+        """Name of the denormalized counter field for a vote type."""
+        return 'upvotes' if vote_type == cls.VoteType.UPVOTE else 'downvotes'
+
+    @staticmethod
+    def _apply_vote_delta(obj, upvotes=0, downvotes=0):
+        """Atomically adjust the voted object's denormalized vote counters."""
+        if 'upvotes' not in {field.name for field in obj._meta.concrete_fields}:
+            return
+        type(obj).objects.filter(pk=obj.pk).update(
+            upvotes=F('upvotes') + upvotes,
+            downvotes=F('downvotes') + downvotes,
+            vote_score=F('vote_score') + upvotes - downvotes,
+        )
+        obj.upvotes += upvotes
+        obj.downvotes += downvotes
+        obj.vote_score += upvotes - downvotes
+
+    @classmethod
+    def recount_votes(cls, model, batch_size=1000):
+        """Recompute vote counters for every object of a model from Vote rows."""
+        counts = defaultdict(lambda: {'upvotes': 0, 'downvotes': 0})
+        rows = (
+            cls.objects.filter(content_type_id=_content_type_id(model))
+            .order_by()
+            .values('object_id', 'vote_type')
+            .annotate(n=Count('id'))
+        )
+        for row in rows:
+            counts[row['object_id']][cls._counter(row['vote_type'])] = row['n']
+
+        objects = list(model.objects.only('upvotes', 'downvotes', 'vote_score'))
+        for obj in objects:
+            obj_counts = counts.get(obj.pk, {'upvotes': 0, 'downvotes': 0})
+            obj.upvotes = obj_counts['upvotes']
+            obj.downvotes = obj_counts['downvotes']
+            obj.vote_score = obj.upvotes - obj.downvotes
+        model.objects.bulk_update(
+            objects, ['upvotes', 'downvotes', 'vote_score'], batch_size=batch_size
+        )
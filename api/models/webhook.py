@@ -4,8 +4,10 @@ Webhook Model - Webhooks for event notifications
 import secrets
 import hmac
 import hashlib
-from django.db import models
+from django.db import connection, models, transaction
+from django.db.models import F, Q
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex
 from django.utils import timezone
 from django.urls import reverse
 
@@ -104,7 +106,8 @@ class Webhook(models.Model):
         indexes = [
             models.Index(fields=['user']),
             models.Index(fields=['is_active']),
-            models.Index(fields=['events']),
+            # Serves events__contains lookups in webhooks_for()
+            GinIndex(fields=['events'], name='webhook_events_gin'),
         ]
 
     def __str__(self):
@@ -114,54 +117,127 @@ class Webhook(models.Model):
         """Subscribe to an event."""
         if event not in self.events:
             self.events.append(event)
-            self.save()
+            self.save(update_fields=['events', 'updated_at'])
 
     def unsubscribe_from_event(self, event: str):
         """Unsubscribe from an event."""
         if event in self.events:
             self.events.remove(event)
-            self.save()
+            self.save(update_fields=['events', 'updated_at'])
 
     def is_subscribed_to(self, event: str) -> bool:
         """Check if subscribed to an event."""
         return event in self.events or '*' in self.events
 
+    @classmethod
+    def webhooks_for(cls, event: str):
+        """Active webhooks subscribed to an event, filtered in the database where supported."""
+        active = cls.objects.filter(is_active=True)
+        if connection.features.supports_json_field_contains:
+            return active.filter(Q(events__contains=[event]) | Q(events__contains=['*']))
+        # SQLite and Oracle have no JSON containment lookup; match the event lists in Python
+        pks = [
+            pk for pk, events in active.values_list('pk', 'events')
+            if event in events or '*' in events
+        ]
+        return active.filter(pk__in=pks)
+
     def record_success(self):
         """Record a successful delivery."""
-        self.total_sent += 1
         self.last_success_at = timezone.now()
-        self.save(update_fields=['total_sent', 'last_success_at'])
+        Webhook.objects.filter(pk=self.pk).update(
+            total_sent=F('total_sent') + 1,
+            last_success_at=self.last_success_at,
+        )
+        self.total_sent += 1
 
     def record_failure(self, reason: str = 'Unknown'):
         """Record a failed delivery."""
-        self.total_failed += 1
         self.last_failure_at = timezone.now()
         self.last_failure_reason = reason
-        self.save(update_fields=['total_failed', 'last_failure_at', 'last_failure_reason'])
+        Webhook.objects.filter(pk=self.pk).update(
+            total_failed=F('total_failed') + 1,
+            last_failure_at=self.last_failure_at,
+            last_failure_reason=reason,
+        )
+        self.total_failed += 1
 
-    def generate_signature(self, payload: str) -> str:
+    @classmethod
+    def record_batch(cls, event_type: str, payload, outcomes):
+        """
+        Record the deliveries of one event to many webhooks in bulk.
+
+        Args:
+            event_type: Event that was delivered
+            payload: Data sent to every webhook
+            outcomes: List of (webhook, succeeded, failure_reason) tuples,
+                one per webhook
+
+        Returns:
+            The created WebhookDeliveryLog objects
+        """
+        now = timezone.now()
+        logs = []
+        succeeded = []
+        failed_by_reason = {}
+        for webhook, success, reason in outcomes:
+            logs.append(WebhookDeliveryLog(
+                webhook=webhook,
+                event_type=event_type,
+                payload=payload,
+                status='success' if success else 'failed',
+                response_body='' if success else (reason or ''),
+                delivered_at=now,
+            ))
+            if success:
+                succeeded.append(webhook.pk)
+            else:
+                failed_by_reason.setdefault(reason or 'Unknown', []).append(webhook.pk)
+
+        with transaction.atomic():
+            created = WebhookDeliveryLog.objects.bulk_create(logs, batch_size=500)
+            # Counters are incremented with F() so concurrent batches don't lose counts
+            if succeeded:
+                cls.objects.filter(pk__in=succeeded).update(
+                    total_sent=F('total_sent') + 1,
+                    last_success_at=now,
+                )
+            for reason, pks in failed_by_reason.items():
+                cls.objects.filter(pk__in=pks).update(
+                    total_failed=F('total_failed') + 1,
+                    last_failure_at=now,
+                    last_failure_reason=reason,
+                )
+        return created
+
+    def _hmac_prototype(self):
+        """HMAC keyed with the secret, memoized until the secret changes."""
+        cached = getattr(self, '_hmac_cache', None)
+        if cached is None or cached[0] is not self.secret:
+            cached = (self.secret, hmac.new(self.secret.encode(), b'', hashlib.sha256))
+            self._hmac_cache = cached
+        return cached[1]
+
+    def generate_signature(self, payload) -> str:
         """
         Generate HMAC signature for webhook payload.
 
         Args:
-            payload: JSON string payload
+            payload: JSON payload as str or already-encoded bytes
 
         Returns:
             Hexadecimal signature
         """
-        signature = hmac.new(
-            self.secret.encode(),
-            payload.encode(),
-            hashlib.sha256
-        ).hexdigest()
-        return f"sha256={signature}"
-
-    def verify_signature(self, payload: str, signature: str) -> bool:
+        mac = self._hmac_prototype().copy()
+        mac.update(payload.encode() if isinstance(payload, str) else payload)
+        return f"sha256={mac.hexdigest()}"
+
+    def verify_signature(self, payload, signature: str) -> bool:
         """
         Verify webhook signature.
 
         Args:
-            payload: JSON string payload
+            payload: JSON payload as str or bytes
             signature: Signature from request header
 
         Returns:
@@ -1,10 +1,11 @@
 from .codon import CodonSerializer
 from .hexagram import HexagramSerializer
-from .codon_sequence import CodonSequenceSerializer
+from .codon_sequence import CodonSequenceSerializer, CodonSequenceListSerializer
 from .hexagram_interpretation import HexagramInterpretationSerializer
 from .mapping import CodonHexagramMappingSerializer
 from .analysis_pattern import (
     AnalysisPatternSerializer,
+    AnalysisPatternListSerializer,
     PatternMatchSerializer,
     PatternAnalysisRequestSerializer,
     PositionAnalysisRequestSerializer,
@@ -14,6 +15,7 @@ from .analysis_pattern import (
 )
 from .comparative_analysis import (
     ComparativeAnalysisSerializer,
+    ComparativeAnalysisListSerializer,
     ComparisonCacheSerializer,
     SequenceComparisonRequestSerializer,
     MappingComparisonRequestSerializer,
@@ -26,9 +28,11 @@ __all__ = [
     'CodonSerializer',
     'HexagramSerializer',
     'CodonSequenceSerializer',
+    'CodonSequenceListSerializer',
     'HexagramInterpretationSerializer',
     'CodonHexagramMappingSerializer',
     'AnalysisPatternSerializer',
+    'AnalysisPatternListSerializer',
     'PatternMatchSerializer',
     'PatternAnalysisRequestSerializer',
     'PositionAnalysisRequestSerializer',
@@ -36,6 +40,7 @@ __all__ = [
     'MotifDiscoveryRequestSerializer',
     'ConservationAnalysisRequestSerializer',
     'ComparativeAnalysisSerializer',
+    'ComparativeAnalysisListSerializer',
     'ComparisonCacheSerializer',
     'SequenceComparisonRequestSerializer',
     'MappingComparisonRequestSerializer',
@@ -3,9 +3,11 @@ Serializers for Analysis Pattern models
 """
 from rest_framework import serializers
 from api.models import AnalysisPattern, PatternMatch
+from .fields import SequenceField
+from .mixins import CachedFieldsMixin, FastaSequencesMixin
 
 
-class AnalysisPatternSerializer(serializers.ModelSerializer):
+class AnalysisPatternSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for AnalysisPattern model"""
 
     pattern_length = serializers.IntegerField(read_only=True)
@@ -54,6 +56,40 @@ class AnalysisPatternSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
+class AnalysisPatternListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """
+    Compact serializer for pattern lists.
+
+    Only uses columns loaded by AnalysisPattern.objects.for_list(), so
+    deferred fields are never fetched row by row.
+    """
+
+    class Meta:
+        model = AnalysisPattern
+        fields = [
+            'id',
+            'user',
+            'pattern_type',
+            'frequency',
+            'significance_score',
+            'pattern_name',
+            'pattern_description',
+            'window_size',
+            'min_occurrences',
+            'start_position',
+            'end_position',
+            'mapping_scheme',
+            'is_public',
+            'is_verified',
+            'tags',
+            'shannon_entropy',
+            'dominant_hexagram',
+            'created_at',
+            'updated_at',
+        ]
+        read_only_fields = fields
+
+
 class PatternMatchSerializer(serializers.ModelSerializer):
     """Serializer for PatternMatch model"""
 
@@ -77,7 +113,7 @@ class PatternMatchSerializer(serializers.ModelSerializer):
 class PatternAnalysisRequestSerializer(serializers.Serializer):
     """Serializer for pattern analysis requests"""
 
-    sequence = serializers.CharField(
+    sequence = SequenceField(
         help_text='DNA or RNA sequence to analyze',
     )
     mapping_scheme = serializers.CharField(
@@ -106,7 +142,7 @@ class PatternAnalysisRequestSerializer(serializers.Serializer):
 class PositionAnalysisRequestSerializer(serializers.Serializer):
     """Serializer for position analysis requests"""
 
-    sequence = serializers.CharField(
+    sequence = SequenceField(
         help_text='DNA or RNA sequence to analyze',
     )
     mapping_scheme = serializers.CharField(
@@ -119,7 +155,7 @@ class PositionAnalysisRequestSerializer(serializers.Serializer):
 class SlidingWindowRequestSerializer(serializers.Serializer):
     """Serializer for sliding window analysis requests"""
 
-    sequence = serializers.CharField(
+    sequence = SequenceField(
         help_text='DNA or RNA sequence to analyze',
     )
     window_size = serializers.IntegerField(
@@ -144,7 +180,7 @@ class SlidingWindowRequestSerializer(serializers.Serializer):
 class MotifDiscoveryRequestSerializer(serializers.Serializer):
     """Serializer for motif discovery requests"""
 
-    sequence = serializers.CharField(
+    sequence = SequenceField(
         help_text='DNA or RNA sequence to analyze',
     )
     motif_lengths = serializers.ListField(
@@ -172,12 +208,13 @@ class MotifDiscoveryRequestSerializer(serializers.Serializer):
     )
 
 
-class ConservationAnalysisRequestSerializer(serializers.Serializer):
+class ConservationAnalysisRequestSerializer(FastaSequencesMixin):
     """Serializer for conservation analysis requests"""
 
     sequences = serializers.ListField(
-        child=serializers.CharField(),
+        child=SequenceField(),
         min_length=2,
+        required=False,
         help_text='List of sequences to compare',
     )
     sequence_names = serializers.ListField(
@@ -1,13 +1,18 @@
 """
 Serializers for Codon model
 """
+from django.db.models import QuerySet
 from rest_framework import serializers
 from api.models import Codon
+from .mixins import CachedFieldsMixin
 
 
-class CodonSerializer(serializers.ModelSerializer):
+class CodonSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Codon model"""
 
+    rna_equivalent = serializers.SerializerMethodField()
+    complement = serializers.SerializerMethodField()
+
     class Meta:
         model = Codon
         fields = [
@@ -21,14 +26,29 @@ class CodonSerializer(serializers.ModelSerializer):
             'is_stop',
             'binary_representation',
             'mapped_hexagram',
+            'rna_equivalent',
+            'complement',
             'created_at',
             'updated_at',
         ]
         read_only_fields = ['created_at', 'updated_at']
 
-    def to_representation(self, instance):
-        """Add computed fields"""
-        data = super().to_representation(instance)
-        data['rna_equivalent'] = instance.to_rna()
-        data['complement'] = instance.get_complement()
-        return data
+    def _computed(self, obj):
+        """(rna_equivalent, complement) for obj, computed for the whole list at once"""
+        cache = self.context.setdefault('codon_computed', {})
+        if obj.pk not in cache:
+            siblings = [obj]
+            if isinstance(self.parent, serializers.ListSerializer) and isinstance(
+                self.parent.instance, (list, QuerySet)
+            ):
+                siblings = self.parent.instance
+            cache.update(Codon.rna_and_complements(siblings))
+            if obj.pk not in cache:
+                cache.update(Codon.rna_and_complements([obj]))
+        return cache[obj.pk]
+
+    def get_rna_equivalent(self, obj):
+        return self._computed(obj)[0]
+
+    def get_complement(self, obj):
+        return self._computed(obj)[1]
@@ -3,13 +3,16 @@ Serializers for CodonSequence model
 """
 from rest_framework import serializers
 from api.models import CodonSequence, Hexagram
+from .mixins import CachedFieldsMixin
 
 
-class CodonSequenceSerializer(serializers.ModelSerializer):
+class CodonSequenceSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for CodonSequence model"""
 
+    # A model property (stored packed or as text), so declared explicitly
+    raw_sequence = serializers.CharField(help_text='Raw DNA/RNA sequence string')
     dominant_hexagram_name = serializers.CharField(source='dominant_hexagram.name_english', read_only=True)
-    dominant_hexagram_number = serializers.IntegerField(source='domominant_hexagram.number', read_only=True)
+    dominant_hexagram_number = serializers.IntegerField(source='dominant_hexagram.number', read_only=True)
 
     class Meta:
         model = CodonSequence
@@ -52,3 +55,32 @@ class CodonSequenceSerializer(serializers.ModelSerializer):
         user = self.context['request'].user
         validated_data['user'] = user
         return super().create(validated_data)
+
+
+class CodonSequenceListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """
+    Compact serializer for sequence lists.
+
+    The list view loads exactly these columns with QuerySet.only(), so
+    keep every field a plain model column.
+    """
+
+    class Meta:
+        model = CodonSequence
+        fields = [
+            'id',
+            'name',
+            'description',
+            'user',
+            'sequence_type',
+            'organism',
+            'gene_name',
+            'location',
+            'gc_content',
+            'codon_count',
+            'dominant_hexagram',
+            'hexagram_diversity',
+            'is_reference',
+            'created_at',
+            'updated_at',
+        ]
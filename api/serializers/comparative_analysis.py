@@ -3,18 +3,26 @@ Serializers for Comparative Analysis models
 """
 from rest_framework import serializers
 from api.models import ComparativeAnalysis, ComparisonCache
+from .fields import SequenceField
+from .mixins import CachedFieldsMixin, FastaSequencesMixin
 
 
-class ComparativeAnalysisSerializer(serializers.ModelSerializer):
+class ComparativeAnalysisSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for ComparativeAnalysis model"""
 
-    sequence_count = serializers.IntegerField(read_only=True)
-    hexagram_difference_count = serializers.IntegerField(read_only=True)
+    results = serializers.JSONField()
+    sequence1 = serializers.CharField(source='get_sequence1', read_only=True)
+    sequence2 = serializers.CharField(source='get_sequence2', read_only=True)
+    sequence_count = serializers.IntegerField(source='get_sequence_count', read_only=True)
+    hexagram_difference_count = serializers.IntegerField(
+        source='get_hexagram_difference_count', read_only=True
+    )
 
     class Meta:
         model = ComparativeAnalysis
         fields = [
             'id',
+            'uuid',
             'user',
             'analysis_type',
             'sequence1',
@@ -54,6 +62,41 @@ class ComparativeAnalysisSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
+class ComparativeAnalysisListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """
+    Compact serializer for analysis lists.
+
+    Only uses columns loaded by ComparativeAnalysis.objects.list_lite(), so
+    deferred fields are never fetched row by row.
+    """
+
+    class Meta:
+        model = ComparativeAnalysis
+        fields = [
+            'id',
+            'uuid',
+            'user',
+            'analysis_type',
+            'sequence1_name',
+            'sequence2_name',
+            'mapping_schemes',
+            'similarity_score',
+            'match_percentage',
+            'differences_count',
+            'test_type',
+            'p_value',
+            'is_significant',
+            'analysis_name',
+            'analysis_description',
+            'window_size',
+            'min_conservation',
+            'is_public',
+            'tags',
+            'created_at',
+            'updated_at',
+        ]
+
+
 class ComparisonCacheSerializer(serializers.ModelSerializer):
     """Serializer for ComparisonCache model"""
 
@@ -80,10 +123,10 @@ class ComparisonCacheSerializer(serializers.ModelSerializer):
 class SequenceComparisonRequestSerializer(serializers.Serializer):
     """Serializer for sequence comparison requests"""
 
-    sequence1 = serializers.CharField(
+    sequence1 = SequenceField(
         help_text='First DNA/RNA sequence',
     )
-    sequence2 = serializers.CharField(
+    sequence2 = SequenceField(
         help_text='Second DNA/RNA sequence',
     )
     sequence1_name = serializers.CharField(
@@ -111,7 +154,7 @@ class SequenceComparisonRequestSerializer(serializers.Serializer):
 class MappingComparisonRequestSerializer(serializers.Serializer):
     """Serializer for mapping scheme comparison requests"""
 
-    sequence = serializers.CharField(
+    sequence = SequenceField(
         help_text='DNA/RNA sequence to analyze',
     )
     schemes = serializers.ListField(
@@ -125,10 +168,10 @@ class MappingComparisonRequestSerializer(serializers.Serializer):
 class StatisticalTestRequestSerializer(serializers.Serializer):
     """Serializer for statistical test requests"""
 
-    sequence1 = serializers.CharField(
+    sequence1 = SequenceField(
         help_text='First DNA/RNA sequence',
     )
-    sequence2 = serializers.CharField(
+    sequence2 = SequenceField(
         help_text='Second DNA/RNA sequence',
     )
     test_type = serializers.ChoiceField(
@@ -143,12 +186,13 @@ class StatisticalTestRequestSerializer(serializers.Serializer):
     )
 
 
-class MultipleSequenceComparisonRequestSerializer(serializers.Serializer):
+class MultipleSequenceComparisonRequestSerializer(FastaSequencesMixin):
     """Serializer for multiple sequence comparison requests"""
 
     sequences = serializers.ListField(
-        child=serializers.CharField(),
+        child=SequenceField(),
         min_length=2,
+        required=False,
         help_text='List of sequences to compare',
     )
     sequence_names = serializers.ListField(
@@ -163,12 +207,13 @@ class MultipleSequenceComparisonRequestSerializer(serializers.Serializer):
     )
 
 
-class ConservedRegionsRequestSerializer(serializers.Serializer):
+class ConservedRegionsRequestSerializer(FastaSequencesMixin):
     """Serializer for conserved regions search requests"""
 
     sequences = serializers.ListField(
-        child=serializers.CharField(),
+        child=SequenceField(),
         min_length=2,
+        required=False,
         help_text='List of sequences to analyze',
     )
     window_size = serializers.IntegerField(
@@ -0,0 +1,43 @@
+"""
+Custom serializer fields
+"""
+from rest_framework import serializers
+
+# Lowercase bases fold to uppercase; whitespace is deleted in the same pass
+_SEQ_TABLE = bytes.maketrans(b'acgtun', b'ACGTUN')
+_SEQ_WHITESPACE = b' \t\r\n'
+_SEQ_ALLOWED = frozenset(b'ACGTUN')
+
+
+def normalize_sequence(value):
+    """
+    Uppercase a DNA/RNA sequence and drop whitespace.
+
+    Returns None if it contains anything other than A, C, G, T, U or N.
+    """
+    try:
+        seq = value.encode('ascii').translate(_SEQ_TABLE, _SEQ_WHITESPACE)
+    except (AttributeError, UnicodeEncodeError):
+        return None
+    if not _SEQ_ALLOWED.issuperset(seq):
+        return None
+    return seq.decode('ascii')
+
+
+class SequenceField(serializers.CharField):
+    """
+    DNA/RNA sequence, normalized to uppercase without whitespace.
+
+    Case folding, whitespace removal and alphabet validation are done
+    with one bytes.translate() and one set check.
+    """
+
+    default_error_messages = {
+        'invalid_sequence': 'Sequence may only contain A, C, G, T, U or N.',
+    }
+
+    def to_internal_value(self, data):
+        seq = normalize_sequence(super().to_internal_value(data))
+        if seq is None:
+            self.fail('invalid_sequence')
+        return seq
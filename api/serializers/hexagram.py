@@ -3,9 +3,10 @@ Serializers for Hexagram model
 """
 from rest_framework import serializers
 from api.models import Hexagram
+from .mixins import CachedFieldsMixin
 
 
-class HexagramSerializer(serializers.ModelSerializer):
+class HexagramSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for Hexagram model"""
 
     lines_array = serializers.ListField(read_only=True)
@@ -47,17 +48,3 @@ class HexagramSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['created_at', 'updated_at']
 
-    def get_lines_array(self, obj):
-        return obj.get_lines_array()
-
-    def get_yang_lines(self, obj):
-        return obj.get_yang_lines()
-
-    def get_yin_lines(self, obj):
-        return obj.get_yin_lines()
-
-    def get_is_balanced(self, obj):
-        return obj.is_balanced()
-
-    def get_unicode_char(self, obj):
-        return obj.get_hexagram_unicode()
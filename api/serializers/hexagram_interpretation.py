@@ -3,9 +3,10 @@ Serializers for HexagramInterpretation model
 """
 from rest_framework import serializers
 from api.models import HexagramInterpretation
+from .mixins import CachedFieldsMixin
 
 
-class HexagramInterpretationSerializer(serializers.ModelSerializer):
+class HexagramInterpretationSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for HexagramInterpretation model"""
 
     hexagram_name = serializers.CharField(source='hexagram.name_english', read_only=True)
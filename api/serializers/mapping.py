@@ -3,9 +3,10 @@ Serializers for CodonHexagramMapping model
 """
 from rest_framework import serializers
 from api.models import CodonHexagramMapping
+from .mixins import CachedFieldsMixin
 
 
-class CodonHexagramMappingSerializer(serializers.ModelSerializer):
+class CodonHexagramMappingSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for CodonHexagramMapping model"""
 
     created_by_username = serializers.CharField(source='created_by.username', read_only=True)
@@ -0,0 +1,96 @@
+"""
+Shared serializer mixins
+"""
+import copy
+import re
+
+from django.utils.functional import cached_property
+from rest_framework import serializers
+
+_FASTA_RECORD_RE = re.compile(r'^>([^\n]*)\n([^>]*)', re.MULTILINE)
+_WHITESPACE_RE = re.compile(r'\s+')
+_NUCLEOTIDES_RE = re.compile(r'[ACGTUN]*')
+
+
+def _parse_sequences(text):
+    """
+    Parse FASTA or newline-delimited sequences.
+
+    Returns:
+        Tuple of (names, sequences); names is empty for plain lists
+    """
+    if text.lstrip().startswith('>'):
+        records = _FASTA_RECORD_RE.findall(text)
+        names = [name.strip() for name, _ in records]
+        sequences = [_WHITESPACE_RE.sub('', body).upper() for _, body in records]
+        return names, sequences
+    return [], [line.strip().upper() for line in text.splitlines() if line.strip()]
+
+
+class CachedFieldsMixin:
+    """
+    Build a ModelSerializer's fields once per class and hand out copies.
+
+    ModelSerializer.get_fields() introspects the model on every
+    instantiation. Only use this on serializers whose fields do not
+    depend on the instance, request or context.
+    """
+
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = type(self)
+        fields = CachedFieldsMixin._fields_cache.get(cls)
+        if fields is None:
+            fields = super().get_fields()
+            CachedFieldsMixin._fields_cache[cls] = fields
+        # Fields are bound to their serializer, so each instance needs its own
+        return {name: copy.deepcopy(field) for name, field in fields.items()}
+
+    @cached_property
+    def _readable_fields(self):
+        return [field for field in self.fields.values() if not field.write_only]
+
+    @cached_property
+    def _writable_fields(self):
+        return [field for field in self.fields.values() if not field.read_only]
+
+
+class FastaSequencesMixin(serializers.Serializer):
+    """
+    Accept `sequences` either as a list or as one FASTA/newline-delimited string.
+
+    Large batches are parsed and validated in one pass instead of running
+    a CharField per sequence.
+    """
+
+    sequences_fasta = serializers.CharField(
+        required=False,
+        write_only=True,
+        help_text='Sequences as FASTA or one per line (alternative to sequences)',
+    )
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        text = attrs.pop('sequences_fasta', None)
+        if text is None:
+            if not attrs.get('sequences'):
+                raise serializers.ValidationError(
+                    {'sequences': 'Provide sequences or sequences_fasta.'}
+                )
+            return attrs
+
+        names, sequences = _parse_sequences(text)
+        if len(sequences) < 2:
+            raise serializers.ValidationError(
+                {'sequences_fasta': 'At least 2 sequences are required.'}
+            )
+        # One regex match over the whole batch rather than one per sequence
+        if not _NUCLEOTIDES_RE.fullmatch(''.join(sequences)):
+            raise serializers.ValidationError(
+                {'sequences_fasta': 'Sequences may only contain A, C, G, T, U or N.'}
+            )
+        attrs['sequences'] = sequences
+        if names and 'sequence_names' in self.fields and not attrs.get('sequence_names'):
+            attrs['sequence_names'] = names
+        return attrs
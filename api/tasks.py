@@ -0,0 +1,105 @@
+"""
+Celery tasks for the API app
+"""
+from celery import shared_task
+from django.contrib.contenttypes.models import ContentType
+
+from api.models import APIKey, ComparativeAnalysis, Notification
+from api.models.vote import direct_target_kwargs
+
+
+@shared_task
+def flush_api_key_usage():
+    """Flush API key usage buffered in Redis to the database."""
+    return APIKey.flush_buffered_usage()
+
+
+@shared_task
+def create_notification_task(recipient_id, notification_type, title, message,
+                             url='', actor_id=None, content_type_id=None, object_id=None):
+    """Create a notification outside the request cycle."""
+    content_object = None
+    if content_type_id is not None:
+        content_type = ContentType.objects.get_for_id(content_type_id)
+        content_object = content_type.model_class()._default_manager.filter(
+            pk=object_id
+        ).first()
+
+    notification = Notification(
+        recipient_id=recipient_id,
+        notification_type=notification_type,
+        title=title,
+        message=message,
+        url=url,
+        actor_id=actor_id,
+    )
+    if content_object is not None:
+        notification.content_object = content_object
+        for field, value in direct_target_kwargs(content_object).items():
+            setattr(notification, field, value)
+    notification.save()
+    return notification.pk
+
+
+@shared_task
+def vote_received_task(content_type_id, object_id, voter_id):
+    """Notify the owner of upvoted content."""
+    content_type = ContentType.objects.get_for_id(content_type_id)
+    obj = content_type.model_class()._default_manager.filter(pk=object_id).first()
+    if obj is None:
+        return None
+
+    owner_id = getattr(obj, 'author_id', None) or getattr(obj, 'created_by_id', None)
+    if owner_id is None or owner_id == voter_id:
+        return None
+
+    return create_notification_task(
+        recipient_id=owner_id,
+        notification_type=Notification.NotificationType.VOTE_RECEIVED,
+        title='Your content was upvoted',
+        message=f'Your {content_type.model} "{obj}" received an upvote.',
+        actor_id=voter_id,
+        content_type_id=content_type_id,
+        object_id=object_id,
+    )
+
+
+@shared_task
+def analyze_sequence_task(user_id, sequence, name, sequence_type='DNA', mapping_scheme='scheme_1'):
+    """Run a full sequence analysis in the background."""
+    from django.contrib.auth import get_user_model
+    from genetic_engine.genetic_analysis_service import GeneticAnalysisService
+
+    user = get_user_model().objects.filter(pk=user_id).first()
+    service = GeneticAnalysisService(user=user)
+    results = service.analyze_sequence(
+        sequence=sequence,
+        sequence_name=name,
+        sequence_type=sequence_type,
+        mapping_scheme=mapping_scheme,
+        save=True
+    )
+    # Owner is kept with the result so only they can fetch it
+    return {'user_id': user_id, 'results': results}
+
+
+@shared_task
+def export_sequence_task(user_id, sequence, formats, sequence_name='sequence', mapping_scheme='scheme_1'):
+    """Translate and export a sequence in the background."""
+    from genetic_engine.export_service import ExportService
+
+    results = ExportService().export_sequence(
+        sequence,
+        formats,
+        sequence_name=sequence_name,
+        mapping_scheme=mapping_scheme
+    )
+    # Owner is kept with the result so only they can fetch it
+    return {'user_id': user_id, 'results': results}
+
+
+@shared_task
+def save_comparative_analysis_task(user_id, analysis_uuid, fields):
+    """Persist a comparative analysis computed during a request."""
+    analysis = ComparativeAnalysis.objects.create(user_id=user_id, uuid=analysis_uuid, **fields)
+    return analysis.pk
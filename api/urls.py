@@ -1,10 +1,9 @@
 """
 URL configuration for Physiological G-Code API
 """
+from django.conf import settings
 from django.urls import path, include
-from rest_framework.routers import DefaultRouter
-from rest_framework.documentation import include_docs_urls
-from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
+from rest_framework.routers import SimpleRouter
 
 from api.views import (
     CodonViewSet,
@@ -23,13 +22,15 @@ from api.views.visualization_views import VisualizationViewSet
 from api.views.analysis import api_root
 
 # Create router
-router = DefaultRouter()
+# Patterns are matched in registration order, so the busiest endpoints go first
+# api_root below replaces DefaultRouter's generated root view
+router = SimpleRouter(trailing_slash=True)
+router.register(r'sequences', CodonSequenceViewSet, basename='codonsequence')
+router.register(r'analysis', AnalysisViewSet, basename='analysis')
 router.register(r'codons', CodonViewSet, basename='codon')
 router.register(r'hexagrams', HexagramViewSet, basename='hexagram')
-router.register(r'sequences', CodonSequenceViewSet, basename='codonsequence')
 router.register(r'interpretations', HexagramInterpretationViewSet, basename='hexagraminterpretation')
 router.register(r'mappings', CodonHexagramMappingViewSet, basename='codonhexagrammapping')
-router.register(r'analysis', AnalysisViewSet, basename='analysis')
 
 # Phase 3: Enhanced Analysis
 router.register(r'patterns', PatternAnalysisViewSet, basename='pattern')
@@ -46,10 +47,8 @@ urlpatterns = [
 
     # Authentication (to be added in Phase 4)
     # path('auth/', include('rest_framework.urls')),
-
-    # Schema and documentation
-    path('schema/', SpectacularAPIView.as_view(), name='schema'),
-    path('schema/swagger/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-schema'),
-    path('schema/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc-schema'),
-    path('docs/', include_docs_urls(title='Physiological G-Code API')),
 ]
+
+# Schema and documentation
+if settings.ENABLE_API_DOCS:
+    urlpatterns.append(path('', include('api.docs_urls')))
@@ -0,0 +1,146 @@
+"""
+Vectorized scanning kernels for raw nucleotide sequences.
+
+Sequences are handled as uint8 byte arrays and codons as 6-bit indices
+(A=0, C=1, G=2, T=3; index = b1*16 + b2*4 + b3), so a whole sequence is
+scanned with table lookups instead of per-codon Python objects.
+"""
+import numpy as np
+
+# Index used for codons containing anything other than A/C/G/T
+INVALID_CODON = 64
+
+_BASE_INDEX = np.full(256, 4, dtype=np.uint8)
+for _i, _base in enumerate('ACGT'):
+    _BASE_INDEX[ord(_base)] = _i
+    _BASE_INDEX[ord(_base.lower())] = _i
+
+# Packed sequences: 8-byte little-endian base count, then 4 bases per byte
+_PACK_HEADER = np.dtype('<u8')
+_PACK_SHIFTS = np.array([6, 4, 2, 0], dtype=np.uint8)
+_BASE_LETTERS = np.frombuffer(b'ACGT', dtype=np.uint8)
+
+
+def codon_index(codon: str) -> int:
+    """6-bit index of a codon string, or INVALID_CODON."""
+    if len(codon) != 3:
+        return INVALID_CODON
+    bases = [_BASE_INDEX[ord(b)] if ord(b) < 256 else 4 for b in codon]
+    if 4 in bases:
+        return INVALID_CODON
+    return int(bases[0]) * 16 + int(bases[1]) * 4 + int(bases[2])
+
+
+def encode_bases(buf: np.ndarray) -> np.ndarray:
+    """2-bit base codes (4 for anything other than A/C/G/T) of a uint8 buffer."""
+    return _BASE_INDEX[buf]
+
+
+def pack_codes(codes: np.ndarray):
+    """
+    Pack base codes 4 per byte.
+
+    Returns:
+        Packed bytes, or None if the sequence has non-ACGT bases
+    """
+    if np.any(codes == 4):
+        return None
+    padded = np.zeros(-(-codes.size // 4) * 4, dtype=np.uint8)
+    padded[:codes.size] = codes
+    quads = padded.reshape(-1, 4) << _PACK_SHIFTS
+    packed = np.bitwise_or.reduce(quads, axis=1).astype(np.uint8)
+    return np.array([codes.size], dtype=_PACK_HEADER).tobytes() + packed.tobytes()
+
+
+def unpack_codes(packed) -> np.ndarray:
+    """Inverse of pack_codes()."""
+    size = int(np.frombuffer(packed, dtype=_PACK_HEADER, count=1)[0])
+    body = np.frombuffer(packed, dtype=np.uint8, offset=_PACK_HEADER.itemsize)
+    codes = (body[:, None] >> _PACK_SHIFTS) & 3
+    return codes.reshape(-1)[:size]
+
+
+def decode_bases(codes: np.ndarray) -> str:
+    """Uppercase sequence string of an array of A/C/G/T base codes."""
+    return _BASE_LETTERS[codes].tobytes().decode('ascii')
+
+
+def codon_indices(codes: np.ndarray) -> np.ndarray:
+    """6-bit index of every complete codon in an array of base codes."""
+    n = codes.size - codes.size % 3
+    bases = codes[:n].reshape(-1, 3).astype(np.intp)
+    indices = bases[:, 0] * 16 + bases[:, 1] * 4 + bases[:, 2]
+    indices[(bases == 4).any(axis=1)] = INVALID_CODON
+    return indices
+
+
+def build_amino_acid_lut(table: dict) -> np.ndarray:
+    """
+    Build a 65-entry codon index -> amino acid code lookup table.
+
+    Args:
+        table: Mapping of codon sequence to amino acid code
+
+    Returns:
+        Object array where unknown and invalid codons map to 'X'
+    """
+    lut = np.full(INVALID_CODON + 1, 'X', dtype=object)
+    for codon, code in table.items():
+        index = codon_index(codon.upper())
+        if index != INVALID_CODON:
+            lut[index] = code
+    return lut
+
+
+def build_hexagram_lut(table: dict) -> np.ndarray:
+    """
+    Build a 65-entry codon index -> hexagram number lookup table.
+
+    Args:
+        table: Mapping of codon sequence to hexagram number
+
+    Returns:
+        uint8 array where unmapped and invalid codons map to 0
+    """
+    lut = np.zeros(INVALID_CODON + 1, dtype=np.uint8)
+    for codon, hexagram in table.items():
+        index = codon_index(str(codon).upper())
+        if index != INVALID_CODON and hexagram and 1 <= hexagram <= 64:
+            lut[index] = hexagram
+    return lut
+
+
+def binary_hexagram_lut(binary_map: dict) -> np.ndarray:
+    """
+    Hexagram lookup table for a nucleotide -> bit scheme.
+
+    Matches CodonTranslator.translate_codon(): the codon's 6 bits read
+    as an integer, plus one.
+    """
+    lut = np.zeros(INVALID_CODON + 1, dtype=np.uint8)
+    for index in range(INVALID_CODON):
+        bits = ''.join(binary_map['ACGT'[(index >> shift) & 3]] for shift in (4, 2, 0))
+        lut[index] = int(bits, 2) + 1
+    return lut
+
+
+def scan(codes: np.ndarray, aa_lut: np.ndarray):
+    """
+    Scan a sequence once for GC count, codon count and amino acids.
+
+    Args:
+        codes: Base codes from encode_bases() or unpack_codes()
+        aa_lut: Table from build_amino_acid_lut()
+
+    Returns:
+        Tuple of (gc_count, codon_count, amino_acid_sequence); a trailing
+        partial codon counts as a codon and translates to 'X'
+    """
+    gc_count = int(np.count_nonzero((codes == 1) | (codes == 2)))
+    indices = codon_indices(codes)
+    amino_acids = ''.join(aa_lut[indices].tolist())
+    codon_count = indices.size
+    if codes.size % 3:
+        codon_count += 1
+        amino_acids += 'X'
+    return gc_count, codon_count, amino_acids
@@ -0,0 +1,68 @@
+"""
+Monthly range partitions for the API key usage log on PostgreSQL.
+
+api_apikeyusagelog is PARTITION BY RANGE (timestamp) with one partition
+per calendar month, named api_apikeyusagelog_pYYYYMM, plus a DEFAULT
+partition that catches rows no monthly partition covers yet.
+"""
+from datetime import date, datetime, timezone
+
+USAGE_LOG_TABLE = 'api_apikeyusagelog'
+DEFAULT_PARTITION = f'{USAGE_LOG_TABLE}_default'
+_PARTITION_PREFIX = f'{USAGE_LOG_TABLE}_p'
+
+
+def month_start(value) -> date:
+    """First day of the month containing a date or datetime."""
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, count: int) -> date:
+    """First day of the month `count` months after `month`."""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Table name of the partition for a month."""
+    return f'{_PARTITION_PREFIX}{month:%Y%m}'
+
+
+def _bound(month: date) -> str:
+    return datetime(month.year, month.month, 1, tzinfo=timezone.utc).isoformat()
+
+
+def is_partitioned(cursor) -> bool:
+    """Whether the usage log table is a partitioned table."""
+    cursor.execute('SELECT relkind FROM pg_class WHERE relname = %s', [USAGE_LOG_TABLE])
+    row = cursor.fetchone()
+    return row is not None and row[0] == 'p'
+
+
+def monthly_partitions(cursor) -> dict:
+    """Existing monthly partitions as {first day of month: table name}."""
+    cursor.execute(
+        """
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        WHERE parent.relname = %s
+        """,
+        [USAGE_LOG_TABLE],
+    )
+    partitions = {}
+    for (name,) in cursor.fetchall():
+        suffix = name[len(_PARTITION_PREFIX):]
+        if name.startswith(_PARTITION_PREFIX) and len(suffix) == 6 and suffix.isdigit():
+            partitions[date(int(suffix[:4]), int(suffix[4:]), 1)] = name
+    return partitions
+
+
+def create_monthly_partition(cursor, month: date):
+    """Create the partition for one month if it does not exist yet."""
+    cursor.execute(
+        f'CREATE TABLE IF NOT EXISTS {partition_name(month)} '
+        f'PARTITION OF {USAGE_LOG_TABLE} '
+        f"FOR VALUES FROM ('{_bound(month)}') TO ('{_bound(add_months(month, 1))}')"
+    )
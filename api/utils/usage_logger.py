@@ -0,0 +1,92 @@
+"""
+Buffered writer for API key usage logs.
+
+Requests append plain dicts to a process-local queue; a background timer
+turns them into APIKeyUsageLog rows with multi-row INSERTs instead of one
+INSERT per request.
+"""
+import atexit
+import logging
+import threading
+from collections import deque
+
+from django.db import DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+FLUSH_INTERVAL = 2.0  # seconds
+BATCH_SIZE = 500
+
+_queue = deque()
+_flush_lock = threading.Lock()
+_timer_lock = threading.Lock()
+_timer = None
+
+
+def log_usage(**fields):
+    """
+    Queue a usage log entry.
+
+    Args:
+        **fields: APIKeyUsageLog field values (api_key or api_key_id,
+            endpoint, method, status_code, ip_address, user_agent)
+    """
+    _queue.append(fields)
+    if len(_queue) >= BATCH_SIZE:
+        flush()
+    else:
+        _schedule_flush()
+
+
+def flush() -> int:
+    """Write all queued entries to the database; returns rows written."""
+    from api.models import APIKeyUsageLog
+
+    written = 0
+    with _flush_lock:
+        while _queue:
+            entries = []
+            while _queue and len(entries) < BATCH_SIZE:
+                entries.append(_queue.popleft())
+            try:
+                APIKeyUsageLog.objects.bulk_create(
+                    [APIKeyUsageLog(**fields) for fields in entries],
+                    batch_size=BATCH_SIZE,
+                )
+            except DatabaseError:
+                # Put the batch back in its original order for the next flush
+                _queue.extendleft(reversed(entries))
+                raise
+            written += len(entries)
+    return written
+
+
+def _schedule_flush():
+    global _timer
+    with _timer_lock:
+        if _timer is None:
+            _timer = threading.Timer(FLUSH_INTERVAL, _flush_from_timer)
+            _timer.daemon = True
+            _timer.start()
+
+
+def _flush_from_timer():
+    global _timer
+    with _timer_lock:
+        _timer = None
+    try:
+        flush()
+    except Exception as e:
+        logger.error(f"Error flushing API key usage logs: {e}")
+    finally:
+        # The timer thread opened its own connection; don't leak it
+        connections.close_all()
+
+
+@atexit.register
+def _flush_on_shutdown():
+    if _queue:
+        try:
+            flush()
+        except Exception as e:
+            logger.error(f"Error flushing API key usage logs on shutdown: {e}")
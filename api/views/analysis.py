@@ -1,11 +1,82 @@
 """
 Views for genetic analysis endpoints
 """
+import hashlib
+import json
+
+import numpy as np
+from django.http import HttpResponse, HttpResponseNotModified
 from rest_framework import viewsets, status
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
+from rest_framework.reverse import reverse
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from genetic_engine.genetic_analysis_service import GeneticAnalysisService
+from genetic_engine.codon_translator import CodonTranslator
+from genetic_engine.hexagram_mapper import HexagramMapper
+from api.utils import codon_kernels
+
+# Sequences at least this long are analyzed by a Celery worker
+SYNC_ANALYSIS_MAX_LENGTH = 1000
+
+# Mapping scheme -> codon index -> hexagram number (0 if unmapped), built on first use
+_SCHEME_TABLES = {}
+
+
+def _scheme_table(scheme):
+    """Hexagram lookup table for a mapping scheme, built once from HexagramMapper"""
+    if scheme not in CodonTranslator.BINARY_SCHEMES:
+        scheme = 'scheme_1'  # CodonTranslator's own fallback
+    table = _SCHEME_TABLES.get(scheme)
+    if table is None:
+        mapper = HexagramMapper()
+        table = np.zeros(codon_kernels.INVALID_CODON + 1, dtype=np.uint8)
+        for index in range(codon_kernels.INVALID_CODON):
+            codon = ''.join('ACGT'[(index >> shift) & 3] for shift in (4, 2, 0))
+            table[index] = mapper.map_codon_to_hexagram(codon, scheme) or 0
+        _SCHEME_TABLES[scheme] = table
+    return table
+
+
+def _map_codons(codons, scheme):
+    """Vectorized HexagramMapper.batch_map_codons() for A/C/G/T codons"""
+    if not all(isinstance(codon, str) and len(codon) == 3 for codon in codons):
+        return HexagramMapper().batch_map_codons(codons, scheme=scheme)
+
+    buf = np.frombuffer(''.join(codons).encode('ascii', 'replace'), dtype=np.uint8)
+    indices = codon_kernels.codon_indices(codon_kernels.encode_bases(buf))
+    hexagrams = _scheme_table(scheme)[indices].tolist()
+
+    # Codons with other bases (e.g. RNA 'U') keep the mapper's per-codon rules
+    invalid = np.flatnonzero(indices == codon_kernels.INVALID_CODON)
+    if invalid.size:
+        mapper = HexagramMapper()
+        for i in invalid.tolist():
+            hexagrams[i] = mapper.map_codon_to_hexagram(codons[i], scheme) or 0
+    return hexagrams
+
+
+# Static payload for the mapping_schemes endpoint, serialized once
+_MAPPING_SCHEMES = {
+    'scheme_1': {
+        'name': 'Purine/Pyrimidine',
+        'description': 'A/T=0, G/C=1 (based on chemical structure)',
+    },
+    'scheme_2': {
+        'name': 'AT/GC Alternation',
+        'description': 'A=0, T=1, G=0, C=1',
+    },
+    'scheme_3': {
+        'name': 'Hydrogen Bond Count',
+        'description': 'A/T=0 (2 bonds), G/C=1 (3 bonds)',
+    },
+    'scheme_4': {
+        'name': 'Molecular Weight',
+        'description': 'Based on molecular weight differences',
+    },
+}
+_MAPPING_SCHEMES_JSON = json.dumps(_MAPPING_SCHEMES).encode()
+_MAPPING_SCHEMES_ETAG = f'"{hashlib.md5(_MAPPING_SCHEMES_JSON).hexdigest()}"'
 
 
 class AnalysisViewSet(viewsets.ViewSet):
@@ -91,6 +162,16 @@ class AnalysisViewSet(viewsets.ViewSet):
         if not sequence:
             return Response({'error': 'Sequence is required'}, status=400)
 
+        if len(sequence) >= SYNC_ANALYSIS_MAX_LENGTH:
+            from api.tasks import analyze_sequence_task
+            task = analyze_sequence_task.delay(
+                request.user.pk, sequence, name, sequence_type, mapping_scheme
+            )
+            return Response({
+                'job_id': task.id,
+                'status_url': reverse('analysis-job', kwargs={'job_id': task.id}, request=request),
+            }, status=status.HTTP_202_ACCEPTED)
+
         service = GeneticAnalysisService(user=request.user)
         results = service.analyze_sequence(
             sequence=sequence,
@@ -102,6 +183,26 @@ class AnalysisViewSet(viewsets.ViewSet):
 
         return Response(results)
 
+    @action(detail=False, methods=['get'], url_path=r'job/(?P<job_id>[^/.]+)', url_name='job')
+    def job(self, request, job_id=None):
+        """
+        Get the status or result of a background sequence analysis.
+
+        GET /api/analysis/job/<job_id>/
+        """
+        from celery.result import AsyncResult
+
+        result = AsyncResult(job_id)
+        if not result.ready():
+            return Response({'job_id': job_id, 'status': result.status})
+        if result.failed():
+            return Response({'job_id': job_id, 'status': result.status}, status=500)
+
+        payload = result.result
+        if payload.get('user_id') != request.user.pk:
+            return Response({'error': 'Job not found'}, status=404)
+        return Response({'job_id': job_id, 'status': result.status, 'results': payload['results']})
+
     @action(detail=False, methods=['post'], permission_classes=[AllowAny])
     def translate_codons(self, request):
         """
@@ -119,10 +220,7 @@ class AnalysisViewSet(viewsets.ViewSet):
         if not codons:
             return Response({'error': 'Codons list is required'}, status=400)
 
-        from genetic_engine.hexagram_mapper import HexagramMapper
-        mapper = HexagramMapper()
-
-        results = mapper.batch_map_codons(codons, scheme=mapping_scheme)
+        results = _map_codons(codons, mapping_scheme)
 
         return Response({
             'codons': codons,
@@ -137,25 +235,12 @@ class AnalysisViewSet(viewsets.ViewSet):
 
         GET /api/analysis/mapping_schemes/
         """
-        schemes = {
-            'scheme_1': {
-                'name': 'Purine/Pyrimidine',
-                'description': 'A/T=0, G/C=1 (based on chemical structure)',
-            },
-            'scheme_2': {
-                'name': 'AT/GC Alternation',
-                'description': 'A=0, T=1, G=0, C=1',
-            },
-            'scheme_3': {
-                'name': 'Hydrogen Bond Count',
-                'description': 'A/T=0 (2 bonds), G/C=1 (3 bonds)',
-            },
-            'scheme_4': {
-                'name': 'Molecular Weight',
-                'description': 'Based on molecular weight differences',
-            },
-        }
-        return Response(schemes)
+        if request.headers.get('If-None-Match') == _MAPPING_SCHEMES_ETAG:
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(_MAPPING_SCHEMES_JSON, content_type='application/json')
+        response['ETag'] = _MAPPING_SCHEMES_ETAG
+        return response
 
 
 @api_view(['GET'])
@@ -1,6 +1,10 @@
 """
 Views for Codon API endpoints
 """
+from django.db.models.signals import post_delete, post_migrate, post_save
+from django.dispatch import receiver
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
 from rest_framework import viewsets, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -8,6 +12,28 @@ from django_filters.rest_framework import DjangoFilterBackend
 from api.models import Codon
 from api.serializers import CodonSerializer
 
+# Codons are seeded reference data, so responses are cached for a day
+CODON_CACHE_TIMEOUT = 60 * 60 * 24
+cache_codons = method_decorator(cache_page(CODON_CACHE_TIMEOUT, key_prefix='codons'))
+
+# Serialized codons grouped for the lookup actions, built on first use
+_CODON_GROUPS = None
+
+
+def _codon_groups():
+    """Start, stop and per-amino-acid codon lists, serialized once per process"""
+    global _CODON_GROUPS
+    if _CODON_GROUPS is None:
+        groups = {'start': [], 'stop': [], 'amino_acid': {}}
+        for row in CodonSerializer(Codon.objects.order_by('sequence'), many=True).data:
+            if row['is_start']:
+                groups['start'].append(row)
+            if row['is_stop']:
+                groups['stop'].append(row)
+            groups['amino_acid'].setdefault(row['amino_acid_code'], []).append(row)
+        _CODON_GROUPS = groups
+    return _CODON_GROUPS
+
 
 class CodonViewSet(viewsets.ReadOnlyModelViewSet):
     """
@@ -27,7 +53,19 @@ class CodonViewSet(viewsets.ReadOnlyModelViewSet):
     ordering_fields = ['sequence', 'amino_acid']
     ordering = ['sequence']
 
+    def get_queryset(self):
+        """Join the hexagram when the action serializes it"""
+        queryset = super().get_queryset()
+        if self.action == 'hexagram':
+            return queryset.select_related('mapped_hexagram')
+        return queryset
+
+    @cache_codons
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
     @action(detail=True, methods=['get'])
+    @cache_codons
     def hexagram(self, request, pk=None):
         """Get the hexagram associated with this codon"""
         codon = self.get_object()
@@ -38,26 +76,31 @@ class CodonViewSet(viewsets.ReadOnlyModelViewSet):
         return Response({'hexagram': None}, status=404)
 
     @action(detail=False, methods=['get'])
+    @cache_codons
     def start_codons(self, request):
         """Get all start codons"""
-        start_codons = self.queryset.filter(is_start=True)
-        serializer = self.get_serializer(start_codons, many=True)
-        return Response(serializer.data)
+        return Response(_codon_groups()['start'])
 
     @action(detail=False, methods=['get'])
+    @cache_codons
     def stop_codons(self, request):
         """Get all stop codons"""
-        stop_codons = self.queryset.filter(is_stop=True)
-        serializer = self.get_serializer(stop_codons, many=True)
-        return Response(serializer.data)
+        return Response(_codon_groups()['stop'])
 
     @action(detail=False, methods=['get'])
+    @cache_codons
     def by_amino_acid(self, request):
         """Get codons that code for a specific amino acid"""
         amino_acid = request.query_params.get('code')
         if not amino_acid:
             return Response({'error': 'Amino acid code required'}, status=400)
 
-        codons = self.queryset.filter(amino_acid_code=amino_acid.upper())
-        serializer = self.get_serializer(codons, many=True)
-        return Response(serializer.data)
+        return Response(_codon_groups()['amino_acid'].get(amino_acid.upper(), []))
+
+
+@receiver([post_save, post_delete], sender=Codon)
+@receiver(post_migrate)
+def reset_codon_groups(**kwargs):
+    """Drop the serialized codon groups when codons change"""
+    global _CODON_GROUPS
+    _CODON_GROUPS = None
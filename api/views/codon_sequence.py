@@ -7,10 +7,11 @@ from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.permissions import IsAuthenticated
 from api.models import CodonSequence
-from api.serializers import CodonSequenceSerializer
+from api.serializers import CodonSequenceSerializer, CodonSequenceListSerializer
+from .mixins import SelectRelatedMixin, serializer_columns
 
 
-class CodonSequenceViewSet(viewsets.ModelViewSet):
+class CodonSequenceViewSet(SelectRelatedMixin, viewsets.ModelViewSet):
     """
     API endpoint for CodonSequence model.
 
@@ -33,7 +34,16 @@ class CodonSequenceViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Return sequences for the current user"""
-        return CodonSequence.objects.filter(user=self.request.user)
+        queryset = CodonSequence.objects.filter(user=self.request.user)
+        if self.action == 'list':
+            return queryset.only(*serializer_columns(CodonSequenceListSerializer))
+        return queryset
+
+    def get_serializer_class(self):
+        """Use the compact serializer for lists"""
+        if self.action == 'list':
+            return CodonSequenceListSerializer
+        return CodonSequenceSerializer
 
     @action(detail=False, methods=['post'])
     def analyze(self, request):
@@ -73,6 +83,9 @@ class CodonSequenceViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def reference_sequences(self, request):
         """Get all reference sequences"""
-        references = CodonSequence.objects.filter(is_reference=True)
-        serializer = self.get_serializer(references, many=True)
-        return Response(serializer.data)
+        references = CodonSequence.objects.filter(
+            is_reference=True
+        ).values(
+            'id', 'name', 'description', 'organism', 'gene_name', 'codon_count'
+        ).order_by('name')
+        return Response(list(references))
@@ -1,14 +1,28 @@
 """
 Views for Comparative Analysis endpoints
 """
+import hashlib
+import json
+import uuid
+from functools import lru_cache
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
 from genetic_engine.comparative_analyzer import ComparativeAnalyzer
 from api.models import ComparativeAnalysis
+from api.serializers.fields import normalize_sequence
 from api.serializers import (
     ComparativeAnalysisSerializer,
+    ComparativeAnalysisListSerializer,
     SequenceComparisonRequestSerializer,
     MappingComparisonRequestSerializer,
     StatisticalTestRequestSerializer,
@@ -16,6 +30,52 @@ from api.serializers import (
     ConservedRegionsRequestSerializer,
 )
 
+# Seconds to keep memoized ComparativeAnalyzer results
+COMPARISON_CACHE_TIMEOUT = 60 * 60
+
+
+@lru_cache(maxsize=1)
+def _get_analyzer():
+    """Shared ComparativeAnalyzer; it keeps no per-request state"""
+    return ComparativeAnalyzer()
+
+
+def _compare(method, **kwargs):
+    """
+    Call a ComparativeAnalyzer method, memoized in the cache.
+
+    The key is a BLAKE2b digest of the method arguments, so repeated
+    comparisons of the same sequences skip the analysis.
+    """
+    digest = hashlib.blake2b(
+        json.dumps(kwargs, sort_keys=True).encode(), digest_size=16
+    ).hexdigest()
+    key = f'comparative:{method}:{digest}'
+    results = cache.get(key)
+    if results is None:
+        results = getattr(_get_analyzer(), method)(**kwargs)
+        if 'error' not in results:
+            cache.set(key, results, COMPARISON_CACHE_TIMEOUT)
+    return results
+
+
+def _save_analysis(request, **fields):
+    """
+    Queue a ComparativeAnalysis INSERT to run after the response.
+
+    Returns the analysis uuid, which is allocated up front.
+    """
+    from api.tasks import save_comparative_analysis_task
+
+    analysis_uuid = str(uuid.uuid4())
+    # Round-trip through DRF's encoder so the Celery payload is plain JSON
+    fields = json.loads(json.dumps(fields, cls=JSONEncoder))
+    user_id = request.user.pk
+    transaction.on_commit(
+        lambda: save_comparative_analysis_task.delay(user_id, analysis_uuid, fields)
+    )
+    return analysis_uuid
+
 
 class ComparativeAnalysisViewSet(viewsets.ViewSet):
     """
@@ -38,31 +98,45 @@ class ComparativeAnalysisViewSet(viewsets.ViewSet):
 
     def list(self, request):
         """List all comparative analyses for the current user"""
-        analyses = ComparativeAnalysis.objects.filter(user=request.user)
-        serializer = ComparativeAnalysisSerializer(analyses, many=True)
-        return Response({
-            'count': analyses.count(),
-            'results': serializer.data
-        })
+        analyses = ComparativeAnalysis.objects.list_lite().filter(user=request.user)
+        paginator = api_settings.DEFAULT_PAGINATION_CLASS()
+        page = paginator.paginate_queryset(analyses, request, view=self)
+        serializer = ComparativeAnalysisListSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
     def retrieve(self, request, pk=None):
-        """Get a specific analysis by ID"""
+        """Get a specific analysis by ID or uuid"""
+        # results is only loaded (and decompressed) when the client lacks a fresh copy
+        analyses = ComparativeAnalysis.objects.select_related(
+            'sequence1_blob', 'sequence2_blob'
+        ).defer('results')
         try:
-            analysis = ComparativeAnalysis.objects.get(pk=pk)
-            # Check ownership or public
-            if analysis.user != request.user and not analysis.is_public:
-                return Response(
-                    {'error': 'You do not have permission to view this analysis'},
-                    status=status.HTTP_403_FORBIDDEN
-                )
-            serializer = ComparativeAnalysisSerializer(analysis)
-            return Response(serializer.data)
-        except ComparativeAnalysis.DoesNotExist:
+            if pk.isdigit():
+                analysis = analyses.get(pk=pk)
+            else:
+                analysis = analyses.get(uuid=pk)
+        except (ComparativeAnalysis.DoesNotExist, ValidationError):
             return Response(
                 {'error': 'Analysis not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
 
+        # Check ownership or public
+        if analysis.user_id != request.user.pk and not analysis.is_public:
+            return Response(
+                {'error': 'You do not have permission to view this analysis'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        etag = quote_etag(f'{analysis.pk}-{analysis.updated_at.timestamp()}')
+        last_modified = int(analysis.updated_at.timestamp())
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = Response(ComparativeAnalysisSerializer(analysis).data)
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        return response
+
     @action(detail=False, methods=['post'])
     def side_by_side(self, request):
         """
@@ -83,9 +157,8 @@ class ComparativeAnalysisViewSet(viewsets.ViewSet):
             return Response({'errors': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
         data = serializer.validated_data
-        analyzer = ComparativeAnalyzer()
-
-        results = analyzer.compare_sequences(
+        results = _compare(
+            'compare_sequences',
             sequence1=data['sequence1'],
             sequence2=data['sequence2'],
             mapping_scheme=data.get('mapping_scheme', 'scheme_1'),
@@ -99,8 +172,8 @@ class ComparativeAnalysisViewSet(viewsets.ViewSet):
         # Optionally save
         save_analysis = request.data.get('save_analysis', False)
         if save_analysis and 'error' not in results:
-            analysis = ComparativeAnalysis.objects.create(
-                user=request.user,
+            results['saved_analysis_id'] = _save_analysis(
+                request,
                 analysis_type=ComparativeAnalysis.AnalysisType.SEQUENCE_COMPARISON,
                 sequence1=data['sequence1'],
                 sequence2=data['sequence2'],
@@ -112,7 +185,6 @@ class ComparativeAnalysisViewSet(viewsets.ViewSet):
                 match_percentage=results.get('match_percentage', 0.0),
                 analysis_description=f"Comparison of {data.get('sequence1_name', 'Sequence 1')} and {data.get('sequence2_name', 'Sequence 2')}",
             )
-            results['saved_analysis_id'] = analysis.id
 
         return Response(results)
 
@@ -132,9 +204,8 @@ class ComparativeAnalysisViewSet(viewsets.ViewSet):
             return Response({'errors': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
         data = serializer.validated_data
-        analyzer = ComparativeAnalyzer()
-
-        results = analyzer.compare_mapping_schemes(
+        results = _compare(
+            'compare_mapping_schemes',
             sequence=data['sequence'],
             schemes=data.get('schemes', ['scheme_1', 'scheme_2', 'scheme_3', 'scheme_4'])
         )
@@ -142,15 +213,14 @@ class ComparativeAnalysisViewSet(viewsets.ViewSet):
         # Optionally save
         save_analysis = request.data.get('save_analysis', False)
         if save_analysis and 'error' not in results:
-            analysis = ComparativeAnalysis.objects.create(
-                user=request.user,
+            results['saved_analysis_id'] = _save_analysis(
+                request,
                 analysis_type=ComparativeAnalysis.AnalysisType.MAPPING_COMPARISON,
                 sequence1=data['sequence'],
                 mapping_schemes=data.get('schemes', ['scheme_1', 'scheme_2', 'scheme_3', 'scheme_4']),
                 results=results,
                 analysis_description=f"Mapping scheme comparison on {len(data['sequence'])}bp sequence",
             )
-            results['saved_analysis_id'] = analysis.id
 
         return Response(results)
 
@@ -172,9 +242,8 @@ class ComparativeAnalysisViewSet(viewsets.ViewSet):
             return Response({'errors': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
         data = serializer.validated_data
-        analyzer = ComparativeAnalyzer()
-
-        results = analyzer.statistical_significance_test(
+        results = _compare(
+            'statistical_significance_test',
             sequence1=data['sequence1'],
             sequence2=data['sequence2'],
             test_type=data.get('test_type', 'chi_square'),
@@ -184,8 +253,8 @@ class ComparativeAnalysisViewSet(viewsets.ViewSet):
         # Optionally save
         save_analysis = request.data.get('save_analysis', False)
         if save_analysis and 'error' not in results:
-            analysis = ComparativeAnalysis.objects.create(
-                user=request.user,
+            results['saved_analysis_id'] = _save_analysis(
+                request,
                 analysis_type=ComparativeAnalysis.AnalysisType.STATISTICAL_TEST,
                 sequence1=data['sequence1'],
                 sequence2=data['sequence2'],
@@ -196,7 +265,6 @@ class ComparativeAnalysisViewSet(viewsets.ViewSet):
                 is_significant=results.get('is_significant'),
                 analysis_description=f"{data.get('test_type', 'chi_square')} test",
             )
-            results['saved_analysis_id'] = analysis.id
 
         return Response(results)
 
@@ -217,9 +285,8 @@ class ComparativeAnalysisViewSet(viewsets.ViewSet):
             return Response({'errors': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
         data = serializer.validated_data
-        analyzer = ComparativeAnalyzer()
-
-        results = analyzer.compare_multiple_sequences(
+        results = _compare(
+            'compare_multiple_sequences',
             sequences=data['sequences'],
             sequence_names=data.get('sequence_names'),
             mapping_scheme=data.get('mapping_scheme', 'scheme_1')
@@ -228,8 +295,8 @@ class ComparativeAnalysisViewSet(viewsets.ViewSet):
         # Optionally save
         save_analysis = request.data.get('save_analysis', False)
         if save_analysis and 'error' not in results:
-            analysis = ComparativeAnalysis.objects.create(
-                user=request.user,
+            results['saved_analysis_id'] = _save_analysis(
+                request,
                 analysis_type=ComparativeAnalysis.AnalysisType.MULTIPLE_SEQUENCE,
                 sequence1=data['sequences'][0] if data['sequences'] else '',
                 sequence2=data['sequences'][1] if len(data['sequences']) > 1 else '',
@@ -238,7 +305,6 @@ class ComparativeAnalysisViewSet(viewsets.ViewSet):
                 results=results,
                 analysis_description=f"Comparison of {len(data['sequences'])} sequences",
             )
-            results['saved_analysis_id'] = analysis.id
 
         return Response(results)
 
@@ -260,9 +326,8 @@ class ComparativeAnalysisViewSet(viewsets.ViewSet):
             return Response({'errors': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
         data = serializer.validated_data
-        analyzer = ComparativeAnalyzer()
-
-        results = analyzer.find_conserved_regions(
+        results = _compare(
+            'find_conserved_regions',
             sequences=data['sequences'],
             window_size=data.get('window_size', 5),
             min_conservation=data.get('min_conservation', 0.8),
@@ -272,8 +337,8 @@ class ComparativeAnalysisViewSet(viewsets.ViewSet):
         # Optionally save
         save_analysis = request.data.get('save_analysis', False)
         if save_analysis and 'error' not in results:
-            analysis = ComparativeAnalysis.objects.create(
-                user=request.user,
+            results['saved_analysis_id'] = _save_analysis(
+                request,
                 analysis_type=ComparativeAnalysis.AnalysisType.CONSERVED_REGIONS,
                 sequence1=data['sequences'][0] if data['sequences'] else '',
                 additional_sequences=data['sequences'][1:] if len(data['sequences']) > 1 else None,
@@ -283,7 +348,6 @@ class ComparativeAnalysisViewSet(viewsets.ViewSet):
                 min_conservation=data.get('min_conservation', 0.8),
                 analysis_description=f"Conserved regions in {len(data['sequences'])} sequences",
             )
-            results['saved_analysis_id'] = analysis.id
 
         return Response(results)
 
@@ -309,8 +373,17 @@ class ComparativeAnalysisViewSet(viewsets.ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        analyzer = ComparativeAnalyzer()
-        results = analyzer.calculate_similarity_metrics(
+        # Reject bad input before the analyzer walks it codon by codon
+        sequence1 = normalize_sequence(sequence1)
+        sequence2 = normalize_sequence(sequence2)
+        if sequence1 is None or sequence2 is None:
+            return Response(
+                {'error': 'Sequences may only contain A, C, G, T, U or N'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        results = _compare(
+            'calculate_similarity_metrics',
             sequence1=sequence1,
             sequence2=sequence2,
             mapping_scheme=mapping_scheme
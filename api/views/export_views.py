@@ -1,13 +1,39 @@
 """
 Views for Export endpoints
 """
+from functools import lru_cache
+
+from django.http import StreamingHttpResponse
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.reverse import reverse
 from rest_framework.permissions import IsAuthenticated
 from genetic_engine.export_service import ExportService
 from genetic_engine.codon_translator import CodonTranslator
 
+# Sequences at least this long are exported by a Celery worker
+SYNC_EXPORT_MAX_LENGTH = 1000
+
+
+@lru_cache(maxsize=1)
+def _get_export_service():
+    """Shared ExportService; it keeps no per-request state"""
+    return ExportService()
+
+
+@lru_cache(maxsize=8)
+def _get_translator(mapping_scheme):
+    """Shared CodonTranslator per mapping scheme"""
+    return CodonTranslator(mapping_scheme=mapping_scheme)
+
+
+def _download(chunks, filename, content_type):
+    """Stream export chunks as a file attachment"""
+    response = StreamingHttpResponse(chunks, content_type=content_type)
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
 
 class ExportViewSet(viewsets.ViewSet):
     """
@@ -24,9 +50,9 @@ class ExportViewSet(viewsets.ViewSet):
 
     permission_classes = [IsAuthenticated]
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.export_service = ExportService()
+    @property
+    def export_service(self):
+        return _get_export_service()
 
     @action(detail=False, methods=['post'])
     def csv(self, request):
@@ -36,7 +62,8 @@ class ExportViewSet(viewsets.ViewSet):
         POST /api/export/csv/
         {
             "data": {...},  // Analysis results
-            "include_metadata": true
+            "include_metadata": true,
+            "download": false  // Stream the file instead of a JSON envelope
         }
         """
         data = request.data.get('data', {})
@@ -48,17 +75,24 @@ class ExportViewSet(viewsets.ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        csv_content = self.export_service.export_to_csv(
-            data,
-            include_metadata=include_metadata
-        )
-
         filename = self.export_service.generate_export_filename(
             analysis_type=data.get('analysis_type', 'analysis'),
             format_type='csv',
             sequence_identifier=data.get('sequence_name')
         )
 
+        if request.data.get('download'):
+            return _download(
+                self.export_service.iter_csv(data, include_metadata=include_metadata),
+                filename,
+                'text/csv'
+            )
+
+        csv_content = self.export_service.export_to_csv(
+            data,
+            include_metadata=include_metadata
+        )
+
         return Response({
             'content': csv_content,
             'filename': filename,
@@ -75,7 +109,8 @@ class ExportViewSet(viewsets.ViewSet):
         {
             "data": {...},
             "pretty": true,
-            "include_metadata": true
+            "include_metadata": true,
+            "download": false
         }
         """
         data = request.data.get('data', {})
@@ -88,18 +123,25 @@ class ExportViewSet(viewsets.ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        json_content = self.export_service.export_to_json(
-            data,
-            pretty=pretty,
-            include_metadata=include_metadata
-        )
-
         filename = self.export_service.generate_export_filename(
             analysis_type=data.get('analysis_type', 'analysis'),
             format_type='json',
             sequence_identifier=data.get('sequence_name')
         )
 
+        if request.data.get('download'):
+            return _download(
+                self.export_service.iter_json(data, pretty=pretty, include_metadata=include_metadata),
+                filename,
+                'application/json'
+            )
+
+        json_content = self.export_service.export_to_json(
+            data,
+            pretty=pretty,
+            include_metadata=include_metadata
+        )
+
         return Response({
             'content': json_content,
             'filename': filename,
@@ -116,7 +158,8 @@ class ExportViewSet(viewsets.ViewSet):
         {
             "sequence": "ATGCGATAA...",
             "hexagram_sequence": [1, 2, 3, ...],
-            "sequence_name": "My Sequence"
+            "sequence_name": "My Sequence",
+            "download": false
         }
         """
         sequence = request.data.get('sequence', '')
@@ -129,6 +172,24 @@ class ExportViewSet(viewsets.ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        filename = self.export_service.generate_export_filename(
+            analysis_type='sequence',
+            format_type='fasta',
+            sequence_identifier=sequence_name
+        )
+
+        if request.data.get('download'):
+            return _download(
+                self.export_service.iter_fasta(
+                    sequence=sequence,
+                    hexagram_sequence=hexagram_sequence,
+                    sequence_name=sequence_name,
+                    include_hexagram_annotations=True
+                ),
+                filename,
+                'text/plain'
+            )
+
         fasta_content = self.export_service.export_to_fasta(
             sequence=sequence,
             hexagram_sequence=hexagram_sequence,
@@ -136,12 +197,6 @@ class ExportViewSet(viewsets.ViewSet):
             include_hexagram_annotations=True
         )
 
-        filename = self.export_service.generate_export_filename(
-            analysis_type='sequence',
-            format_type='fasta',
-            sequence_identifier=sequence_name
-        )
-
         return Response({
             'content': fasta_content,
             'filename': filename,
@@ -269,38 +324,40 @@ class ExportViewSet(viewsets.ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Translate sequence to hexagrams
-        translator = CodonTranslator(mapping_scheme=mapping_scheme)
-        hexagram_sequence = translator.translate_sequence(sequence)
-
-        # Build data structure
-        data = {
-            'analysis_type': 'sequence_analysis',
-            'sequence': sequence,
-            'sequence_name': sequence_name,
-            'sequence_length': len(sequence),
-            'mapping_scheme': mapping_scheme,
-            'hexagram_sequence': hexagram_sequence,
-            'codon_count': len(hexagram_sequence)
-        }
-
-        # Add frequency data
-        from collections import Counter
-        valid_hexagrams = [h for h in hexagram_sequence if h > 0]
-        if valid_hexagrams:
-            data['hexagram_frequency'] = dict(Counter(valid_hexagrams))
-
-        # Export to requested formats
-        base_filename = self.export_service.generate_export_filename(
-            analysis_type='sequence',
-            format_type='',
-            sequence_identifier=sequence_name
-        ).rstrip('.')
+        if len(sequence) >= SYNC_EXPORT_MAX_LENGTH:
+            from api.tasks import export_sequence_task
+            task = export_sequence_task.delay(
+                request.user.pk, sequence, formats, sequence_name, mapping_scheme
+            )
+            return Response({
+                'task_id': task.id,
+                'status_url': reverse('export-task', kwargs={'task_id': task.id}, request=request),
+            }, status=status.HTTP_202_ACCEPTED)
+
+        return Response(self.export_service.export_sequence(
+            sequence,
+            formats,
+            sequence_name=sequence_name,
+            mapping_scheme=mapping_scheme,
+            translator=_get_translator(mapping_scheme)
+        ))
 
-        exports = self.export_service.batch_export(data, formats, base_filename)
+    @action(detail=False, methods=['get'], url_path=r'tasks/(?P<task_id>[^/.]+)', url_name='task')
+    def tasks(self, request, task_id=None):
+        """
+        Get the status or result of a background sequence export.
 
-        return Response({
-            'exports': exports,
-            'count': len(exports),
-            'data': data
-        })
+        GET /api/export/tasks/<task_id>/
+        """
+        from celery.result import AsyncResult
+
+        result = AsyncResult(task_id)
+        if not result.ready():
+            return Response({'task_id': task_id, 'status': result.status})
+        if result.failed():
+            return Response({'task_id': task_id, 'status': result.status}, status=500)
+
+        payload = result.result
+        if payload.get('user_id') != request.user.pk:
+            return Response({'error': 'Task not found'}, status=404)
+        return Response({'task_id': task_id, 'status': result.status, **payload['results']})
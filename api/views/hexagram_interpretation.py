@@ -8,9 +8,10 @@ from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.permissions import IsAuthenticated
 from api.models import HexagramInterpretation, Hexagram
 from api.serializers import HexagramInterpretationSerializer
+from .mixins import SelectRelatedMixin
 
 
-class HexagramInterpretationViewSet(viewsets.ModelViewSet):
+class HexagramInterpretationViewSet(SelectRelatedMixin, viewsets.ModelViewSet):
     """
     API endpoint for HexagramInterpretation model.
 
@@ -8,9 +8,10 @@ from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from api.models import CodonHexagramMapping
 from api.serializers import CodonHexagramMappingSerializer
+from .mixins import SelectRelatedMixin
 
 
-class CodonHexagramMappingViewSet(viewsets.ModelViewSet):
+class CodonHexagramMappingViewSet(SelectRelatedMixin, viewsets.ModelViewSet):
     """
     API endpoint for CodonHexagramMapping model.
 
@@ -97,7 +98,6 @@ class CodonHexagramMappingViewSet(viewsets.ModelViewSet):
         from genetic_engine.hexagram_mapper import HexagramMapper
 
         mapper = HexagramMapper()
-        mapping_dict = {rule['codon']: rule['hexagram'] for rule in mapping.mapping_rules}
-        validation = mapper.validate_mapping(mapping_dict)
+        validation = mapper.validate_mapping(mapping.get_rules_map())
 
         return Response(validation)
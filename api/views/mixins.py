@@ -0,0 +1,91 @@
+"""
+Shared ViewSet mixins
+"""
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+# Serializer class -> select_related() paths found by introspection
+_RELATED_PATHS = {}
+
+# Serializer class -> model columns it renders
+_SERIALIZER_COLUMNS = {}
+
+
+def _forward_path(model, source):
+    """'fk__fk' path for the forward relations at the start of a dotted source"""
+    path = []
+    for name in source.split('.'):
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            break
+        if not field.concrete or not (field.many_to_one or field.one_to_one):
+            break
+        path.append(name)
+        model = field.related_model
+    return '__'.join(path)
+
+
+def related_paths(serializer_class):
+    """
+    select_related() paths a serializer traverses.
+
+    Uses the serializer's select_related_fields if declared, otherwise
+    inspects dotted sources and nested serializers on its fields. The
+    result is cached per serializer class.
+    """
+    paths = _RELATED_PATHS.get(serializer_class)
+    if paths is None:
+        paths = getattr(serializer_class, 'select_related_fields', None)
+        if paths is None:
+            paths = []
+            model = getattr(getattr(serializer_class, 'Meta', None), 'model', None)
+            if model is not None:
+                for field in serializer_class().fields.values():
+                    if field.source == '*' or (
+                        '.' not in field.source and not isinstance(field, serializers.BaseSerializer)
+                    ):
+                        continue
+                    path = _forward_path(model, field.source)
+                    if path and path not in paths:
+                        paths.append(path)
+        _RELATED_PATHS[serializer_class] = paths
+    return paths
+
+
+def serializer_columns(serializer_class):
+    """
+    Concrete model fields a ModelSerializer reads, for QuerySet.only().
+
+    Fields backed by methods, properties or related paths are skipped;
+    the primary key is always included.
+    """
+    columns = _SERIALIZER_COLUMNS.get(serializer_class)
+    if columns is None:
+        opts = serializer_class.Meta.model._meta
+        columns = [opts.pk.name]
+        for field in serializer_class().fields.values():
+            try:
+                model_field = opts.get_field(field.source)
+            except FieldDoesNotExist:
+                continue
+            if model_field.concrete and model_field.name not in columns:
+                columns.append(model_field.name)
+        _SERIALIZER_COLUMNS[serializer_class] = columns
+    return columns
+
+
+class SelectRelatedMixin:
+    """
+    Join the foreign keys the serializer reads through source='fk.field'.
+
+    Relations come from related_paths(), so list endpoints issue one
+    query instead of one per row and relation.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        paths = related_paths(self.get_serializer_class())
+        if paths:
+            queryset = queryset.select_related(*paths)
+        return queryset
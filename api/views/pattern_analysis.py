@@ -12,6 +12,7 @@ from genetic_engine.hexagram_mapper import HexagramMapper
 from api.models import AnalysisPattern
 from api.serializers import (
     AnalysisPatternSerializer,
+    AnalysisPatternListSerializer,
     PatternMatchSerializer,
     PositionAnalysisRequestSerializer,
     SlidingWindowRequestSerializer,
@@ -42,8 +43,8 @@ class PatternAnalysisViewSet(viewsets.ViewSet):
 
     def list(self, request):
         """List all saved patterns for the current user"""
-        patterns = AnalysisPattern.objects.filter(user=request.user)
-        serializer = AnalysisPatternSerializer(patterns, many=True)
+        patterns = AnalysisPattern.objects.for_list().filter(user=request.user)
+        serializer = AnalysisPatternListSerializer(patterns, many=True)
         return Response({
             'count': patterns.count(),
             'results': serializer.data
@@ -83,7 +84,7 @@ class PatternAnalysisViewSet(viewsets.ViewSet):
             return Response({'errors': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
         data = serializer.validated_data
-        sequence = data['sequence'].upper().replace(' ', '')
+        sequence = data['sequence']
         mapping_scheme = data.get('mapping_scheme', 'scheme_1')
 
         # Translate sequence to hexagrams
@@ -135,7 +136,7 @@ class PatternAnalysisViewSet(viewsets.ViewSet):
             return Response({'errors': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
         data = serializer.validated_data
-        sequence = data['sequence'].upper().replace(' ', '')
+        sequence = data['sequence']
         window_size = data.get('window_size', 3)
         step_size = data.get('step_size', 1)
         mapping_scheme = data.get('mapping_scheme', 'scheme_1')
@@ -196,7 +197,7 @@ class PatternAnalysisViewSet(viewsets.ViewSet):
             return Response({'errors': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
         data = serializer.validated_data
-        sequence = data['sequence'].upper().replace(' ', '')
+        sequence = data['sequence']
         motif_lengths = data.get('motif_lengths', [2, 3, 4, 5])
         min_occurrences = data.get('min_occurrences', 3)
         max_motifs = data.get('max_motifs', 20)
@@ -257,7 +258,7 @@ class PatternAnalysisViewSet(viewsets.ViewSet):
             return Response({'errors': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
 
         data = serializer.validated_data
-        sequences = [seq.upper().replace(' ', '') for seq in data['sequences']]
+        sequences = data['sequences']
         sequence_names = data.get('sequence_names', [f"Sequence_{i+1}" for i in range(len(sequences))])
         mapping_scheme = data.get('mapping_scheme', 'scheme_1')
 
@@ -25,8 +25,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
-    'djangorestframework',
-    'django.contrib.staticfiles',
+    'rest_framework',
     'corsheaders',
     'rest_framework_simplejwt',
     'django_crontab',
@@ -44,6 +43,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'api.middleware.APIKeyUsageMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'debug_toolbar.middleware.DebugToolbarMiddleware',
@@ -151,6 +151,12 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
+CELERY_BEAT_SCHEDULE = {
+    'flush-api-key-usage': {
+        'task': 'api.tasks.flush_api_key_usage',
+        'schedule': 30.0,
+    },
+}
 
 # Cache
 CACHES = {
@@ -171,10 +177,16 @@ SPECTACULAR_SETTINGS = {
     'SERVE_INCLUDE_SCHEMA': False,
 }
 
+# Mount the schema/docs URLs (api/docs_urls.py)
+ENABLE_API_DOCS = os.getenv('ENABLE_API_DOCS', str(DEBUG)) == 'True'
+
 # Google AI
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY', '')
 
 # Logging
+LOG_DIR = BASE_DIR / 'logs'
+LOG_DIR.mkdir(exist_ok=True)
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -184,7 +196,7 @@ LOGGING = {
         },
         'file': {
             'class': 'logging.FileHandler',
-            'filename': BASE_DIR / 'logs' / 'django.log',
+            'filename': LOG_DIR / 'django.log',
         },
     },
     'root': {
@@ -5,6 +5,7 @@ Production settings for Physiological G-Code.
 from .base import *
 
 DEBUG = False
+ENABLE_API_DOCS = os.getenv('ENABLE_API_DOCS', 'False') == 'True'
 
 # Security
 SECURE_SSL_REDIRECT = True
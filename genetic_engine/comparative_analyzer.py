@@ -355,6 +355,28 @@ class ComparativeAnalyzer:
 
         return result
 
+    def _jaccard_matrix(self, hexagram_sequences: List[List[int]]) -> List[List[float]]:
+        """
+        Pairwise Jaccard similarity of the valid hexagram sets.
+
+        Each sequence becomes a 64-column presence row, so every pair's
+        intersection comes out of one matrix product instead of a Python
+        set comparison per pair.
+        """
+        n = len(hexagram_sequences)
+        presence = np.zeros((n, 65), dtype=np.int64)
+        for i, hexagrams in enumerate(hexagram_sequences):
+            presence[i, np.asarray(hexagrams, dtype=np.intp)] = 1
+        presence = presence[:, 1:]  # Column 0 is the invalid-codon marker
+
+        intersection = presence @ presence.T
+        sizes = presence.sum(axis=1)
+        union = sizes[:, None] + sizes[None, :] - intersection
+        with np.errstate(divide='ignore', invalid='ignore'):
+            matrix = np.where(union > 0, intersection / union, 0.0)
+        np.fill_diagonal(matrix, 1.0)
+        return matrix.tolist()
+
     def _chi_square_test(
         self,
         hexagrams1: List[int],
@@ -506,19 +528,7 @@ class ComparativeAnalyzer:
 
         # Calculate similarity matrix
         n = len(sequences)
-        similarity_matrix = [[0.0] * n for _ in range(n)]
-
-        for i in range(n):
-            for j in range(n):
-                if i == j:
-                    similarity_matrix[i][j] = 1.0
-                elif i < j:
-                    sim = self._calculate_pairwise_similarity(
-                        hexagram_sequences[i],
-                        hexagram_sequences[j]
-                    )
-                    similarity_matrix[i][j] = sim['jaccard']
-                    similarity_matrix[j][i] = sim['jaccard']
+        similarity_matrix = self._jaccard_matrix(hexagram_sequences)
 
         # Calculate statistics for each sequence
         sequence_stats = []
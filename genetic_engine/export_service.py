@@ -2,16 +2,27 @@
 Export Service - Export analysis results to various formats
 """
 import logging
-import io
 import csv
 import json
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
+
+from .codon_translator import CodonTranslator
+
 logger = logging.getLogger(__name__)
 
 
+class _Echo:
+    """File-like object whose write() returns the value, for streaming csv.writer rows"""
+
+    def write(self, value):
+        return value
+
+
 class ExportService:
     """
     Service for exporting genetic-hexagram analysis results to various formats.
@@ -45,48 +56,66 @@ class ExportService:
         Returns:
             CSV-formatted string
         """
-        output = io.StringIO()
+        return ''.join(self.iter_csv(data, include_metadata=include_metadata))
+
+    def iter_csv(
+        self,
+        data: Dict[str, Any],
+        include_metadata: bool = True,
+        frequency_total: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Yield export_to_csv() output one row at a time.
+
+        Args:
+            data: Analysis results dictionary
+            include_metadata: Whether to include metadata rows
+            frequency_total: Precomputed sum of hexagram_frequency counts
+
+        Yields:
+            CSV-formatted lines
+        """
+        writer = csv.writer(_Echo())
 
         if include_metadata:
             # Write metadata
-            writer = csv.writer(output)
-            writer.writerow(['# Metadata'])
-            writer.writerow(['# Export Date', datetime.now().isoformat()])
-            writer.writerow(['# Analysis Type', data.get('analysis_type', 'Unknown')])
+            yield writer.writerow(['# Metadata'])
+            yield writer.writerow(['# Export Date', datetime.now().isoformat()])
+            yield writer.writerow(['# Analysis Type', data.get('analysis_type', 'Unknown')])
 
             if 'sequence_length' in data:
-                writer.writerow(['# Sequence Length', data['sequence_length']])
+                yield writer.writerow(['# Sequence Length', data['sequence_length']])
             if 'codon_count' in data:
-                writer.writerow(['# Codon Count', data['codon_count']])
+                yield writer.writerow(['# Codon Count', data['codon_count']])
             if 'mapping_scheme' in data:
-                writer.writerow(['# Mapping Scheme', data['mapping_scheme']])
+                yield writer.writerow(['# Mapping Scheme', data['mapping_scheme']])
 
-            writer.writerow([])  # Empty row separator
+            yield writer.writerow([])  # Empty row separator
 
         # Write data section
-        writer = csv.writer(output)
-
         # Handle different data structures
         if 'hexagram_sequence' in data:
             # Hexagram sequence export
             hexagrams = data['hexagram_sequence']
-            writer.writerow(['Position', 'Codon', 'Hexagram', 'Amino Acid'])
+            codons = data.get('codons') or []
+            amino_acids = data.get('amino_acids') or []
+            yield writer.writerow(['Position', 'Codon', 'Hexagram', 'Amino Acid'])
 
             for i, hexagram in enumerate(hexagrams):
-                writer.writerow([
+                yield writer.writerow([
                     i + 1,
-                    data.get('codons', [])[i] if 'codons' in data and i < len(data.get('codons', [])) else 'N/A',
+                    codons[i] if i < len(codons) else 'N/A',
                     hexagram if hexagram > 0 else 'Invalid',
-                    data.get('amino_acids', [])[i] if 'amino_acids' in data and i < len(data.get('amino_acids', [])) else 'N/A'
+                    amino_acids[i] if i < len(amino_acids) else 'N/A'
                 ])
 
         elif 'position_distribution' in data:
             # Position analysis export
-            writer.writerow(['Position', 'Hexagram', 'Frequency', 'Bias'])
+            yield writer.writerow(['Position', 'Hexagram', 'Frequency', 'Bias'])
 
             for pos, pos_data in data['position_distribution'].items():
                 dominant_hex, freq = pos_data.get('dominant_at_position', (0, 0))
-                writer.writerow([
+                yield writer.writerow([
                     pos,
                     dominant_hex,
                     f"{freq:.2%}",
@@ -95,10 +124,10 @@ class ExportService:
 
         elif 'motifs' in data:
             # Motif discovery export
-            writer.writerow(['Motif', 'Length', 'Occurrences', 'Frequency', 'Positions'])
+            yield writer.writerow(['Motif', 'Length', 'Occurrences', 'Frequency', 'Positions'])
 
             for motif in data['motifs']:
-                writer.writerow([
+                yield writer.writerow([
                     '-'.join(map(str, motif['motif'])),
                     motif['length'],
                     motif['occurrences'],
@@ -108,11 +137,11 @@ class ExportService:
 
         elif 'side_by_side' in data:
             # Side-by-side comparison export
-            writer.writerow(['Position', data.get('sequence1_name', 'Sequence 1'),
-                           data.get('sequence2_name', 'Sequence 2'), 'Match'])
+            yield writer.writerow(['Position', data.get('sequence1_name', 'Sequence 1'),
+                                   data.get('sequence2_name', 'Sequence 2'), 'Match'])
 
             for item in data['side_by_side']:
-                writer.writerow([
+                yield writer.writerow([
                     item['position'],
                     item['sequence1_hexagram'],
                     item['sequence2_hexagram'],
@@ -121,22 +150,22 @@ class ExportService:
 
         elif 'hexagram_frequency' in data:
             # Hexagram frequency export
-            writer.writerow(['Hexagram', 'Count', 'Frequency'])
+            yield writer.writerow(['Hexagram', 'Count', 'Frequency'])
 
-            for hexagram, count in data['hexagram_frequency'].items():
+            total = frequency_total
+            if total is None:
                 total = sum(data['hexagram_frequency'].values())
+            for hexagram, count in data['hexagram_frequency'].items():
                 freq = count / total if total > 0 else 0
-                writer.writerow([hexagram, count, f"{freq:.4f}"])
+                yield writer.writerow([hexagram, count, f"{freq:.4f}"])
 
         else:
             # Generic key-value export
-            writer.writerow(['Key', 'Value'])
+            yield writer.writerow(['Key', 'Value'])
             for key, value in data.items():
                 if isinstance(value, (dict, list)):
                     value = json.dumps(value)
-                writer.writerow([key, value])
-
-        return output.getvalue()
+                yield writer.writerow([key, value])
 
     def export_to_json(
         self,
@@ -155,6 +184,25 @@ class ExportService:
         Returns:
             JSON-formatted string
         """
+        return ''.join(self.iter_json(data, pretty=pretty, include_metadata=include_metadata))
+
+    def iter_json(
+        self,
+        data: Dict[str, Any],
+        pretty: bool = True,
+        include_metadata: bool = True
+    ) -> Iterator[str]:
+        """
+        Yield export_to_json() output in encoder-sized chunks.
+
+        Args:
+            data: Analysis results dictionary
+            pretty: Whether to format with indentation
+            include_metadata: Whether to include export metadata
+
+        Yields:
+            JSON text fragments
+        """
         export_data = dict(data)
 
         if include_metadata:
@@ -164,10 +212,8 @@ class ExportService:
                 'version': '1.0'
             }
 
-        if pretty:
-            return json.dumps(export_data, indent=2, default=str)
-        else:
-            return json.dumps(export_data, default=str)
+        encoder = json.JSONEncoder(indent=2 if pretty else None, default=str)
+        return encoder.iterencode(export_data)
 
     def export_to_fasta(
         self,
@@ -188,40 +234,61 @@ class ExportService:
         Returns:
             FASTA-formatted string
         """
-        output = io.StringIO()
+        return ''.join(self.iter_fasta(
+            sequence,
+            hexagram_sequence,
+            sequence_name=sequence_name,
+            include_hexagram_annotations=include_hexagram_annotations
+        ))
+
+    def iter_fasta(
+        self,
+        sequence: str,
+        hexagram_sequence: List[int],
+        sequence_name: str = "sequence",
+        include_hexagram_annotations: bool = True
+    ) -> Iterator[str]:
+        """
+        Yield export_to_fasta() output one line at a time.
+
+        Args:
+            sequence: DNA/RNA sequence
+            hexagram_sequence: List of hexagram numbers
+            sequence_name: Name for the sequence
+            include_hexagram_annotations: Whether to include hexagram data in comments
 
+        Yields:
+            FASTA-formatted lines
+        """
         # Write header
-        output.write(f">{sequence_name}")
+        header = f">{sequence_name}"
 
         if include_hexagram_annotations:
             hexagram_str = '-'.join(map(str, hexagram_sequence[:10]))  # First 10
             if len(hexagram_sequence) > 10:
                 hexagram_str += "..."
-            output.write(f" hexagrams={hexagram_str}")
+            header += f" hexagrams={hexagram_str}"
 
-        output.write("\n")
+        yield header + "\n"
 
         # Write sequence in blocks of 60 characters
         for i in range(0, len(sequence), 60):
-            output.write(sequence[i:i+60])
-            output.write("\n")
+            yield sequence[i:i+60] + "\n"
 
         # Write hexagram annotations as separate records
         if include_hexagram_annotations:
-            output.write(f">>{sequence_name}_hexagrams\n")
+            yield f">>{sequence_name}_hexagrams\n"
             hexagram_str = '-'.join(map(str, hexagram_sequence))
             for i in range(0, len(hexagram_str), 60):
-                output.write(hexagram_str[i:i+60])
-                output.write("\n")
-
-        return output.getvalue()
+                yield hexagram_str[i:i+60] + "\n"
 
     def export_to_image_data(
         self,
         data: Dict[str, Any],
         chart_type: str = 'bar',
         width: int = 800,
-        height: int = 600
+        height: int = 600,
+        sorted_frequency: Optional[List[Tuple[Any, int]]] = None
     ) -> Dict[str, Any]:
         """
         Prepare data for image/chart export.
@@ -234,6 +301,7 @@ class ExportService:
             chart_type: Type of chart ('bar', 'pie', 'line', 'heatmap')
             width: Chart width in pixels
             height: Chart height in pixels
+            sorted_frequency: Precomputed hexagram_frequency items, most frequent first
 
         Returns:
             Dictionary with chart data configuration
@@ -248,8 +316,7 @@ class ExportService:
 
         if chart_type == 'bar' and 'hexagram_frequency' in data:
             # Bar chart of hexagram frequencies
-            frequencies = data['hexagram_frequency']
-            sorted_hexagrams = sorted(frequencies.items(), key=lambda x: x[1], reverse=True)
+            sorted_hexagrams = sorted_frequency or self._sort_frequency(data['hexagram_frequency'])
 
             chart_config['data'] = {
                 'x': [str(h) for h, _ in sorted_hexagrams],
@@ -265,8 +332,7 @@ class ExportService:
 
         elif chart_type == 'pie' and 'hexagram_frequency' in data:
             # Pie chart of hexagram distribution
-            frequencies = data['hexagram_frequency']
-            sorted_hexagrams = sorted(frequencies.items(), key=lambda x: x[1], reverse=True)
+            sorted_hexagrams = sorted_frequency or self._sort_frequency(data['hexagram_frequency'])
 
             chart_config['data'] = {
                 'labels': [str(h) for h, _ in sorted_hexagrams],
@@ -330,7 +396,8 @@ class ExportService:
     def export_to_pdf(
         self,
         data: Dict[str, Any],
-        title: str = "Genetic-Hexagram Analysis Report"
+        title: str = "Genetic-Hexagram Analysis Report",
+        sorted_frequency: Optional[List[Tuple[Any, int]]] = None
     ) -> Dict[str, Any]:
         """
         Prepare data for PDF export.
@@ -341,6 +408,7 @@ class ExportService:
         Args:
             data: Analysis results dictionary
             title: Report title
+            sorted_frequency: Precomputed hexagram_frequency items, most frequent first
 
         Returns:
             Dictionary with PDF content structure
@@ -367,26 +435,25 @@ class ExportService:
 
         # Hexagram frequency table
         if 'hexagram_frequency' in data:
+            sorted_frequency = sorted_frequency or self._sort_frequency(data['hexagram_frequency'])
+            total = sum(count for _, count in sorted_frequency)
             pdf_content['sections'].append({
                 'type': 'table',
                 'title': 'Hexagram Frequency Distribution',
                 'headers': ['Hexagram', 'Count', 'Frequency'],
                 'rows': [
-                    [h, count, f"{count / sum(data['hexagram_frequency'].values()):.4f}"]
-                    for h, count in sorted(
-                        data['hexagram_frequency'].items(),
-                        key=lambda x: x[1],
-                        reverse=True
-                    )[:20]  # Limit to top 20
+                    [h, count, f"{count / total:.4f}"]
+                    for h, count in sorted_frequency[:20]  # Limit to top 20
                 ]
             })
 
-        # Chart data
-        if 'hexagram_frequency' in data:
+            # Chart data
             pdf_content['sections'].append({
                 'type': 'chart',
                 'title': 'Frequency Distribution Chart',
-                'chart_data': self.export_to_image_data(data, chart_type='bar')
+                'chart_data': self.export_to_image_data(
+                    data, chart_type='bar', sorted_frequency=sorted_frequency
+                )
             })
 
         # Pattern information
@@ -450,31 +517,121 @@ class ExportService:
         Returns:
             Dictionary mapping format to content
         """
-        exports = {}
-
-        for format_type in formats:
-            filename = f"{base_filename}.{format_type}"
-
-            try:
-                if format_type == 'csv':
-                    exports[filename] = self.export_to_csv(data)
-                elif format_type == 'json':
-                    exports[filename] = self.export_to_json(data)
-                elif format_type == 'fasta':
-                    # FASTA needs sequence and hexagram_sequence
-                    exports[filename] = self.export_to_fasta(
-                        data.get('sequence', ''),
-                        data.get('hexagram_sequence', []),
-                        data.get('sequence_name', base_filename)
-                    )
-                elif format_type == 'pdf_data':
-                    exports[filename] = self.export_to_pdf(data)
-                elif format_type == 'image_data':
-                    exports[filename] = self.export_to_image_data(data)
-                else:
-                    logger.warning(f"Unknown export format: {format_type}")
-            except Exception as e:
-                logger.error(f"Error exporting to {format_type}: {e}")
-                exports[filename] = f"Error: {str(e)}"
-
-        return exports
+        # Intermediates shared by several formats are derived once up front
+        sorted_frequency = None
+        if 'hexagram_frequency' in data:
+            sorted_frequency = self._sort_frequency(data['hexagram_frequency'])
+
+        def render(fmt):
+            return self._export_format(data, fmt, base_filename, sorted_frequency)
+
+        if len(formats) <= 1:
+            results = [render(fmt) for fmt in formats]
+        else:
+            # Formats are independent, so they are rendered concurrently
+            with ThreadPoolExecutor(max_workers=len(formats)) as executor:
+                results = list(executor.map(render, formats))
+
+        return {
+            filename: content
+            for filename, content in results
+            if content is not None
+        }
+
+    def _export_format(
+        self,
+        data: Dict[str, Any],
+        format_type: str,
+        base_filename: str,
+        sorted_frequency: Optional[List[Tuple[Any, int]]] = None
+    ) -> Tuple[str, Optional[str]]:
+        """Render one batch_export() format as (filename, content)"""
+        filename = f"{base_filename}.{format_type}"
+        frequency_total = None
+        if sorted_frequency is not None:
+            frequency_total = sum(count for _, count in sorted_frequency)
+
+        try:
+            if format_type == 'csv':
+                return filename, ''.join(self.iter_csv(data, frequency_total=frequency_total))
+            elif format_type == 'json':
+                return filename, self.export_to_json(data)
+            elif format_type == 'fasta':
+                # FASTA needs sequence and hexagram_sequence
+                return filename, self.export_to_fasta(
+                    data.get('sequence', ''),
+                    data.get('hexagram_sequence', []),
+                    data.get('sequence_name', base_filename)
+                )
+            elif format_type == 'pdf_data':
+                return filename, self.export_to_pdf(data, sorted_frequency=sorted_frequency)
+            elif format_type == 'image_data':
+                return filename, self.export_to_image_data(data, sorted_frequency=sorted_frequency)
+            else:
+                logger.warning(f"Unknown export format: {format_type}")
+        except Exception as e:
+            logger.error(f"Error exporting to {format_type}: {e}")
+            return filename, f"Error: {str(e)}"
+
+        return filename, None
+
+    @staticmethod
+    def _sort_frequency(frequencies: Dict[Any, int]) -> List[Tuple[Any, int]]:
+        """Return hexagram_frequency items ordered from most to least frequent"""
+        return sorted(frequencies.items(), key=lambda x: x[1], reverse=True)
+
+    def export_sequence(
+        self,
+        sequence: str,
+        formats: List[str],
+        sequence_name: str = 'sequence',
+        mapping_scheme: str = 'scheme_1',
+        translator: Optional[CodonTranslator] = None
+    ) -> Dict[str, Any]:
+        """
+        Translate a raw sequence and export it to several formats.
+
+        Args:
+            sequence: DNA/RNA sequence
+            formats: List of format types
+            sequence_name: Name for the sequence
+            mapping_scheme: Binary mapping scheme to use
+            translator: Optional CodonTranslator to reuse for mapping_scheme
+
+        Returns:
+            Dictionary with exports, count and the exported data
+        """
+        translator = translator or CodonTranslator(mapping_scheme=mapping_scheme)
+        hexagram_sequence = translator.translate_sequence(sequence)
+
+        # Build data structure
+        data = {
+            'analysis_type': 'sequence_analysis',
+            'sequence': sequence,
+            'sequence_name': sequence_name,
+            'sequence_length': len(sequence),
+            'mapping_scheme': mapping_scheme,
+            'hexagram_sequence': hexagram_sequence,
+            'codon_count': len(hexagram_sequence)
+        }
+
+        # Add frequency data (hexagrams are 1-64, 0 marks invalid codons)
+        counts = np.bincount(np.asarray(hexagram_sequence, dtype=np.intp), minlength=65)[1:]
+        if counts.any():
+            data['hexagram_frequency'] = {
+                int(i) + 1: int(counts[i]) for i in np.flatnonzero(counts)
+            }
+
+        base_filename = self.generate_export_filename(
+            analysis_type='sequence',
+            format_type='',
+            sequence_identifier=sequence_name
+        ).rstrip('.')
+
+        exports = self.batch_export(data, formats, base_filename)
+
+        return {
+            'exports': exports,
+            'count': len(exports),
+            'data': data
+        }
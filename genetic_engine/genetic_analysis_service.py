@@ -3,6 +3,7 @@ Genetic Analysis Service - Orchestrates codon-to-hexagram analysis
 """
 import logging
 from typing import Dict, List, Optional, Any
+from django.core.cache import cache
 from django.utils import timezone
 from django.db import transaction
 from django.contrib.auth import get_user_model
@@ -15,6 +16,22 @@ from .genetic_ai_client import GeneticGeminiClient
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+# Seconds to keep analyze_sequence() results for repeat requests
+ANALYSIS_CACHE_TIMEOUT = 60 * 60
+
+# (translator, mapper, ai_client) shared by every service instance; none of
+# them keep per-request state, so they are built once per process
+_SHARED_COMPONENTS = None
+
+
+def _shared_components():
+    """Translator, mapper and AI client, created on first use"""
+    global _SHARED_COMPONENTS
+    if _SHARED_COMPONENTS is None:
+        _SHARED_COMPONENTS = (CodonTranslator(), HexagramMapper(), GeneticGeminiClient())
+        logger.info("GeneticAnalysisService components initialized")
+    return _SHARED_COMPONENTS
+
 
 class GeneticAnalysisService:
     """
@@ -35,10 +52,7 @@ class GeneticAnalysisService:
             user: Optional user context for personalized analysis
         """
         self.user = user
-        self.translator = CodonTranslator()
-        self.mapper = HexagramMapper()
-        self.ai_client = GeneticGeminiClient()
-        logger.info("GeneticAnalysisService initialized")
+        self.translator, self.mapper, self.ai_client = _shared_components()
 
     def analyze_sequence(
         self,
@@ -67,6 +81,37 @@ class GeneticAnalysisService:
         if sequence_type == 'RNA':
             sequence = sequence.replace('U', 'T')
 
+        # Repeat analyses of the same sequence are served from the cache
+        sequence_hash = CodonSequence.hash_sequence(sequence)
+        cache_key = f'sequence_analysis:{mapping_scheme}:{sequence_hash}'
+        results = cache.get(cache_key)
+        if results is None:
+            results = self._analyze(sequence, sequence_name, sequence_type, mapping_scheme)
+            cache.set(cache_key, results, ANALYSIS_CACHE_TIMEOUT)
+        else:
+            results['sequence_name'] = sequence_name
+            results['sequence_type'] = sequence_type
+
+        # Save if requested, reusing the user's existing row for this sequence
+        if save and self.user:
+            existing = CodonSequence.objects.filter(
+                user=self.user,
+                sequence_hash=sequence_hash,
+                mapping_scheme=mapping_scheme,
+            ).first()
+            saved = existing or self._save_sequence_analysis(results)
+            results['saved_sequence_id'] = saved.pk
+
+        return results
+
+    def _analyze(
+        self,
+        sequence: str,
+        sequence_name: str,
+        sequence_type: str,
+        mapping_scheme: str
+    ) -> Dict[str, Any]:
+        """Run the analysis pipeline on a normalized sequence"""
         # Translate sequence to hexagrams
         hexagram_sequence = self.translator.translate_sequence(sequence)
 
@@ -105,10 +150,6 @@ class GeneticAnalysisService:
             'mapping_scheme': mapping_scheme,
         }
 
-        # Save if requested
-        if save and self.user:
-            results['saved_object'] = self._save_sequence_analysis(results)
-
         return results
 
     def get_hexagram_for_codon(
@@ -208,7 +249,7 @@ class GeneticAnalysisService:
 
         existing_data = None
         if existing_mapping:
-            existing_data = {m['codon']: m['hexagram'] for m in existing_mapping.mapping_rules}
+            existing_data = existing_mapping.get_rules_map()
 
         # Induce new mapping
         result = self.ai_client.induce_codon_hexagram_mapping(
@@ -274,6 +315,7 @@ class GeneticAnalysisService:
             gc_content=results['gc_content'],
             amino_acid_sequence=results['amino_acid_sequence'],
             hexagram_sequence=results['hexagram_sequence'],
+            mapping_scheme=results['mapping_scheme'],
         )
 
         # Set dominant hexagram
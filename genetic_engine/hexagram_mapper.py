@@ -292,5 +292,9 @@ class HexagramMapper:
             'total_transitions': total,
             'unique_transitions': len(transition_counts),
             'most_common': transition_counts.most_common(10) if transition_counts else [],
-            'transition_frequency': dict(transition_counts)
+            # 'from-to' keys so the result stays JSON-serializable
+            'transition_frequency': {
+                f'{from_hex}-{to_hex}': count
+                for (from_hex, to_hex), count in transition_counts.items()
+            }
         }
@@ -0,0 +1,43 @@
+"""
+Shared pytest fixtures.
+
+The suite needs the PostgreSQL database and Redis cache from the project
+settings (set DATABASE_URL and REDIS_URL to point at test instances).
+"""
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+
+from api.models import Comment, Discussion
+
+
+@pytest.fixture
+def user(db):
+    return get_user_model().objects.create_user(username='alice', password='pw')
+
+
+@pytest.fixture
+def other_user(db):
+    return get_user_model().objects.create_user(username='bob', password='pw')
+
+
+@pytest.fixture
+def discussion(user):
+    return Discussion.objects.create(author=user, title='Codon bias', content='Thoughts?')
+
+
+@pytest.fixture
+def comment(discussion, user):
+    return Comment.objects.create(
+        content_type=ContentType.objects.get_for_model(Discussion),
+        object_id=discussion.pk,
+        author=user,
+        content='...',
+    )
+
+
+@pytest.fixture(params=[True, False], ids=['contains', 'python'])
+def json_contains_support(request, monkeypatch):
+    """Run each test with and without database JSON containment lookups."""
+    monkeypatch.setattr(connection.features, 'supports_json_field_contains', request.param)
@@ -0,0 +1,99 @@
+"""
+Tests for the cached AnalysisPattern statistics
+"""
+import math
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from api.models import AnalysisPattern
+
+
+def _entropy(sequence):
+    total = len(sequence)
+    return -sum(n / total * math.log(n / total) for n in Counter(sequence).values())
+
+
+def _dominant(sequence):
+    counts = Counter(sequence)
+    return max(sorted(counts), key=lambda h: counts[h])
+
+
+def _pattern(user, hexagram_sequence):
+    return AnalysisPattern.objects.create(
+        user=user,
+        pattern_type=AnalysisPattern.PatternType.MOTIF,
+        sequence='ATG' * len(hexagram_sequence),
+        hexagram_sequence=hexagram_sequence,
+        pattern_data={},
+    )
+
+
+def _assert_stats(pattern, hexagram_sequence):
+    assert pattern.shannon_entropy == pytest.approx(_entropy(hexagram_sequence))
+    assert pattern.dominant_hexagram == _dominant(hexagram_sequence)
+    assert np.frombuffer(pattern.hexagram_sequence_packed, dtype=np.int16).tolist() == hexagram_sequence
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('hexagram_sequence', [
+    [1, 1, 2],
+    [9, 4, 4, 9],
+    [3, 7, 7, 9, 64, 64, 64, 0] * 4,
+])
+def test_stats_computed_on_create(user, hexagram_sequence):
+    pattern = _pattern(user, hexagram_sequence)
+    _assert_stats(pattern, hexagram_sequence)
+    _assert_stats(AnalysisPattern.objects.get(pk=pattern.pk), hexagram_sequence)
+
+
+@pytest.mark.django_db
+def test_empty_sequence(user):
+    pattern = _pattern(user, [])
+    assert pattern.shannon_entropy == 0.0
+    assert pattern.dominant_hexagram == 0
+
+
+@pytest.mark.django_db
+def test_reassigned_sequence_recomputes(user):
+    pattern = AnalysisPattern.objects.get(pk=_pattern(user, [1, 1, 2]).pk)
+    pattern.hexagram_sequence = [5] * 20 + [1]
+    pattern.save()
+    _assert_stats(AnalysisPattern.objects.get(pk=pattern.pk), [5] * 20 + [1])
+
+
+@pytest.mark.django_db
+def test_in_place_edit_of_loaded_pattern_recomputes(user):
+    pattern = AnalysisPattern.objects.get(pk=_pattern(user, [1, 1, 2]).pk)
+    pattern.hexagram_sequence.extend([5, 5, 5, 5])
+    assert pattern.get_hexagram_diversity() == pytest.approx(_entropy([1, 1, 2, 5, 5, 5, 5]))
+    assert pattern.get_dominant_hexagram() == 5
+    pattern.save()
+    _assert_stats(AnalysisPattern.objects.get(pk=pattern.pk), [1, 1, 2, 5, 5, 5, 5])
+
+
+@pytest.mark.django_db
+def test_in_place_edit_of_created_pattern_recomputes(user):
+    pattern = _pattern(user, [1, 1, 2])
+    pattern.hexagram_sequence.extend([5, 5, 5, 5])
+    pattern.save()
+    _assert_stats(pattern, [1, 1, 2, 5, 5, 5, 5])
+
+
+@pytest.mark.django_db
+def test_update_fields_includes_stats(user):
+    pattern = AnalysisPattern.objects.get(pk=_pattern(user, [1, 1, 2]).pk)
+    pattern.hexagram_sequence = [9, 9, 4]
+    pattern.save(update_fields=['hexagram_sequence'])
+    _assert_stats(AnalysisPattern.objects.get(pk=pattern.pk), [9, 9, 4])
+
+
+@pytest.mark.django_db
+def test_deferred_sequence_uses_cached_stats(user, django_assert_num_queries):
+    pattern = _pattern(user, [1, 1, 2])
+    AnalysisPattern.objects.filter(pk=pattern.pk).update(shannon_entropy=42.0)
+    listed = AnalysisPattern.objects.for_list().get(pk=pattern.pk)
+    with django_assert_num_queries(0):
+        assert listed.get_hexagram_diversity() == 42.0
+        assert listed.get_dominant_hexagram() == 1
@@ -0,0 +1,153 @@
+"""
+Tests for buffered API key usage recording
+"""
+from unittest import mock
+
+import pytest
+from django.db import OperationalError
+from django_redis import get_redis_connection
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from api.models import APIKey, APIKeyUsageLog
+from api.models.api_key import USAGE_BUFFER_PREFIX
+from api.utils import usage_logger
+
+
+@pytest.fixture
+def redis_conn():
+    conn = get_redis_connection('default')
+    keys = list(conn.scan_iter(match=f'{USAGE_BUFFER_PREFIX}*'))
+    if keys:
+        conn.delete(*keys)
+    yield conn
+    keys = list(conn.scan_iter(match=f'{USAGE_BUFFER_PREFIX}*'))
+    if keys:
+        conn.delete(*keys)
+
+
+@pytest.fixture
+def api_key(user):
+    api_key, _ = APIKey.objects.create_key(user=user, name='ci')
+    return api_key
+
+
+@pytest.mark.django_db
+def test_usage_is_buffered_until_flush(api_key, redis_conn):
+    api_key.record_usage(ip_address='10.0.0.1')
+    api_key.record_usage(ip_address='10.0.0.2')
+    api_key.record_usage()
+
+    api_key.refresh_from_db()
+    assert api_key.total_requests == 0
+    assert api_key.last_used_at is None
+
+    assert APIKey.flush_buffered_usage() == 1
+    api_key.refresh_from_db()
+    assert api_key.total_requests == 3
+    assert api_key.last_used_ip == '10.0.0.2'
+    assert api_key.last_used_at is not None
+    assert not list(redis_conn.scan_iter(match=f'{USAGE_BUFFER_PREFIX}*'))
+
+
+@pytest.mark.django_db
+def test_flush_adds_to_existing_totals(api_key, other_user, redis_conn):
+    other_key, _ = APIKey.objects.create_key(user=other_user, name='other')
+    APIKey.objects.filter(pk=api_key.pk).update(total_requests=10, last_used_ip='10.9.9.9')
+
+    api_key.record_usage()
+    other_key.record_usage(ip_address='10.0.0.5')
+    assert APIKey.flush_buffered_usage() == 2
+
+    api_key.refresh_from_db()
+    other_key.refresh_from_db()
+    assert (api_key.total_requests, api_key.last_used_ip) == (11, '10.9.9.9')
+    assert (other_key.total_requests, other_key.last_used_ip) == (1, '10.0.0.5')
+
+    # Nothing buffered since the last flush
+    assert APIKey.flush_buffered_usage() == 0
+    api_key.refresh_from_db()
+    assert api_key.total_requests == 11
+
+
+@pytest.mark.django_db
+def test_usage_written_directly_without_redis(api_key, redis_conn):
+    with mock.patch(
+        'api.models.api_key.get_redis_connection',
+        side_effect=RedisConnectionError('down'),
+    ):
+        api_key.record_usage(ip_address='10.0.0.3')
+
+    api_key.refresh_from_db()
+    assert (api_key.total_requests, api_key.last_used_ip) == (1, '10.0.0.3')
+    assert APIKey.flush_buffered_usage() == 0
+
+
+@pytest.mark.django_db
+def test_usage_logger_flush(api_key):
+    with mock.patch.object(usage_logger, '_schedule_flush'):
+        for status_code in (200, 201, 404):
+            usage_logger.log_usage(
+                api_key=api_key, endpoint='/api/codons/', method='GET',
+                status_code=status_code, ip_address='10.0.0.1',
+            )
+    assert usage_logger.flush() == 3
+    assert usage_logger.flush() == 0
+    assert sorted(
+        APIKeyUsageLog.objects.values_list('status_code', flat=True)
+    ) == [200, 201, 404]
+
+
+@pytest.fixture
+def usage_queue():
+    usage_logger._queue.clear()
+    with mock.patch.object(usage_logger, '_schedule_flush'):
+        yield usage_logger._queue
+    usage_logger._queue.clear()
+
+
+@pytest.mark.django_db
+def test_usage_logger_requeues_batch_on_database_error(api_key, usage_queue):
+    for status_code in (200, 500):
+        usage_logger.log_usage(
+            api_key=api_key, endpoint='/api/codons/', method='GET', status_code=status_code,
+        )
+    with mock.patch.object(
+        APIKeyUsageLog.objects, 'bulk_create', side_effect=OperationalError('down'),
+    ):
+        with pytest.raises(OperationalError):
+            usage_logger.flush()
+
+    assert [entry['status_code'] for entry in usage_queue] == [200, 500]
+    assert usage_logger.flush() == 2
+    assert APIKeyUsageLog.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_middleware_records_api_key_requests(client, user, redis_conn, usage_queue):
+    api_key, plaintext = APIKey.objects.create_key(user=user, name='ci')
+
+    response = client.get('/api/codons/', HTTP_X_API_KEY=plaintext, REMOTE_ADDR='10.0.0.7')
+    client.get('/api/codons/', HTTP_X_API_KEY='not-a-key')
+    client.get('/api/codons/')
+
+    assert [(entry['api_key_id'], entry['status_code']) for entry in usage_queue] == [
+        (api_key.pk, response.status_code),
+    ]
+    assert usage_logger.flush() == 1
+    log = APIKeyUsageLog.objects.get()
+    assert (log.endpoint, log.method, log.ip_address) == ('/api/codons/', 'GET', '10.0.0.7')
+
+    assert APIKey.flush_buffered_usage() == 1
+    api_key.refresh_from_db()
+    assert (api_key.total_requests, api_key.last_used_ip) == (1, '10.0.0.7')
+
+
+@pytest.mark.django_db
+def test_middleware_ignores_revoked_keys(client, user, redis_conn, usage_queue):
+    api_key, plaintext = APIKey.objects.create_key(user=user, name='ci')
+    api_key.revoke()
+
+    client.get('/api/codons/', HTTP_X_API_KEY=plaintext)
+
+    assert not usage_queue
+    assert APIKey.flush_buffered_usage() == 0
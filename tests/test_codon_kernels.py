@@ -0,0 +1,99 @@
+"""
+Tests for the vectorized codon scanning kernels
+"""
+import random
+from itertools import product
+
+import numpy as np
+import pytest
+
+from api.utils import codon_kernels
+from genetic_engine.codon_translator import CodonTranslator
+
+CODONS = [''.join(c) for c in product('ACGT', repeat=3)]
+
+
+def _buffer(sequence):
+    return np.frombuffer(sequence.encode(), dtype=np.uint8)
+
+
+def _reference_scan(sequence, table):
+    """Plain Python equivalent of codon_kernels.scan()."""
+    upper = sequence.upper()
+    gc_count = sum(1 for base in upper if base in 'GC')
+    codons = [upper[i:i+3] for i in range(0, len(upper), 3)]
+    amino_acids = ''.join(table.get(codon, 'X') for codon in codons)
+    return gc_count, len(codons), amino_acids
+
+
+@pytest.fixture
+def amino_acid_table():
+    rng = random.Random(0)
+    return {codon: rng.choice('ACDEFGHIKLMNPQRSTVWY*') for codon in CODONS}
+
+
+def test_codon_index_matches_vectorized_indices():
+    codes = codon_kernels.encode_bases(_buffer(''.join(CODONS)))
+    expected = [codon_kernels.codon_index(codon) for codon in CODONS]
+    assert codon_kernels.codon_indices(codes).tolist() == expected
+    assert sorted(expected) == list(range(64))
+
+
+def test_codon_index_invalid():
+    assert codon_kernels.codon_index('ANG') == codon_kernels.INVALID_CODON
+    assert codon_kernels.codon_index('AC') == codon_kernels.INVALID_CODON
+    assert codon_kernels.codon_index('AÉG') == codon_kernels.INVALID_CODON
+
+
+@pytest.mark.parametrize('sequence', [
+    '',
+    'A',
+    'ATGC',
+    'atgcgataa',
+    'ATGNNNCGTA',
+    'ATG CGA\nTAA',
+])
+def test_scan_matches_reference(sequence, amino_acid_table):
+    lut = codon_kernels.build_amino_acid_lut(amino_acid_table)
+    codes = codon_kernels.encode_bases(_buffer(sequence))
+    assert codon_kernels.scan(codes, lut) == _reference_scan(sequence, amino_acid_table)
+
+
+def test_scan_matches_reference_random(amino_acid_table):
+    rng = random.Random(1)
+    lut = codon_kernels.build_amino_acid_lut(amino_acid_table)
+    for length in range(0, 200, 7):
+        sequence = ''.join(rng.choice('ACGTacgtN') for _ in range(length))
+        codes = codon_kernels.encode_bases(_buffer(sequence))
+        assert codon_kernels.scan(codes, lut) == _reference_scan(sequence, amino_acid_table)
+
+
+@pytest.mark.parametrize('length', [0, 1, 3, 4, 5, 8, 61, 1000])
+def test_pack_roundtrip(length):
+    rng = np.random.default_rng(length)
+    codes = rng.integers(0, 4, size=length).astype(np.uint8)
+    packed = codon_kernels.pack_codes(codes)
+    assert len(packed) == 8 + -(-length // 4)
+    np.testing.assert_array_equal(codon_kernels.unpack_codes(packed), codes)
+
+
+def test_pack_rejects_non_acgt():
+    codes = codon_kernels.encode_bases(_buffer('ACGN'))
+    assert codon_kernels.pack_codes(codes) is None
+
+
+def test_build_hexagram_lut():
+    lut = codon_kernels.build_hexagram_lut({'atg': 5, 'CGA': 64, 'TAA': 65, 'GGG': None})
+    assert lut[codon_kernels.codon_index('ATG')] == 5
+    assert lut[codon_kernels.codon_index('CGA')] == 64
+    assert lut[codon_kernels.codon_index('TAA')] == 0
+    assert lut[codon_kernels.codon_index('GGG')] == 0
+    assert lut[codon_kernels.INVALID_CODON] == 0
+
+
+@pytest.mark.parametrize('scheme', sorted(CodonTranslator.BINARY_SCHEMES))
+def test_binary_hexagram_lut_matches_translator(scheme):
+    translator = CodonTranslator(mapping_scheme=scheme)
+    lut = codon_kernels.binary_hexagram_lut(translator.binary_map)
+    for codon in CODONS:
+        assert lut[codon_kernels.codon_index(codon)] == translator.translate_codon(codon)
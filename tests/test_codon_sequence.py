@@ -0,0 +1,60 @@
+"""
+Tests for CodonSequence storage and analysis
+"""
+import pytest
+
+from api.models import CodonSequence
+
+
+def _create(user, sequence, **kwargs):
+    return CodonSequence.objects.create(user=user, name='seq', raw_sequence=sequence, **kwargs)
+
+
+@pytest.mark.django_db
+def test_acgt_sequence_is_stored_packed_only(user):
+    sequence = 'ATGGCCTTTAAGTGA' * 20
+    saved = _create(user, sequence)
+    assert saved.raw_sequence_text is None
+    assert saved.raw_sequence_packed is not None
+
+    loaded = CodonSequence.objects.get(pk=saved.pk)
+    assert loaded.raw_sequence_text is None
+    assert len(loaded.raw_sequence_packed) == 8 + len(sequence) // 4
+    assert loaded.raw_sequence == sequence
+    assert loaded.sequence_hash == CodonSequence.hash_sequence(sequence)
+
+
+@pytest.mark.parametrize('sequence', ['ATGNNNTGA', 'AUGGCCUAA', 'atggcctaa', ''])
+@pytest.mark.django_db
+def test_other_sequences_are_stored_as_text(user, sequence):
+    saved = _create(user, sequence)
+    loaded = CodonSequence.objects.get(pk=saved.pk)
+    assert loaded.raw_sequence_packed is None
+    assert loaded.raw_sequence_text == sequence
+    assert loaded.raw_sequence == sequence
+
+
+@pytest.mark.django_db
+def test_changing_raw_sequence_repacks(user):
+    saved = _create(user, 'ATGNNN')
+    saved.raw_sequence = 'ATGCCC'
+    saved.save(update_fields=['raw_sequence'])
+
+    loaded = CodonSequence.objects.get(pk=saved.pk)
+    assert (loaded.raw_sequence_text, loaded.raw_sequence) == (None, 'ATGCCC')
+    assert loaded.sequence_hash == CodonSequence.hash_sequence('ATGCCC')
+
+    loaded.raw_sequence = 'atgccc'
+    loaded.save()
+    loaded = CodonSequence.objects.get(pk=saved.pk)
+    assert (loaded.raw_sequence_packed, loaded.raw_sequence) == (None, 'atgccc')
+
+
+@pytest.mark.django_db
+def test_analysis_reads_packed_column(user):
+    saved = _create(user, 'GGGCCCAAATTTG')
+    loaded = CodonSequence.objects.list_lite().get(pk=saved.pk)
+    loaded.compute_analysis()
+    assert loaded.codon_count == 5
+    assert loaded.gc_content == pytest.approx(7 / 13 * 100)
+    assert len(loaded.hexagram_sequence) == 4
@@ -0,0 +1,71 @@
+"""
+Tests for threaded comments
+"""
+import pytest
+from django.contrib.contenttypes.models import ContentType
+
+from api.models import Comment, Discussion
+
+
+@pytest.fixture
+def reply(discussion, user):
+    content_type = ContentType.objects.get_for_model(Discussion)
+
+    def make(parent=None, is_removed=False):
+        return Comment.objects.create(
+            content_type=content_type,
+            object_id=discussion.pk,
+            author=user,
+            content='...',
+            parent=parent,
+            is_removed=is_removed,
+        )
+    return make
+
+
+@pytest.mark.django_db
+def test_comment_links_discussion(reply, discussion):
+    assert reply().discussion_id == discussion.pk
+
+
+@pytest.mark.django_db
+def test_get_thread_depth_first(reply, django_assert_num_queries):
+    root = reply()
+    a = reply(root)
+    a1 = reply(a)
+    a1x = reply(a1)
+    a2 = reply(a)
+    b = reply(root)
+    b1 = reply(b)
+    reply()  # unrelated top-level comment
+
+    with django_assert_num_queries(1):
+        thread = root.get_thread()
+    assert thread == [root, a, a1, a1x, a2, b, b1]
+
+
+@pytest.mark.django_db
+def test_get_thread_skips_removed_subtrees(reply):
+    root = reply()
+    kept = reply(root)
+    removed = reply(root, is_removed=True)
+    reply(removed)
+    assert root.get_thread() == [root, kept]
+
+
+@pytest.mark.django_db
+def test_get_thread_leaf(reply):
+    leaf = reply()
+    assert leaf.get_thread() == [leaf]
+
+
+@pytest.mark.django_db
+def test_reply_count(reply):
+    root = reply()
+    first = reply(root)
+    reply(root)
+    root.refresh_from_db()
+    assert root.reply_count == 2
+    first.delete()
+    root.refresh_from_db()
+    assert root.reply_count == 1
@@ -0,0 +1,192 @@
+"""
+Tests for ComparativeAnalysis storage, saving and retrieval
+"""
+import uuid
+import zlib
+from datetime import date
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from rest_framework.test import APIClient
+
+from api.models import ComparativeAnalysis, SequenceBlob
+from api.models.fields import CompressedJSONField
+from api.tasks import save_comparative_analysis_task
+
+RESULTS = {
+    'similarity_score': 0.875,
+    'differences_count': 3,
+    'side_by_side': [{'position': i, 'match': i % 2 == 0} for i in range(500)],
+    'labels': ['乾', 'Kun', None],
+}
+
+
+def _analysis(user, **fields):
+    return ComparativeAnalysis.objects.create(
+        user=user,
+        analysis_type=ComparativeAnalysis.AnalysisType.SEQUENCE_COMPARISON,
+        mapping_schemes=['scheme_1'],
+        results=RESULTS,
+        **fields,
+    )
+
+
+def test_compressed_json_field_roundtrip():
+    field = CompressedJSONField()
+    stored = field.get_prep_value(RESULTS)
+    assert isinstance(stored, bytes)
+    assert len(stored) < len(str(RESULTS))
+    assert field.from_db_value(stored, None, connection) == RESULTS
+    assert field.to_python(memoryview(stored)) == RESULTS
+    assert field.to_python(RESULTS) is RESULTS
+    assert field.get_prep_value(None) is None
+    assert field.from_db_value(None, None, connection) is None
+
+
+def test_compressed_json_field_encodes_django_types():
+    field = CompressedJSONField()
+    stored = field.get_prep_value({'day': date(2024, 1, 2), 'amount': Decimal('1.5')})
+    assert field.from_db_value(stored, None, connection) == {'day': '2024-01-02', 'amount': '1.5'}
+
+
+@pytest.mark.django_db
+def test_results_stored_compressed(user):
+    analysis = _analysis(user, sequence1='ATGCGA', sequence2='ATGCGT')
+    assert analysis.differences_count == 3
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'SELECT results FROM {ComparativeAnalysis._meta.db_table} WHERE id = %s',
+            [analysis.pk],
+        )
+        raw = bytes(cursor.fetchone()[0])
+    assert zlib.decompress(raw).startswith(b'{"similarity_score":0.875')
+
+    assert ComparativeAnalysis.objects.get(pk=analysis.pk).results == RESULTS
+
+
+@pytest.mark.django_db
+def test_update_fields_results_refreshes_differences_count(user):
+    analysis = _analysis(user)
+    analysis.results = {'differences_count': 7}
+    analysis.save(update_fields=['results'])
+    reloaded = ComparativeAnalysis.objects.get(pk=analysis.pk)
+    assert (reloaded.results, reloaded.differences_count) == ({'differences_count': 7}, 7)
+
+
+@pytest.mark.django_db
+def test_sequences_are_interned(user, other_user):
+    first = _analysis(user, sequence1='ATGCGA', sequence2='TTTAAA')
+    second = _analysis(other_user, sequence1='TTTAAA', sequence2='ATGCGA')
+
+    # The instance keeps its text; the row only references the blobs
+    assert (first.sequence1, first.sequence2) == ('ATGCGA', 'TTTAAA')
+    assert SequenceBlob.objects.count() == 2
+    assert first.sequence1_blob_id == second.sequence2_blob_id
+
+    reloaded = ComparativeAnalysis.objects.get(pk=first.pk)
+    assert reloaded.sequence1 == ''
+    assert (reloaded.get_sequence1(), reloaded.get_sequence2()) == ('ATGCGA', 'TTTAAA')
+    assert reloaded.get_sequence_count() == 2
+
+
+@pytest.mark.django_db
+def test_legacy_rows_keep_inline_sequences(user):
+    analysis = _analysis(user)
+    ComparativeAnalysis.objects.filter(pk=analysis.pk).update(sequence1='GGGCCC')
+    reloaded = ComparativeAnalysis.objects.get(pk=analysis.pk)
+    assert reloaded.get_sequence1() == 'GGGCCC'
+    assert reloaded.get_sequence2() == ''
+    assert reloaded.get_sequence_count() == 1
+
+
+def _get(client, user, key, **headers):
+    client.force_authenticate(user)
+    return client.get(f'/api/comparative/{key}/', **headers)
+
+
+@pytest.mark.django_db
+def test_retrieve_answers_conditional_requests(user, django_assert_num_queries):
+    analysis = _analysis(user, sequence1='ATGCGA', sequence2='ATGCGT')
+    client = APIClient()
+
+    response = _get(client, user, analysis.pk)
+    assert response.status_code == 200
+    assert response.json()['results'] == RESULTS
+    etag = response['ETag']
+    assert response['Last-Modified']
+    assert _get(client, user, analysis.uuid)['ETag'] == etag
+
+    # One query for the row; the deferred results column is never read
+    with django_assert_num_queries(1):
+        cached = _get(client, user, analysis.pk, HTTP_IF_NONE_MATCH=etag)
+    assert cached.status_code == 304
+    assert cached['ETag'] == etag
+    assert _get(
+        client, user, analysis.pk, HTTP_IF_MODIFIED_SINCE=response['Last-Modified']
+    ).status_code == 304
+
+    analysis.results = {'differences_count': 1}
+    analysis.save()
+    changed = _get(client, user, analysis.pk, HTTP_IF_NONE_MATCH=etag)
+    assert changed.status_code == 200
+    assert changed['ETag'] != etag
+
+
+@pytest.mark.django_db
+def test_retrieve_checks_permission_before_etag(user, other_user):
+    analysis = _analysis(user)
+    client = APIClient()
+    etag = _get(client, user, analysis.pk)['ETag']
+
+    assert _get(client, other_user, analysis.pk, HTTP_IF_NONE_MATCH=etag).status_code == 403
+    ComparativeAnalysis.objects.filter(pk=analysis.pk).update(is_public=True)
+    assert _get(client, other_user, analysis.pk).status_code == 200
+    assert _get(client, other_user, 999999).status_code == 404
+    assert _get(client, other_user, 'not-a-uuid').status_code == 404
+
+
+@pytest.mark.django_db
+def test_save_comparative_analysis_task(user):
+    analysis_uuid = str(uuid.uuid4())
+    pk = save_comparative_analysis_task(user.pk, analysis_uuid, {
+        'analysis_type': ComparativeAnalysis.AnalysisType.SEQUENCE_COMPARISON,
+        'mapping_schemes': ['scheme_1'],
+        'results': RESULTS,
+    })
+    analysis = ComparativeAnalysis.objects.get(uuid=analysis_uuid)
+    assert (analysis.pk, analysis.user_id, analysis.results) == (pk, user.pk, RESULTS)
+
+
+@pytest.mark.django_db
+def test_save_analysis_is_queued_after_commit(user, django_capture_on_commit_callbacks):
+    cache.clear()
+    client = APIClient()
+    client.force_authenticate(user)
+    with mock.patch.object(
+        save_comparative_analysis_task, 'delay', side_effect=save_comparative_analysis_task
+    ) as delay:
+        with django_capture_on_commit_callbacks() as callbacks:
+            response = client.post('/api/comparative/side_by_side/', {
+                'sequence1': 'ATGCGATAA',
+                'sequence2': 'ATGCGTTAA',
+                'save_analysis': True,
+            }, format='json')
+        assert response.status_code == 200
+        analysis_uuid = response.json()['saved_analysis_id']
+        assert not delay.called
+        assert not ComparativeAnalysis.objects.filter(uuid=analysis_uuid).exists()
+
+        for callback in callbacks:
+            callback()
+    delay.assert_called_once()
+
+    analysis = ComparativeAnalysis.objects.get(uuid=analysis_uuid)
+    assert analysis.user_id == user.pk
+    assert analysis.analysis_type == ComparativeAnalysis.AnalysisType.SEQUENCE_COMPARISON
+    expected = dict(response.json())
+    del expected['saved_analysis_id']
+    assert analysis.results == expected
@@ -0,0 +1,38 @@
+"""
+Tests for ComparativeAnalyzer similarity measures
+"""
+import random
+
+import pytest
+
+from genetic_engine.comparative_analyzer import ComparativeAnalyzer
+
+
+@pytest.fixture(scope='module')
+def analyzer():
+    return ComparativeAnalyzer()
+
+
+def test_jaccard_matrix_matches_pairwise_similarity(analyzer):
+    rng = random.Random(3)
+    sequences = [
+        [rng.randint(0, 64) for _ in range(rng.randint(0, 80))] for _ in range(12)
+    ]
+    sequences += [[], [0, 0, 0], [5, 5, 5]]
+
+    matrix = analyzer._jaccard_matrix(sequences)
+    for i, row in enumerate(matrix):
+        for j, value in enumerate(row):
+            expected = 1.0 if i == j else analyzer._calculate_pairwise_similarity(
+                sequences[i], sequences[j]
+            )['jaccard']
+            assert value == expected
+            assert value == matrix[j][i]
+
+
+def test_jaccard_matrix_small(analyzer):
+    assert analyzer._jaccard_matrix([[1, 2, 3], [2, 3, 4], [0]]) == [
+        [1.0, 0.5, 0.0],
+        [0.5, 1.0, 0.0],
+        [0.0, 0.0, 1.0],
+    ]
@@ -0,0 +1,79 @@
+"""
+Tests for Discussion slug generation
+"""
+import random
+import string
+
+import pytest
+from django.utils.text import slugify
+
+from api.models import Discussion
+from api.models.discussion import _fast_slug
+
+
+def _discussion(user, title, **fields):
+    return Discussion(author=user, title=title, content='...', **fields)
+
+
+@pytest.mark.django_db
+def test_save_assigns_unique_slugs(user, django_assert_num_queries):
+    slugs = []
+    for _ in range(3):
+        discussion = _discussion(user, 'Codon bias')
+        # One lookup for the taken slugs, one INSERT
+        with django_assert_num_queries(2):
+            discussion.save()
+        slugs.append(discussion.slug)
+    assert slugs == ['codon-bias', 'codon-bias-1', 'codon-bias-2']
+
+    explicit = _discussion(user, 'Codon bias', slug='custom')
+    explicit.save()
+    assert explicit.slug == 'custom'
+
+
+@pytest.mark.django_db
+def test_slug_prefix_of_other_titles(user):
+    _discussion(user, 'Codon bias in yeast').save()
+    discussion = _discussion(user, 'Codon bias')
+    discussion.save()
+    assert discussion.slug == 'codon-bias'
+
+
+@pytest.mark.django_db
+def test_bulk_create_with_slugs(user, django_assert_num_queries):
+    _discussion(user, 'Codon bias').save()
+    batch = [
+        _discussion(user, 'Codon bias'),
+        _discussion(user, 'Codon bias'),
+        _discussion(user, 'Reading frames', slug='codon-bias-3'),
+        _discussion(user, 'Reading frames'),
+    ]
+    with django_assert_num_queries(2):
+        Discussion.bulk_create_with_slugs(batch)
+    assert [d.slug for d in batch] == [
+        'codon-bias-1', 'codon-bias-2', 'codon-bias-3', 'reading-frames',
+    ]
+    assert Discussion.objects.count() == 5
+
+
+@pytest.mark.parametrize('title', [
+    'Codon bias',
+    "  What's the --deal-- with   TAA?! ",
+    'snake_case_title_',
+    '-_leading and trailing_-',
+    'Tabs\tand\nnewlines',
+    'x' * 80,
+    'Ünïcödé títle',
+    '易經 and DNA',
+    '',
+])
+def test_fast_slug_matches_slugify(title):
+    assert _fast_slug(title) == slugify(title)[:50]
+
+
+def test_fast_slug_matches_slugify_random_ascii():
+    rng = random.Random(7)
+    alphabet = string.printable
+    for _ in range(500):
+        title = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 70)))
+        assert _fast_slug(title) == slugify(title)[:50], title
@@ -0,0 +1,74 @@
+"""
+Tests for the export endpoints
+"""
+import json
+
+import pytest
+from django.http import StreamingHttpResponse
+from rest_framework.test import APIClient
+
+DATA = {
+    'analysis_type': 'sequence',
+    'sequence_name': 'demo',
+    'hexagram_sequence': [1, 64, 0],
+    'codons': ['ATG', 'GCC', 'NNN'],
+    'amino_acids': ['M', 'A'],
+}
+
+
+@pytest.fixture
+def client(user):
+    client = APIClient()
+    client.force_authenticate(user)
+    return client
+
+
+def _export(client, fmt, body, download):
+    return client.post(f'/api/export/{fmt}/', dict(body, download=download), format='json')
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('fmt, body, content_type', [
+    ('csv', {'data': DATA, 'include_metadata': False}, 'text/csv'),
+    ('json', {'data': DATA, 'include_metadata': False}, 'application/json'),
+    ('fasta', {'sequence': 'ATG' * 30, 'hexagram_sequence': list(range(1, 31)),
+               'sequence_name': 'demo'}, 'text/plain'),
+])
+def test_download_streams_envelope_content(client, fmt, body, content_type):
+    envelope = _export(client, fmt, body, download=False)
+    assert envelope.status_code == 200
+    assert envelope.json()['content_type'] == content_type
+
+    response = _export(client, fmt, body, download=True)
+    assert response.status_code == 200
+    assert isinstance(response, StreamingHttpResponse)
+    assert response['Content-Type'] == content_type
+    disposition = response['Content-Disposition']
+    assert disposition.startswith('attachment; filename="')
+    assert disposition.endswith(f'.{fmt}"')
+    assert b''.join(response.streaming_content).decode() == envelope.json()['content']
+
+
+@pytest.mark.django_db
+def test_csv_download_rows(client):
+    response = _export(client, 'csv', {'data': DATA, 'include_metadata': False}, download=True)
+    lines = b''.join(response.streaming_content).decode().splitlines()
+    assert lines == [
+        'Position,Codon,Hexagram,Amino Acid',
+        '1,ATG,1,M',
+        '2,GCC,64,A',
+        '3,NNN,Invalid,N/A',
+    ]
+
+
+@pytest.mark.django_db
+def test_json_download_with_metadata(client):
+    response = _export(client, 'json', {'data': DATA, 'pretty': False}, download=True)
+    exported = json.loads(b''.join(response.streaming_content))
+    assert exported['hexagram_sequence'] == DATA['hexagram_sequence']
+    assert exported['_export_metadata']['format'] == 'json'
+
+
+@pytest.mark.django_db
+def test_download_requires_data(client):
+    assert _export(client, 'csv', {'data': {}}, download=True).status_code == 400
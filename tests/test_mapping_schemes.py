@@ -0,0 +1,27 @@
+"""
+Tests for the mapping_schemes endpoint
+"""
+import pytest
+from rest_framework.test import APIClient
+
+
+@pytest.mark.django_db
+def test_mapping_schemes_etag(user):
+    client = APIClient()
+    client.force_authenticate(user)
+    response = client.get('/api/analysis/mapping_schemes/')
+    assert response.status_code == 200
+    assert response['Content-Type'] == 'application/json'
+    schemes = response.json()
+    assert sorted(schemes) == ['scheme_1', 'scheme_2', 'scheme_3', 'scheme_4']
+    assert schemes['scheme_1']['name'] == 'Purine/Pyrimidine'
+    etag = response['ETag']
+
+    cached = client.get('/api/analysis/mapping_schemes/', HTTP_IF_NONE_MATCH=etag)
+    assert cached.status_code == 304
+    assert cached['ETag'] == etag
+    assert not cached.content
+
+    stale = client.get('/api/analysis/mapping_schemes/', HTTP_IF_NONE_MATCH='"other"')
+    assert stale.status_code == 200
+    assert stale.json() == schemes
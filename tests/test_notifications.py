@@ -0,0 +1,78 @@
+"""
+Tests for notifications
+"""
+import pytest
+from django.db import IntegrityError
+
+from api.models import Notification
+
+
+def _notify(user, **targets):
+    return Notification.objects.create(
+        recipient=user,
+        notification_type=Notification.NotificationType.COMMENT_REPLY,
+        title='Reply',
+        message='...',
+        **targets,
+    )
+
+
+@pytest.mark.django_db
+def test_single_explicit_target(comment, discussion, user):
+    assert _notify(user, comment=comment).target == comment
+    assert _notify(user, discussion=discussion).target == discussion
+
+
+@pytest.mark.django_db
+def test_rejects_several_explicit_targets(comment, discussion, user):
+    with pytest.raises(IntegrityError):
+        _notify(user, comment=comment, discussion=discussion)
+
+
+@pytest.mark.django_db
+def test_bulk_create_notifications(comment, user, other_user, django_assert_max_num_queries):
+    with django_assert_max_num_queries(2):
+        created = Notification.bulk_create_notifications(
+            [user, other_user],
+            Notification.NotificationType.COMMENT_MENTION,
+            'Mentioned',
+            'You were mentioned',
+            actor=user,
+            content_object=comment,
+        )
+    assert len(created) == 2
+    notifications = Notification.objects.order_by('recipient__username')
+    assert [n.recipient for n in notifications] == [user, other_user]
+    for notification in notifications:
+        assert (notification.comment, notification.target) == (comment, comment)
+        assert notification.object_id == comment.pk
+
+
+@pytest.mark.django_db
+def test_mark_all_read(user, other_user):
+    mine = [_notify(user) for _ in range(3)]
+    theirs = _notify(other_user)
+    mine[0].mark_as_read()
+
+    assert Notification.objects.mark_all_read(user) == 2
+    assert not Notification.objects.filter(recipient=user, is_read=False).exists()
+    assert not Notification.objects.filter(recipient=user, read_at=None).exists()
+    theirs.refresh_from_db()
+    assert not theirs.is_read
+    assert Notification.objects.mark_all_read(user) == 0
+
+
+@pytest.mark.django_db
+def test_mark_ids_read(user, other_user):
+    first, second, third = (_notify(user) for _ in range(3))
+    theirs = _notify(other_user)
+
+    # Other users' notifications are never touched, even when their ids are passed
+    assert Notification.objects.mark_ids_read(user, [first.pk, second.pk, theirs.pk]) == 2
+    assert Notification.objects.mark_ids_read(user, [first.pk]) == 0
+    assert set(
+        Notification.objects.filter(is_read=True).values_list('pk', flat=True)
+    ) == {first.pk, second.pk}
+    third.refresh_from_db()
+    theirs.refresh_from_db()
+    assert not third.is_read and not theirs.is_read
@@ -0,0 +1,92 @@
+"""
+Tests for the API key usage log partitions and prune_api_key_usage
+"""
+from datetime import datetime, timedelta, timezone as dt_timezone
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.utils import timezone
+
+from api.models import APIKey, APIKeyUsageLog
+from api.utils.partitioning import (
+    add_months,
+    create_monthly_partition,
+    is_partitioned,
+    month_start,
+    monthly_partitions,
+)
+
+
+@pytest.fixture
+def api_key(user):
+    api_key, _ = APIKey.objects.create_key(user=user, name='ci')
+    return api_key
+
+
+def _log(api_key, timestamp):
+    log = APIKeyUsageLog.objects.create(
+        api_key=api_key, endpoint='/api/codons/', method='GET', status_code=200,
+    )
+    # timestamp is auto_now_add; moving it also moves the row between partitions
+    APIKeyUsageLog.objects.filter(pk=log.pk).update(timestamp=timestamp)
+    return log.pk
+
+
+def _prune(**options):
+    out = StringIO()
+    call_command('prune_api_key_usage', stdout=out, stderr=StringIO(), **options)
+    return out.getvalue()
+
+
+def test_add_months():
+    assert add_months(datetime(2026, 11, 1).date(), 1) == datetime(2026, 12, 1).date()
+    assert add_months(datetime(2026, 12, 1).date(), 1) == datetime(2027, 1, 1).date()
+    assert add_months(datetime(2026, 1, 1).date(), -13) == datetime(2024, 12, 1).date()
+
+
+@pytest.mark.django_db
+def test_usage_log_is_partitioned_by_month():
+    with connection.cursor() as cursor:
+        assert is_partitioned(cursor)
+        partitions = monthly_partitions(cursor)
+    current = month_start(timezone.now())
+    assert {current, add_months(current, 1)} <= set(partitions)
+
+
+# Dropping a partition needs its deferred FK checks settled, so commit for real
+@pytest.mark.django_db(transaction=True)
+def test_prune_drops_expired_partitions(api_key):
+    now = timezone.now()
+    old_month = add_months(month_start(now), -12)
+    with connection.cursor() as cursor:
+        create_monthly_partition(cursor, old_month)
+
+    old = datetime(old_month.year, old_month.month, 15, tzinfo=dt_timezone.utc)
+    expired = _log(api_key, old)
+    # No monthly partition this far back, so the row lands in DEFAULT
+    unpartitioned = _log(api_key, old - timedelta(days=400))
+    recent = _log(api_key, now - timedelta(days=1))
+
+    output = _prune(days=90, months_ahead=3)
+    assert '1 partitions dropped, 1 rows deleted' in output
+    with connection.cursor() as cursor:
+        partitions = monthly_partitions(cursor)
+    assert old_month not in partitions
+    assert add_months(month_start(now), 3) in partitions
+
+    remaining = set(APIKeyUsageLog.objects.values_list('pk', flat=True))
+    assert recent in remaining
+    assert not remaining & {expired, unpartitioned}
+
+
+@pytest.mark.django_db
+def test_prune_deletes_in_batches(api_key):
+    now = timezone.now()
+    expired = [_log(api_key, now - timedelta(days=30 + i)) for i in range(5)]
+    kept = _log(api_key, now)
+
+    assert '5 rows deleted' in _prune(days=20, batch_size=2)
+    assert list(APIKeyUsageLog.objects.values_list('pk', flat=True)) == [kept]
+    assert not APIKeyUsageLog.objects.filter(pk__in=expired).exists()
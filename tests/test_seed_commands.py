@@ -0,0 +1,132 @@
+"""
+Tests for the load_codons and load_hexagrams seed commands
+"""
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+
+from api.management.commands.load_codons import CODON_TABLE
+from api.management.commands.load_hexagrams import Command as LoadHexagrams
+from api.models import Codon, CodonSequence, Hexagram
+from api.models.codon_sequence import reset_codon_table
+from api.models.hexagram import reset_hexagram_by_number
+from api.utils.codon_kernels import codon_index
+
+
+@pytest.fixture(params=[True, False], ids=['upsert', 'fallback'])
+def conflict_support(request, monkeypatch):
+    """Run each test with and without INSERT ... ON CONFLICT DO UPDATE."""
+    monkeypatch.setattr(
+        connection.features, 'supports_update_conflicts_with_target', request.param
+    )
+
+
+def _call(name):
+    out = StringIO()
+    call_command(name, stdout=out)
+    return out.getvalue()
+
+
+@pytest.mark.django_db
+def test_load_codons_is_idempotent(conflict_support):
+    assert '64 created, 0 updated' in _call('load_codons')
+    assert '0 created, 0 updated' in _call('load_codons')
+    assert Codon.objects.count() == len(CODON_TABLE) == 64
+    atg = Codon.objects.get(sequence='ATG')
+    assert (atg.amino_acid_code, atg.is_start, atg.binary_representation) == ('M', True, '001')
+
+
+@pytest.mark.django_db
+def test_load_codons_restores_edited_rows(conflict_support):
+    _call('load_codons')
+    Codon.objects.filter(sequence='TGG').update(amino_acid_code='Z', is_stop=True)
+    Codon.objects.filter(sequence='GGG').delete()
+
+    assert '1 created, 1 updated' in _call('load_codons')
+    tgg = Codon.objects.get(sequence='TGG')
+    assert (tgg.amino_acid_code, tgg.is_stop) == ('W', False)
+    assert Codon.objects.filter(sequence='GGG').exists()
+
+
+@pytest.fixture
+def fresh_codon_table():
+    reset_codon_table()
+    yield
+    reset_codon_table()
+
+
+@pytest.mark.django_db
+def test_load_codons_resets_codon_table(fresh_codon_table, django_capture_on_commit_callbacks):
+    _call('load_codons')
+    Codon.objects.filter(sequence='TGG').update(amino_acid_code='Z')
+    assert CodonSequence._codon_table()['TGG'] == 'Z'
+
+    with django_capture_on_commit_callbacks(execute=True):
+        _call('load_codons')
+    assert CodonSequence._codon_table()['TGG'] == 'W'
+
+
+@pytest.mark.django_db
+def test_codon_save_resets_codon_table(fresh_codon_table):
+    _call('load_codons')
+    assert CodonSequence._amino_acid_lut()[codon_index('TGG')] == 'W'
+
+    codon = Codon.objects.get(sequence='TGG')
+    codon.amino_acid_code = 'Y'
+    codon.save()
+    assert CodonSequence._codon_table()['TGG'] == 'Y'
+    assert CodonSequence._amino_acid_lut()[codon_index('TGG')] == 'Y'
+
+    codon.delete()
+    assert 'TGG' not in CodonSequence._codon_table()
+
+
+@pytest.mark.django_db
+def test_load_hexagrams_is_idempotent(conflict_support):
+    count = len(LoadHexagrams.HEXAGRAMS)
+    assert f'{count} created, 0 updated' in _call('load_hexagrams')
+    assert f'0 created, {count} updated' in _call('load_hexagrams')
+    assert Hexagram.objects.count() == count
+
+
+@pytest.mark.django_db
+def test_load_hexagrams_restores_edited_rows(conflict_support):
+    _call('load_hexagrams')
+    Hexagram.objects.filter(number=1).update(name_english='Edited', line1='0')
+    _call('load_hexagrams')
+    qian = Hexagram.objects.get(number=1)
+    assert (qian.name_english, qian.binary, qian.line1) == ('The Creative', '111111', '1')
+
+
+@pytest.fixture
+def fresh_hexagram_lookup():
+    reset_hexagram_by_number()
+    yield
+    reset_hexagram_by_number()
+
+
+@pytest.mark.django_db
+def test_load_hexagrams_resets_number_lookup(
+    fresh_hexagram_lookup, django_capture_on_commit_callbacks
+):
+    _call('load_hexagrams')
+    Hexagram.objects.filter(number=1).update(name_english='Edited')
+    assert Hexagram.by_number()[1].name_english == 'Edited'
+
+    with django_capture_on_commit_callbacks(execute=True):
+        _call('load_hexagrams')
+    assert Hexagram.by_number()[1].name_english == 'The Creative'
+
+
+@pytest.mark.django_db
+def test_hexagram_save_resets_number_lookup(fresh_hexagram_lookup):
+    _call('load_hexagrams')
+    qian = Hexagram.by_number()[1]
+    qian.name_english = 'Heaven'
+    qian.save()
+    assert Hexagram.by_number()[1].name_english == 'Heaven'
+
+    Hexagram.objects.get(number=6).delete()
+    assert 6 not in Hexagram.by_number()
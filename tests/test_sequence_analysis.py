@@ -0,0 +1,54 @@
+"""
+Tests for sequence analysis results from the API and the background task
+"""
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from kombu.serialization import dumps, loads
+from rest_framework.test import APIClient
+
+from api.models import CodonSequence
+from api.tasks import analyze_sequence_task
+
+
+@pytest.fixture
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _roundtrip(payload):
+    """Encode a task result the way the JSON result backend does."""
+    content_type, encoding, data = dumps(payload, serializer='json')
+    return loads(data, content_type, encoding)
+
+
+@pytest.mark.django_db
+def test_analyze_sequence_task_result_is_json(user, clear_cache):
+    payload = _roundtrip(analyze_sequence_task(user.pk, 'ATGCGATAAGGC', 'demo'))
+
+    assert payload['user_id'] == user.pk
+    saved = CodonSequence.objects.get(pk=payload['results']['saved_sequence_id'])
+    assert (saved.user_id, saved.name) == (user.pk, 'demo')
+    assert 'saved_object' not in payload['results']
+
+    # A repeat run reuses the saved row
+    again = _roundtrip(analyze_sequence_task(user.pk, 'ATGCGATAAGGC', 'demo'))
+    assert again['results']['saved_sequence_id'] == saved.pk
+    assert CodonSequence.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_analyze_sequence_endpoint(user, clear_cache):
+    client = APIClient()
+    client.force_authenticate(user)
+    response = client.post(
+        reverse('analysis-analyze-sequence'),
+        {'sequence': 'ATGCGATAAGGC', 'name': 'demo'},
+        format='json',
+    )
+    assert response.status_code == 200
+    saved = CodonSequence.objects.get(pk=response.json()['saved_sequence_id'])
+    assert saved.user_id == user.pk
+    assert response.json()['transition_analysis']['transition_frequency']
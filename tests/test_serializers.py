@@ -0,0 +1,87 @@
+"""
+Tests for sequence fields and request serializers that accept sequence batches
+"""
+import pytest
+from rest_framework import serializers
+
+from api.serializers.fields import SequenceField, normalize_sequence
+from api.serializers.comparative_analysis import MultipleSequenceComparisonRequestSerializer
+
+
+def _validate(data):
+    serializer = MultipleSequenceComparisonRequestSerializer(data=data)
+    return serializer.is_valid(), serializer
+
+
+def test_sequences_fasta():
+    valid, serializer = _validate({
+        'sequences_fasta': '>seq one\nATGGCC\nTTT\n\n>seq two\r\nATG GCC TAA\n',
+    })
+    assert valid, serializer.errors
+    assert serializer.validated_data['sequences'] == ['ATGGCCTTT', 'ATGGCCTAA']
+    assert serializer.validated_data['sequence_names'] == ['seq one', 'seq two']
+    assert 'sequences_fasta' not in serializer.validated_data
+
+
+def test_sequences_fasta_keeps_explicit_names():
+    valid, serializer = _validate({
+        'sequences_fasta': '>a\nATG\n>b\nTAA\n',
+        'sequence_names': ['first', 'second'],
+    })
+    assert valid, serializer.errors
+    assert serializer.validated_data['sequence_names'] == ['first', 'second']
+
+
+def test_sequences_newline_delimited():
+    valid, serializer = _validate({'sequences_fasta': 'atggcc\n\n  uuuaaa  \nNNN\n'})
+    assert valid, serializer.errors
+    assert serializer.validated_data['sequences'] == ['ATGGCC', 'UUUAAA', 'NNN']
+    assert 'sequence_names' not in serializer.validated_data
+
+
+@pytest.mark.parametrize('text, error', [
+    ('>only\nATG\n', 'At least 2 sequences'),
+    ('ATG\nATX\n', 'may only contain'),
+])
+def test_sequences_fasta_errors(text, error):
+    valid, serializer = _validate({'sequences_fasta': text})
+    assert not valid
+    assert error in str(serializer.errors['sequences_fasta'][0])
+
+
+def test_sequences_or_fasta_required():
+    valid, serializer = _validate({})
+    assert not valid
+    assert 'sequences' in serializer.errors
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('ATGC', 'ATGC'),
+    ('atg gcc\ttaa\r\n', 'ATGGCCTAA'),
+    ('augn', 'AUGN'),
+    ('', ''),
+    ('ATGX', None),
+    ('ATG-C', None),
+    ('ATGÇ', None),
+    (None, None),
+])
+def test_normalize_sequence(value, expected):
+    assert normalize_sequence(value) == expected
+
+
+def test_sequence_field():
+    field = SequenceField()
+    assert field.run_validation(' atg\nGCC ') == 'ATGGCC'
+    with pytest.raises(serializers.ValidationError) as excinfo:
+        field.run_validation('ATGZ')
+    assert excinfo.value.detail == ['Sequence may only contain A, C, G, T, U or N.']
+
+
+def test_sequence_list_is_normalized():
+    valid, serializer = _validate({'sequences': ['atg gcc', 'TTT']})
+    assert valid, serializer.errors
+    assert serializer.validated_data['sequences'] == ['ATGGCC', 'TTT']
+
+    valid, serializer = _validate({'sequences': ['ATG', 'AT1']})
+    assert not valid
+    assert 'sequences' in serializer.errors
@@ -0,0 +1,15 @@
+"""
+Smoke tests for URL configuration
+"""
+from importlib import import_module
+
+from django.urls import reverse
+
+
+def test_api_urls_import():
+    assert import_module('api.urls').urlpatterns
+
+
+def test_routes_reverse():
+    assert reverse('analysis-job', kwargs={'job_id': 'abc'}).endswith('/job/abc/')
+    assert reverse('export-task', kwargs={'task_id': 'abc'}).endswith('/tasks/abc/')
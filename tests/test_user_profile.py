@@ -0,0 +1,75 @@
+"""
+Tests for UserProfile counters, badges and reputation levels
+"""
+import pytest
+
+from api.models import UserProfile
+
+
+@pytest.fixture
+def profile(user):
+    return UserProfile.objects.create(user=user)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('awards', [[5], [10], [9, 1], [49, 100], [2000]])
+def test_award_reputation(profile, awards, django_assert_num_queries):
+    for amount in awards:
+        with django_assert_num_queries(1):
+            profile.award_reputation(amount)
+    in_memory = (profile.reputation_score, profile.reputation_level)
+
+    profile.refresh_from_db()
+    assert in_memory == (sum(awards), profile.reputation_level)
+    assert profile.reputation_level == profile.get_reputation_level()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('score, level', [
+    (0, 'Newcomer'), (9, 'Newcomer'), (10, 'Contributor'), (50, 'Researcher'),
+    (149, 'Researcher'), (500, 'Master'), (1000, 'Grandmaster'),
+])
+def test_get_reputation_level(profile, score, level):
+    profile.reputation_score = score
+    assert profile.get_reputation_level() == level
+
+
+@pytest.mark.django_db
+def test_award_reputation_adds_to_concurrent_awards(profile):
+    UserProfile.objects.get(pk=profile.pk).award_reputation(40)
+    profile.award_reputation(15)
+    profile.refresh_from_db()
+    assert (profile.reputation_score, profile.reputation_level) == (55, 'Researcher')
+
+
+@pytest.mark.django_db
+def test_increment_stat(profile, django_assert_num_queries):
+    with django_assert_num_queries(1):
+        profile.increment_stat('comments_posted')
+    profile.increment_stat('comments_posted')
+    assert profile.comments_posted == 2
+    profile.refresh_from_db()
+    assert profile.comments_posted == 2
+
+
+@pytest.mark.django_db
+def test_increment_unknown_stat(profile):
+    with pytest.raises(ValueError):
+        profile.increment_stat('reputation_score')
+
+
+@pytest.mark.django_db
+def test_badges(profile, other_user, json_contains_support):
+    other = UserProfile.objects.create(user=other_user, badges=['pioneer'])
+
+    assert profile.add_badge('mapper')
+    assert not profile.add_badge('mapper')
+    # Awarded through another instance; the stale one must not drop it
+    UserProfile.objects.get(pk=profile.pk).add_badge('pioneer')
+    assert profile.add_badge('reviewer')
+
+    profile.refresh_from_db()
+    assert profile.get_badge_list() == ['mapper', 'pioneer', 'reviewer']
+    assert set(UserProfile.with_badge('pioneer')) == {profile, other}
+    assert list(UserProfile.with_badge('mapper')) == [profile]
+    assert not UserProfile.with_badge('pi').exists()
@@ -0,0 +1,76 @@
+"""
+Tests for vote toggling and the denormalized vote counters
+"""
+import pytest
+from django.contrib.contenttypes.models import ContentType
+
+from api.models import Comment, Discussion, Vote
+
+UP = Vote.VoteType.UPVOTE
+DOWN = Vote.VoteType.DOWNVOTE
+
+
+def _counters(obj):
+    return obj.upvotes, obj.downvotes, obj.vote_score
+
+
+def _assert_counters(obj, expected):
+    assert _counters(obj) == expected
+    obj.refresh_from_db()
+    assert _counters(obj) == expected
+
+
+@pytest.mark.django_db
+def test_toggle_sequence(comment, other_user, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks() as callbacks:
+        assert Vote.toggle_vote(other_user, comment, UP) == 'added'
+    assert len(callbacks) == 1  # vote-received notification
+    _assert_counters(comment, (1, 0, 1))
+
+    assert Vote.toggle_vote(other_user, comment, DOWN) == 'changed'
+    _assert_counters(comment, (0, 1, -1))
+
+    assert Vote.toggle_vote(other_user, comment, DOWN) == 'removed'
+    _assert_counters(comment, (0, 0, 0))
+    assert not Vote.objects.exists()
+
+
+@pytest.mark.django_db
+def test_downvote_does_not_notify(comment, other_user, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks() as callbacks:
+        assert Vote.toggle_vote(other_user, comment, DOWN) == 'added'
+    assert callbacks == []
+    _assert_counters(comment, (0, 1, -1))
+
+
+@pytest.mark.django_db
+def test_votes_from_several_users(comment, user, other_user):
+    Vote.toggle_vote(user, comment, UP)
+    Vote.toggle_vote(other_user, comment, UP)
+    _assert_counters(comment, (2, 0, 2))
+
+    vote = Vote.objects.get(user=user)
+    assert vote.comment_id == comment.pk
+    assert vote.discussion_id is None and vote.mapping_id is None
+
+
+@pytest.mark.django_db
+def test_recount_matches_toggles(comment, user, other_user):
+    Vote.toggle_vote(user, comment, UP)
+    Vote.toggle_vote(other_user, comment, DOWN)
+    Comment.objects.filter(pk=comment.pk).update(upvotes=9, downvotes=9, vote_score=9)
+    Vote.recount_votes(Comment)
+    comment.refresh_from_db()
+    assert _counters(comment) == (1, 1, 0)
+
+
+@pytest.mark.django_db
+def test_bulk_get_votes(comment, discussion, user):
+    Vote.toggle_vote(user, comment, UP)
+    Vote.toggle_vote(user, discussion, DOWN)
+    votes = Vote.objects.bulk_get_votes(user, [comment, discussion])
+    assert votes == {
+        (ContentType.objects.get_for_model(Comment).pk, comment.pk): UP,
+        (ContentType.objects.get_for_model(Discussion).pk, discussion.pk): DOWN,
+    }
+    assert Vote.objects.bulk_get_votes(user, []) == {}
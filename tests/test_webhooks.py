@@ -0,0 +1,74 @@
+"""
+Tests for webhook lookups, delivery bookkeeping and signatures
+"""
+import hashlib
+import hmac
+
+import pytest
+
+from api.models import Webhook, WebhookDeliveryLog
+
+
+def _webhook(user, name, events, **kwargs):
+    return Webhook.objects.create(
+        user=user, name=name, url='https://example.com/hook', events=events, **kwargs
+    )
+
+
+@pytest.mark.django_db
+def test_webhooks_for(user, json_contains_support):
+    comments = _webhook(user, 'comments', ['comment.created'])
+    everything = _webhook(user, 'everything', ['*'])
+    _webhook(user, 'discussions', ['discussion.created'])
+    _webhook(user, 'inactive', ['comment.created'], is_active=False)
+
+    assert set(Webhook.webhooks_for('comment.created')) == {comments, everything}
+    assert set(Webhook.webhooks_for('mapping.created')) == {everything}
+
+
+@pytest.mark.django_db
+def test_record_batch(user):
+    first = _webhook(user, 'first', ['*'])
+    second = _webhook(user, 'second', ['*'])
+    third = _webhook(user, 'third', ['*'])
+    Webhook.objects.filter(pk=first.pk).update(total_sent=4)
+    payload = {'event': 'comment.created', 'id': 1}
+
+    logs = Webhook.record_batch('comment.created', payload, [
+        (first, True, None),
+        (second, False, 'timeout'),
+        (third, False, None),
+    ])
+
+    assert [log.status for log in logs] == ['success', 'failed', 'failed']
+    assert WebhookDeliveryLog.objects.filter(event_type='comment.created').count() == 3
+    first.refresh_from_db()
+    second.refresh_from_db()
+    third.refresh_from_db()
+    assert (first.total_sent, first.total_failed) == (5, 0)
+    assert first.last_success_at is not None
+    assert (second.total_failed, second.last_failure_reason) == (1, 'timeout')
+    assert (third.total_failed, third.last_failure_reason) == (1, 'Unknown')
+    assert second.last_failure_at == third.last_failure_at
+
+
+@pytest.mark.django_db
+def test_signatures(user):
+    webhook = _webhook(user, 'signed', ['*'])
+    payload = '{"event": "comment.created"}'
+    expected = 'sha256=' + hmac.new(
+        webhook.secret.encode(), payload.encode(), hashlib.sha256
+    ).hexdigest()
+
+    assert webhook.generate_signature(payload) == expected
+    assert webhook.generate_signature(payload.encode()) == expected
+    assert webhook.verify_signature(payload, expected)
+    assert not webhook.verify_signature(payload + ' ', expected)
+
+    # The memoized HMAC must follow a rotated secret
+    webhook.secret = 'rotated'
+    assert not webhook.verify_signature(payload, expected)
+    assert webhook.verify_signature(
+        payload,
+        'sha256=' + hmac.new(b'rotated', payload.encode(), hashlib.sha256).hexdigest(),
+    )